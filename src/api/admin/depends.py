@@ -13,7 +13,12 @@ from apps.users.exceptions.auth import (
 from apps.users.models import UserEntity
 from apps.users.services.auth.jwt_auth.models import BlacklistRefreshToken
 from apps.users.services.storage.base import IUserService
-from config.containers import get_container
+from config import settings
+from config.containers import (
+    Container,
+    get_container,
+)
+from services.jwt_token.cache import VerifiedTokenCache
 from services.jwt_token.exceptions import DecodeJWTError
 
 
@@ -23,14 +28,21 @@ async def get_user_from_token(
     """Возвращает user_id из payload в access токене"""
     token = credentials.credentials
     container = get_container()
-    token_service: BlacklistRefreshToken = container.resolve(
-        BlacklistRefreshToken
-    )
     repository: IUserService = container.resolve(IUserService)
     try:
-        payload = token_service.decode(token)
-        user_id = payload["user"]["id"]
-        return await repository.get_one(id=user_id)
+        payload = _decode(container, token)
+        claim = payload["user"]
+        # в токенах, выданных до появления username в claim,
+        # данных для юзера не хватает, их читаем из БД
+        if settings.jwt_trust_user_claim and "username" in claim:
+            return UserEntity(
+                id=claim["id"],
+                password="",
+                is_superuser=claim["superuser"],
+                is_active=claim["active"],
+                username=claim["username"],
+            )
+        return await repository.get_one(id=claim["id"])
     except DecodeJWTError as e:
         logger.debug("Не удалось декодировать токен: {}", e)
         raise InvalidToken()
@@ -41,13 +53,21 @@ async def is_admin_permission(
 ) -> None:
     token = credentials.credentials
     container = get_container()
-    token_service: BlacklistRefreshToken = container.resolve(
-        BlacklistRefreshToken
-    )
     try:
-        payload = token_service.decode(token)
+        payload = _decode(container, token)
         if not payload["user"]["superuser"]:
             raise UserIsNotAdminError()
     except DecodeJWTError as e:
         logger.debug("Не удалось декодировать токен: {}", e)
         raise InvalidToken()
+
+
+def _decode(container: Container, token: str) -> dict:
+    """
+    Payload токена, подпись проверяется только при первом запросе.
+    """
+    token_service: BlacklistRefreshToken = container.resolve(
+        BlacklistRefreshToken
+    )
+    cache: VerifiedTokenCache = container.resolve(VerifiedTokenCache)
+    return cache.decode(token, token_service.decode)
@@ -61,7 +61,8 @@ async def get_list_question(
         pagination_in.page, pagination_in.limit, search
     )
     result.items = [
-        dataclass_to_schema(QstSchema, item) for item in result.items
+        dataclass_to_schema(QstSchema, item, trusted=True)
+        for item in result.items
     ]
     return result
 
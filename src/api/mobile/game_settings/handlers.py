@@ -1,6 +1,8 @@
 from fastapi import (
     APIRouter,
     Depends,
+    Header,
+    Response,
 )
 from starlette import status
 
@@ -24,13 +26,25 @@ router = APIRouter()
 
 @router.get("/game_settings/", status_code=status.HTTP_200_OK)
 async def get_game_settings(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     cred: MobileAuthorizationCredentials = Depends(http_device),
     container: Container = Depends(get_container),
 ) -> GameSettingsSchema:
-    """Получение настроек игры"""
+    """
+    Получение настроек игры. Если настройки не изменились с прошлого
+    запроса (заголовок If-None-Match), возвращается 304 без тела.
+    """
     permissions: DevicePermissions = container.resolve(DevicePermissions)
     await permissions.has_permission(cred.token)
 
     actions: GameSettingsActions = container.resolve(GameSettingsActions)
-    game_settings = await actions.get_settings()
+    game_settings, etag = await actions.get_settings_with_etag()
+    if if_none_match == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED,
+            headers={"ETag": etag},
+        )
+
+    response.headers["ETag"] = etag
     return dataclass_to_schema(GameSettingsSchema, game_settings)
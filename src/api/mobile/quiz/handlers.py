@@ -3,7 +3,9 @@ from typing import Annotated
 from fastapi import (
     APIRouter,
     Depends,
+    Header,
     Query,
+    Response,
 )
 from starlette import status
 
@@ -14,6 +16,7 @@ from apps.quiz.actions import (
 )
 from apps.quiz.permissions.quiz import DevicePermissions
 from apps.users.permissions.profile import ProfilePermissions
+from config import settings
 from config.containers import (
     Container,
     get_container,
@@ -37,16 +40,30 @@ router = APIRouter()
 @router.get("/get_questions/", status_code=status.HTTP_200_OK)
 async def get_questions(
     limit: Annotated[int, Query(ge=1, le=30)] = 10,
+    profile: int | None = None,
     cred: MobileAuthorizationCredentials = Depends(http_device),
     container: Container = Depends(get_container),
 ) -> list[QuestionSchema]:
-    """Получение выборки вопросов"""
-    permissions: DevicePermissions = container.resolve(DevicePermissions)
-    await permissions.has_permission(cred.token)
+    """
+    Получение выборки вопросов\n\n
+    limit: количество вопросов\n\n
+    profile: id профиля игрока, если передан, то недавно
+    показанные игроку вопросы не повторяются
+    """
+    if profile is None:
+        permissions: DevicePermissions = container.resolve(DevicePermissions)
+        await permissions.has_permission(cred.token)
+    else:
+        profile_permissions: ProfilePermissions = container.resolve(
+            ProfilePermissions
+        )
+        await profile_permissions.has_permission(profile, cred.token)
 
     actions: QuestionsActions = container.resolve(QuestionsActions)
-    questions = await actions.get_random(limit)
-    return [dataclass_to_schema(QuestionSchema, q) for q in questions]
+    questions = await actions.get_random(limit, profile_id=profile)
+    return [
+        dataclass_to_schema(QuestionSchema, q, trusted=True) for q in questions
+    ]
 
 
 @router.post("/complain/", status_code=status.HTTP_204_NO_CONTENT)
@@ -71,17 +88,32 @@ async def create_complaint(
 
 @router.get("/complain/category/", status_code=status.HTTP_200_OK)
 async def category_list(
+    response: Response,
+    if_none_match: str | None = Header(default=None),
     cred: MobileAuthorizationCredentials = Depends(http_device),
     container: Container = Depends(get_container),
 ) -> list[RetrieveCategorySchema]:
-    """Список категорий"""
+    """
+    Список категорий. Если список не изменился с прошлого запроса
+    (заголовок If-None-Match), возвращается 304 без тела.
+    """
     permissions: DevicePermissions = container.resolve(DevicePermissions)
     await permissions.has_permission(cred.token)
 
     action: CategoryComplaintsActions = container.resolve(
         CategoryComplaintsActions
     )
-    categories_list = await action.list()
+    categories_list, etag = await action.list_with_etag()
+    headers = {
+        "ETag": etag,
+        "Cache-Control": f"public, max-age={settings.reference_cache_max_age}",
+    }
+    if if_none_match == etag:
+        return Response(
+            status_code=status.HTTP_304_NOT_MODIFIED, headers=headers
+        )
+
+    response.headers.update(headers)
     return [
         dataclass_to_schema(RetrieveCategorySchema, cat)
         for cat in categories_list
@@ -5,10 +5,13 @@ from typing import (
 )
 
 from api.mobile.depends import get_statistic_model
-from api.pagination import LazyLoad
+from api.pagination import (
+    CursorPaginator,
+    decode_cursor,
+)
 from api.schema import (
+    CursorPaginationResponseSchema,
     PaginationIn,
-    PaginationResponseSchema,
 )
 
 from fastapi import (
@@ -24,7 +27,10 @@ from apps.users.actions import (
     ProfileActions,
     StatisticsActions,
 )
-from apps.users.models import Statistic
+from apps.users.models import (
+    LadderKey,
+    Statistic,
+)
 from apps.users.permissions.profile import ProfilePermissions
 from config.containers import (
     Container,
@@ -36,14 +42,20 @@ from core.security.fingerprint_auth.mobile_auth import (
     http_device,
     MobileAuthorizationCredentials,
 )
-from services.firebase import check_firebase_apikey
+from services.firebase import (
+    check_firebase_apikey,
+    RemoteConfigCache,
+)
 from services.mapper import (
     convert_to_ladder_statistic,
     convert_to_statistic_retrieve_mobile,
     dataclass_to_schema,
 )
 
-from ..utils import get_offset
+from ..utils import (
+    ladder_cursor_key,
+    ladder_position,
+)
 from .schema import (
     ApiKeySchema,
     LadderStatisticRetrieveSchema as LdrSchema,
@@ -64,7 +76,8 @@ async def create_profile(
     container: Container = Depends(get_container),
 ) -> ProfileSchema:
     """Создать профиль игрока"""
-    await check_firebase_apikey(firebase.api_key)
+    remote_config: RemoteConfigCache = container.resolve(RemoteConfigCache)
+    await check_firebase_apikey(firebase.api_key, remote_config)
 
     device: DeviceTokenValidate = container.resolve(DeviceTokenValidate)
     await device.validate(cred)
@@ -125,7 +138,7 @@ async def set_user_statistic(
     composite: CompositeStatisticAction = container.resolve(
         CompositeStatisticAction
     )
-    await composite.patch(
+    await composite.record(
         profile_pk=pk,
         score=stat.score,
         rights=stat.rights,
@@ -159,7 +172,10 @@ async def get_user_statistic(
 @router.get(
     path="/user_statistic/{pk}/ladder/",
     status_code=status.HTTP_200_OK,
-    description="Топ игроков, текущий юзер в середине ладдера",
+    description="Топ игроков, текущий юзер в середине ладдера\n\n"
+    "В ответе paginator:\n\n"
+    "::  next: курсор следующей страницы для /ladder/top/\n\n"
+    "::  previous: курсор предыдущей страницы для /ladder/top/",
 )
 async def get_ladder_profile(
     pk: int,
@@ -167,22 +183,23 @@ async def get_ladder_profile(
     cred: MobileAuthorizationCredentials = Depends(http_device),
     model: Type[Base] = Depends(get_statistic_model),
     container: Container = Depends(get_container),
-) -> PaginationResponseSchema[LdrSchema]:
+) -> CursorPaginationResponseSchema[LdrSchema]:
     permissions: ProfilePermissions = container.resolve(ProfilePermissions)
     await permissions.has_permission(pk, cred.token)
 
     action: StatisticsActions = container.resolve(StatisticsActions[model])
-    # offset рассчитывается, чтобы профиль был в середине
-    offset = await get_offset(action, pk, limit)
-    pagination_in = PaginationIn(limit=limit, offset=offset)
+    pagination_in = PaginationIn(limit=limit)
 
-    paginator = LazyLoad(
+    paginator = CursorPaginator(
         pagination=pagination_in,
         action=action,
+        cursor_key=ladder_cursor_key,
+        position=ladder_position,
     )
-    statistics_page = paginator.paginate(action.get_top_ladder)
+    # страница строится вокруг игрока, без расчета его места
+    statistics_page = paginator.paginate(action.get_ladder_around)
 
-    result = await statistics_page(offset, limit)
+    result = await statistics_page(pk, limit)
     result.items = [
         convert_to_ladder_statistic(item)  # type: ignore
         for item in result.items
@@ -199,30 +216,43 @@ async def get_ladder_profile(
     "offset начинается с 0 и не включается в выборку.\n\n"
     '::  "/?limit=10&offset=0" покажет записи с 1 до 10 включительно\n\n'
     '::  "/?limit=10&offset=10" покажет записи с 11 до 20 включительно.\n\n'
+    "::  cursor: курсор страницы из ответа, если передан, offset "
+    "не учитывается. Любая страница по курсору загружается так же "
+    "быстро, как первая.\n\n"
     "В ответе paginator:\n\n"
     "::  offset: с какой записи запрошены объекты\n\n"
     "::  limit: сколько запрошено объектов\n\n"
-    "::  total: всего объектов",
+    "::  total: всего объектов\n\n"
+    "::  next: курсор следующей страницы или null\n\n"
+    "::  previous: курсор предыдущей страницы или null",
 )
 async def get_ladder(
     pagination_in: PaginationIn = Depends(),
+    cursor: str | None = None,
     cred: MobileAuthorizationCredentials = Depends(http_device),
     model: Type[Base] = Depends(get_statistic_model),
     container: Container = Depends(get_container),
-) -> PaginationResponseSchema[LdrSchema]:
+) -> CursorPaginationResponseSchema[LdrSchema]:
     permissions: DevicePermissions = container.resolve(DevicePermissions)
     await permissions.has_permission(cred.token)
 
     action: StatisticsActions = container.resolve(StatisticsActions[model])
 
-    paginator = LazyLoad(
+    paginator = CursorPaginator(
         pagination=pagination_in,
         action=action,
+        cursor_key=ladder_cursor_key,
+        position=ladder_position,
     )
-    statistics_page = paginator.paginate(action.get_top_ladder)
-    result = await statistics_page(
-        offset=pagination_in.offset, limit=pagination_in.limit
-    )
+    if cursor is None:
+        statistics_page = paginator.paginate(action.get_top_ladder)
+        result = await statistics_page(
+            offset=pagination_in.offset, limit=pagination_in.limit
+        )
+    else:
+        key, backward = decode_cursor(cursor, LadderKey)
+        statistics_page = paginator.paginate(action.get_ladder_page)
+        result = await statistics_page(key, pagination_in.limit, backward)
 
     result.items = [
         convert_to_ladder_statistic(item)  # type: ignore
@@ -1,22 +1,22 @@
-import math
+from dataclasses import asdict
 
-from apps.users.actions import StatisticsActions
-from apps.users.exceptions.statistics import StatisticDoseNotExists
+from apps.users.models import (
+    LadderKey,
+    StatisticEntity,
+)
 
 
-async def get_offset(action: StatisticsActions, pk: int, limit: int) -> int:
+def ladder_cursor_key(statistic: StatisticEntity) -> dict:
     """
-    Функция определяет offset так, чтобы при выгрузке
-    ладдера игрок был в середине
+    Ключ сортировки статистики в ладдере для курсора пагинации.
     """
-    try:
-        user_rank = await action.get_user_rank(pk)
-        offset = (
-            0
-            if math.ceil(limit / 2) > user_rank
-            else user_rank - math.ceil(limit / 2)
-        )
-        return offset
-    except StatisticDoseNotExists:
-        # если статистики игрока нет, возвращает топ ладдера с 1 места
-        return 0
+    return asdict(
+        LadderKey(statistic.score, statistic.games, statistic.profile.id)
+    )
+
+
+def ladder_position(statistic: StatisticEntity) -> int:
+    """
+    Позиция статистики в ладдере, с 0.
+    """
+    return statistic.place - 1
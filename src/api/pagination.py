@@ -1,10 +1,14 @@
+import json
 import math
+import base64
+import asyncio
 from abc import (
     ABC,
     abstractmethod,
 )
 from dataclasses import dataclass
 from typing import (
+    Any,
     Callable,
     Generic,
     ParamSpec,
@@ -12,6 +16,8 @@ from typing import (
 )
 
 from api.schema import (
+    CursorPaginationOut,
+    CursorPaginationResponseSchema,
     PagePaginationIn,
     PagePaginationOut,
     PagePaginationResponseSchema,
@@ -20,6 +26,8 @@ from api.schema import (
     PaginationResponseSchema,
 )
 
+from core.constructor.exceptions import InvalidPaginationCursor
+
 
 TAction = TypeVar("TAction")
 T = TypeVar("T")
@@ -27,6 +35,10 @@ F_Spec = ParamSpec("F_Spec")
 F_Return = TypeVar("F_Return")
 F_Schema = TypeVar("F_Schema")
 
+# поля ключа курсора попадают в запросы к колонкам integer
+CURSOR_INT_MIN = -(2**31)
+CURSOR_INT_MAX = 2**31 - 1
+
 
 @dataclass
 class BasePaginator(ABC):
@@ -48,8 +60,10 @@ class LazyLoad(BasePaginator):
             offset: int,
             limit: int,
         ) -> F_Schema:
-            res = await func(offset, limit)
-            total = await self.action.get_count_statistic()
+            res, total = await asyncio.gather(
+                func(offset, limit),
+                self.action.get_count_statistic(),
+            )
             return PaginationResponseSchema(
                 items=res,
                 paginator=PaginationOut(
@@ -62,6 +76,102 @@ class LazyLoad(BasePaginator):
         return wrapper
 
 
+def encode_cursor(key: dict[str, Any], backward: bool = False) -> str:
+    """
+    Закодировать курсор страницы.
+
+    :param key:         Ключ сортировки крайнего элемента страницы.
+    :param backward:    Курсор на предыдущую страницу.
+    :return:            Непрозрачная для клиента строка.
+    """
+    data = json.dumps(
+        {"key": key, "backward": backward}, separators=(",", ":")
+    )
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, factory: Callable[..., T]) -> tuple[T, bool]:
+    """
+    Раскодировать курсор страницы. Курсор приходит от клиента,
+    поэтому все поля ключа проверяются: это должны быть целые
+    числа в диапазоне integer.
+
+    :param cursor:  Курсор из запроса клиента.
+    :param factory: Конструктор ключа сортировки из полей курсора.
+    :return:        Ключ сортировки и признак курсора на предыдущую страницу.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        data = json.loads(base64.urlsafe_b64decode(padded))
+        key, backward = data["key"], data["backward"]
+        if not isinstance(key, dict) or not isinstance(backward, bool):
+            raise InvalidPaginationCursor()
+        if not all(_is_cursor_int(value) for value in key.values()):
+            raise InvalidPaginationCursor()
+        return factory(**key), backward
+    except (ValueError, KeyError, TypeError):
+        raise InvalidPaginationCursor()
+
+
+def _is_cursor_int(value: Any) -> bool:
+    # bool - подкласс int, но в ключе курсора его быть не может
+    return (
+        isinstance(value, int)
+        and not isinstance(value, bool)
+        and CURSOR_INT_MIN <= value <= CURSOR_INT_MAX
+    )
+
+
+@dataclass
+class CursorPaginator(BasePaginator):
+    """
+    Пагинация по курсору. Курсор хранит ключ сортировки крайнего
+    элемента страницы, поэтому любая страница стоит как первая, а сдвиг
+    элементов между запросами не приводит к пропускам и повторам.
+
+    :param cursor_key:  Ключ сортировки элемента для курсора.
+    :param position:    Позиция элемента в выборке, с 0.
+    """
+
+    pagination: PaginationIn
+    action: TAction
+    cursor_key: Callable[[Any], dict[str, Any]]
+    position: Callable[[Any], int]
+
+    def paginate(
+        self, func: Callable[F_Spec, F_Return]
+    ) -> Callable[F_Spec, F_Schema]:
+        async def wrapper(*args, **kwargs) -> F_Schema:
+            res, total = await asyncio.gather(
+                func(*args, **kwargs),
+                self.action.get_count_statistic(),
+            )
+
+            offset = self.position(res[0]) if res else self.pagination.offset
+            has_next = bool(res) and offset + len(res) < total
+            has_previous = bool(res) and offset > 0
+            return CursorPaginationResponseSchema(
+                items=res,
+                paginator=CursorPaginationOut(
+                    offset=offset,
+                    limit=self.pagination.limit,
+                    total=total,
+                    next=(
+                        encode_cursor(self.cursor_key(res[-1]))
+                        if has_next
+                        else None
+                    ),
+                    previous=(
+                        encode_cursor(self.cursor_key(res[0]), backward=True)
+                        if has_previous
+                        else None
+                    ),
+                ),
+            )
+
+        return wrapper
+
+
 @dataclass
 class PagePaginator(BasePaginator, Generic[F_Schema]):
     pagination: PagePaginationIn
@@ -71,9 +181,10 @@ class PagePaginator(BasePaginator, Generic[F_Schema]):
         self, func: Callable[F_Spec, F_Return]
     ) -> Callable[F_Spec, F_Schema]:
         async def wrapper(page: int, limit: int, *args, **kwargs) -> F_Schema:
-            res = await func(page, limit, *args, **kwargs)
-
-            count = await self.action.get_count(*args, **kwargs)
+            res, count = await asyncio.gather(
+                func(page, limit, *args, **kwargs),
+                self.action.get_count(*args, **kwargs),
+            )
             total = math.ceil(count / limit)
 
             return PagePaginationResponseSchema(
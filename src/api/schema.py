@@ -26,6 +26,16 @@ class PaginationResponseSchema(BaseModel, Generic[T]):
     paginator: PaginationOut
 
 
+class CursorPaginationOut(PaginationOut):
+    next: str | None = None
+    previous: str | None = None
+
+
+class CursorPaginationResponseSchema(BaseModel, Generic[T]):
+    items: list[T]
+    paginator: CursorPaginationOut
+
+
 class PagePaginationIn(BaseModel):
     page: int = Field(default=1, ge=1)
     limit: int = Field(default=100, ge=1, le=200)
@@ -1,12 +1,16 @@
 from dataclasses import dataclass
 
 from apps.game_settings.models import GameSettingsEntity
+from apps.game_settings.services.cache import IGameSettingsCache
 from apps.game_settings.services.storage.base import IGameSettingsService
+from core.database.db import Transaction
 
 
 @dataclass
 class GameSettingsActions:
     __repository: IGameSettingsService
+    __cache: IGameSettingsCache
+    transaction: Transaction
 
     async def get_settings(self) -> GameSettingsEntity:
         """
@@ -14,7 +18,16 @@ class GameSettingsActions:
 
         :return: Настройки.
         """
-        return await self.__repository.get_one()
+        game_settings, _ = await self.get_settings_with_etag()
+        return game_settings
+
+    async def get_settings_with_etag(self) -> tuple[GameSettingsEntity, str]:
+        """
+        Получить настройки игры вместе с их ETag.
+
+        :return: Кортеж из настроек и ETag.
+        """
+        return await self.__cache.get_or_load(self.__repository.get_one)
 
     async def edit_settings(self, **fields) -> GameSettingsEntity:
         """
@@ -27,4 +40,7 @@ class GameSettingsActions:
                         recovery_value, right_ratio, wrong_ratio.
         :return:        Настройки.
         """
-        return await self.__repository.update(**fields)
+        game_settings = await self.__repository.update(**fields)
+        # иначе воркеры могут перечитать еще старые настройки
+        await self.transaction.on_commit(self.__cache.invalidate)
+        return game_settings
@@ -0,0 +1,8 @@
+from .base import IGameSettingsCache
+from .cache import RedisGameSettingsCache
+
+
+__all__ = (
+    "IGameSettingsCache",
+    "RedisGameSettingsCache",
+)
@@ -0,0 +1,53 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from apps.game_settings.models import GameSettingsEntity
+
+
+SettingsLoader = Callable[[], Awaitable[GameSettingsEntity]]
+
+
+@dataclass
+class IGameSettingsCache(ABC):
+    """
+    Кеш настроек игры. Вместе с настройками хранится их ETag,
+    чтобы клиент мог не скачивать неизменившиеся настройки.
+    """
+
+    @abstractmethod
+    async def get_or_load(
+        self, loader: SettingsLoader
+    ) -> tuple[GameSettingsEntity, str]:
+        """
+        Получить настройки из кеша, при промахе загрузить их.
+
+        :param loader:  Корутина, возвращающая настройки из БД.
+        :return:        Кортеж из настроек и их ETag.
+        """
+
+    @abstractmethod
+    async def invalidate(self) -> None:
+        """
+        Сбросить настройки во всех процессах приложения.
+
+        :return:    None.
+        """
+
+    @abstractmethod
+    def start(self) -> None:
+        """
+        Начать получать сбросы кеша из других процессов.
+        """
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """
+        Перестать получать сбросы кеша из других процессов.
+        """
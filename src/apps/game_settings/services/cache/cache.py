@@ -0,0 +1,104 @@
+import json
+import time
+import asyncio
+import hashlib
+from contextlib import suppress
+from dataclasses import (
+    asdict,
+    dataclass,
+    field,
+)
+
+from loguru import logger
+
+from apps.game_settings.models import GameSettingsEntity
+from apps.game_settings.services.cache.base import (
+    IGameSettingsCache,
+    SettingsLoader,
+)
+from services.redis_pool import RedisPool
+
+
+CHANNEL = "game_settings:invalidate"
+
+
+@dataclass
+class RedisGameSettingsCache(IGameSettingsCache):
+    """
+    Настройки игры в памяти процесса. При изменении настроек
+    в канал Redis публикуется сообщение, и каждый воркер,
+    подписанный на канал, сбрасывает свою копию. Если сообщение
+    потерялось, настройки перечитаются по истечении ttl.
+    ETag считается по содержимому настроек, поэтому у всех
+    воркеров он одинаковый.
+
+    :param storage: Подключение к Redis.
+    :param ttl:     Сколько секунд хранятся настройки.
+    """
+
+    storage: RedisPool
+    ttl: float
+    _settings: tuple[GameSettingsEntity, str] | None = field(
+        init=False, default=None
+    )
+    _expire_at: float = field(init=False, default=0.0)
+    # растет при каждом сбросе, чтобы не сохранить настройки,
+    # прочитанные до сброса
+    _generation: int = field(init=False, default=0)
+    _task: asyncio.Task | None = field(init=False, default=None)
+
+    async def get_or_load(
+        self, loader: SettingsLoader
+    ) -> tuple[GameSettingsEntity, str]:
+        if self._settings is not None and time.monotonic() < self._expire_at:
+            return self._settings
+
+        generation = self._generation
+        game_settings = await loader()
+        cached = (game_settings, self._etag(game_settings))
+        if generation == self._generation:
+            self._settings = cached
+            self._expire_at = time.monotonic() + self.ttl
+        return cached
+
+    async def invalidate(self) -> None:
+        self._reset()
+        conn = await self.storage.connect()
+        await conn.publish(CHANNEL, "1")
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                conn = await self.storage.connect()
+                async with conn.pubsub() as pubsub:
+                    await pubsub.subscribe(CHANNEL)
+                    # пока не было подписки, сбросы могли потеряться
+                    self._reset()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            self._reset()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Потеряна подписка на сброс настроек игры")
+                await asyncio.sleep(1)
+
+    def _reset(self) -> None:
+        self._settings = None
+        self._generation += 1
+
+    @staticmethod
+    def _etag(game_settings: GameSettingsEntity) -> str:
+        payload = json.dumps(asdict(game_settings), sort_keys=True)
+        digest = hashlib.blake2b(payload.encode(), digest_size=8)
+        return f'"{digest.hexdigest()}"'
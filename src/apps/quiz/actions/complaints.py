@@ -1,4 +1,6 @@
+import builtins
 from dataclasses import dataclass
+from functools import partial
 
 from apps.quiz.exceptions import (
     CategoryComplaintDoesNotExists,
@@ -15,6 +17,8 @@ from apps.quiz.services.storage.base import (
 )
 from apps.users.exceptions.profile import DoesNotExistsProfile
 from apps.users.services.storage.base import IProfileService
+from core.database.db import Transaction
+from services.count_cache import ICountCache
 
 
 @dataclass
@@ -23,6 +27,8 @@ class ComplaintsActions:
     __profile_repository: IProfileService
     __question_repository: IQuestionService
     __category_repository: ICategoryComplaintService
+    __counts: ICountCache
+    transaction: Transaction
 
     async def create(
         self,
@@ -59,6 +65,9 @@ class ComplaintsActions:
             profile_id=profile_id,
             category_id=category_id,
         )
+        await self.transaction.on_commit(
+            partial(self.__counts.invalidate, "complaints")
+        )
         return complaint
 
     async def get_list(
@@ -82,7 +91,11 @@ class ComplaintsActions:
 
         :return: Число жалоб.
         """
-        return await self.__complaint_repository.get_count()
+        return await self.__counts.get_or_count(
+            "complaints",
+            self.__complaint_repository.get_count,
+            estimator=self.__complaint_repository.get_estimated_count,
+        )
 
     async def delete_complaint(self, pk: int) -> None:
         """
@@ -92,6 +105,9 @@ class ComplaintsActions:
         :return:    None.
         """
         await self.__complaint_repository.delete(pk)
+        await self.transaction.on_commit(
+            partial(self.__counts.invalidate, "complaints")
+        )
 
 
 @dataclass
@@ -105,3 +121,13 @@ class CategoryComplaintsActions:
         :return: Список жалоб.
         """
         return await self.__category_repository.get_list()
+
+    async def list_with_etag(
+        self,
+    ) -> tuple[builtins.list[CategoryComplaintEntity], str]:
+        """
+        Получить список категорий жалоб вместе с его ETag.
+
+        :return: Кортеж из списка категорий и ETag.
+        """
+        return await self.__category_repository.get_list_with_etag()
@@ -1,5 +1,6 @@
 import copy
 from dataclasses import dataclass
+from functools import partial
 from typing import Any
 
 from apps.quiz.exceptions import QuestionDoesNotExists
@@ -8,12 +9,20 @@ from apps.quiz.models import (
     QuestionAdminDTO,
     QuestionEntity,
 )
+from apps.quiz.services.deck.base import IQuestionDeck
+from apps.quiz.services.seen.base import IQuestionSeenService
 from apps.quiz.services.storage.base import (
     IAnswerService,
     IQuestionService,
 )
 from apps.quiz.validator.answers import AnswerListValidator
 from core.database.db import Transaction
+from services.count_cache import ICountCache
+
+
+# во сколько раз больше кандидатов берется из колоды,
+# чтобы после отсева показанных вопросов хватило на раунд
+SEEN_OVERSAMPLE = 3
 
 
 @dataclass
@@ -21,16 +30,44 @@ class QuestionsActions:
     __repository: IQuestionService
     __answer_repository: IAnswerService
     __answer_validator: AnswerListValidator
+    __deck: IQuestionDeck
+    __seen: IQuestionSeenService
+    __counts: ICountCache
     transaction: Transaction
 
-    async def get_random(self, limit: int) -> list[QuestionEntity]:
+    async def get_random(
+        self, limit: int, profile_id: int | None = None
+    ) -> list[QuestionEntity]:
         """
-        Получить случайные вопросы.
+        Получить случайные вопросы. Если передан профиль, то недавно
+        показанные ему вопросы не повторяются. Когда профиль видел почти
+        все вопросы, история показов сбрасывается и начинается новый круг.
 
-        :param limit:   Кол-во вопросов.
-        :return:        Список вопросов.
+        :param limit:       Кол-во вопросов.
+        :param profile_id:  ID профиля, которому выдаются вопросы.
+        :return:            Список вопросов.
         """
-        return await self.__repository.get_random(limit)
+        await self.__deck.actualize(self.__repository.get_published)
+        if profile_id is None:
+            return await self.__deck.sample(limit)
+
+        candidates = await self.__deck.sample(limit * SEEN_OVERSAMPLE)
+        unseen_ids = set(
+            await self.__seen.filter_unseen(
+                profile_id, [q.id for q in candidates]
+            )
+        )
+        # в колоде может быть меньше вопросов, чем запрошено
+        wanted = min(limit, len(candidates))
+        questions = [q for q in candidates if q.id in unseen_ids][:wanted]
+
+        if len(questions) < wanted:
+            await self.__seen.reset(profile_id)
+            seen = [q for q in candidates if q.id not in unseen_ids]
+            questions.extend(seen[: wanted - len(questions)])
+
+        await self.__seen.mark_seen(profile_id, [q.id for q in questions])
+        return questions
 
     async def get_by_id(self, pk: int) -> QuestionEntity:
         """
@@ -92,7 +129,12 @@ class QuestionsActions:
         :param search:  Поиск вопросов по тексту вопроса.
         :return:        Число вопросов.
         """
-        return await self.__repository.get_count(search)
+        return await self.__counts.get_or_count(
+            "questions",
+            lambda: self.__repository.get_count(search),
+            key=search,
+            estimator=self.__repository.get_estimated_count,
+        )
 
     async def delete_question(self, pk: int) -> None:
         """
@@ -102,6 +144,8 @@ class QuestionsActions:
         :return:    None.
         """
         await self.__repository.delete(pk)
+        await self.transaction.on_commit(partial(self.__deck.remove, pk))
+        await self._invalidate_count()
 
     async def create_question_with_answers(
         self,
@@ -127,12 +171,15 @@ class QuestionsActions:
             for answer in answers_data:
                 answer["question_id"] = question.id
             answers = await self.__answer_repository.bulk_create(answers_data)
-            return QuestionAdminDTO(
+            question_dto = QuestionAdminDTO(
                 id=question.id,
                 text=question.text,
                 published=question.published,
                 answers=[answer for answer in answers],
             )
+            await self._put_to_deck(question_dto)
+            await self._invalidate_count()
+        return question_dto
 
     async def update_question_with_answers(
         self,
@@ -156,13 +203,15 @@ class QuestionsActions:
                 published=data["published"],
             )
             await self.__answer_repository.bulk_update(answer_dict)
-            return QuestionAdminDTO(
+            question_dto = QuestionAdminDTO(
                 id=question.id,
                 text=question.text,
                 published=question.published,
                 complaints=data["complaints"],
                 answers=[AnswerEntity(**answer) for answer in answer_dict],
             )
+            await self._put_to_deck(question_dto)
+        return question_dto
 
     async def bulk_create_question_with_answers(
         self,
@@ -200,3 +249,36 @@ class QuestionsActions:
             answers_data.extend(answer_data)
 
         await self.__answer_repository.bulk_create(answers_data)
+        # ответы созданы без привязки к вопросам в сущностях,
+        # поэтому проще перечитать колоду целиком
+        await self.transaction.on_commit(self.__deck.invalidate)
+        await self._invalidate_count()
+
+    async def _put_to_deck(self, question: QuestionAdminDTO) -> None:
+        """
+        Обновить вопрос в колоде случайных вопросов после коммита.
+
+        :param question:    Вопрос с ответами.
+        :return:            None.
+        """
+        await self.transaction.on_commit(
+            partial(
+                self.__deck.put,
+                QuestionEntity(
+                    id=question.id,
+                    text=question.text,
+                    published=question.published,
+                    answers=question.answers,
+                ),
+            )
+        )
+
+    async def _invalidate_count(self) -> None:
+        """
+        Сбросить кеш числа вопросов после коммита.
+
+        :return:    None.
+        """
+        await self.transaction.on_commit(
+            partial(self.__counts.invalidate, "questions")
+        )
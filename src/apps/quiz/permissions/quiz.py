@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 
+from apps.users.services.devices import IDeviceCache
 from apps.users.services.storage import IProfileService
 from core.constructor.permissions import BasePermission
 from core.security.fingerprint_auth.exceptions import UnauthorizedDevice
@@ -8,7 +9,11 @@ from core.security.fingerprint_auth.exceptions import UnauthorizedDevice
 @dataclass(frozen=True, eq=False)
 class DevicePermissions(BasePermission):
     repository: IProfileService
+    devices: IDeviceCache
 
     async def has_permission(self, token: str) -> None:
-        if not await self.repository.exists(device_uuid=token):
+        profile_id = await self.devices.get_or_load(
+            token, lambda: self.repository.get_id_by_device(token)
+        )
+        if profile_id is None:
             raise UnauthorizedDevice()
@@ -0,0 +1,66 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from apps.quiz.models import QuestionEntity
+
+
+QuestionLoader = Callable[[], Awaitable[list[QuestionEntity]]]
+
+
+@dataclass
+class IQuestionDeck(ABC):
+    """
+    Колода опубликованных вопросов вместе с ответами. Из колоды
+    выдаются случайные вопросы для раунда без обращения к БД.
+    """
+
+    @abstractmethod
+    async def actualize(self, loader: QuestionLoader) -> None:
+        """
+        Загрузить колоду, если она еще не загружена или устарела.
+
+        :param loader:  Корутина, возвращающая все опубликованные вопросы.
+        :return:        None.
+        """
+
+    @abstractmethod
+    async def sample(self, limit: int) -> list[QuestionEntity]:
+        """
+        Получить случайные вопросы из колоды. Ответы вопросов перемешаны.
+
+        :param limit:   Сколько вопросов получить.
+        :return:        Список вопросов, не больше limit.
+        """
+
+    @abstractmethod
+    async def put(self, question: QuestionEntity) -> None:
+        """
+        Добавить или обновить вопрос в колоде. Неопубликованный
+        вопрос из колоды убирается.
+
+        :param question:    Вопрос вместе с ответами.
+        :return:            None.
+        """
+
+    @abstractmethod
+    async def remove(self, pk: int) -> None:
+        """
+        Убрать вопрос из колоды.
+
+        :param pk:  ID вопроса.
+        :return:    None.
+        """
+
+    @abstractmethod
+    async def invalidate(self) -> None:
+        """
+        Пометить колоду устаревшей, при следующей
+        выборке она будет перезагружена.
+        """
@@ -0,0 +1,97 @@
+import time
+import random
+import asyncio
+from dataclasses import (
+    dataclass,
+    field,
+    replace,
+)
+
+from apps.quiz.models import QuestionEntity
+from apps.quiz.services.deck.base import (
+    IQuestionDeck,
+    QuestionLoader,
+)
+
+
+@dataclass
+class MemoryQuestionDeck(IQuestionDeck):
+    """
+    Колода вопросов в памяти процесса. Id вопросов хранятся в массиве,
+    поэтому выборка limit вопросов стоит O(limit). Изменения вопросов
+    через админку применяются к колоде сразу, но только в том процессе,
+    который обработал запрос. Остальные воркеры увидят изменения после
+    перезагрузки колоды по истечении ttl.
+
+    :param ttl: Через сколько секунд колода перечитывается из БД.
+    """
+
+    ttl: int
+    _questions: dict[int, QuestionEntity] = field(
+        init=False, default_factory=dict
+    )
+    _ids: list[int] = field(init=False, default_factory=list)
+    # позиция id вопроса в массиве _ids, для удаления за O(1)
+    _positions: dict[int, int] = field(init=False, default_factory=dict)
+    _loaded: bool = field(init=False, default=False)
+    _expire_at: float = field(init=False, default=0.0)
+    _lock: asyncio.Lock = field(init=False, default_factory=asyncio.Lock)
+
+    async def actualize(self, loader: QuestionLoader) -> None:
+        if self._is_fresh():
+            return
+        # устаревшая колода уже перезагружается другим запросом,
+        # пока отдаем вопросы из текущей
+        if self._loaded and self._lock.locked():
+            return
+
+        async with self._lock:
+            if self._is_fresh():
+                return
+            self._rebuild(await loader())
+
+    async def sample(self, limit: int) -> list[QuestionEntity]:
+        ids = random.sample(self._ids, min(limit, len(self._ids)))
+        return [self._shuffled(self._questions[pk]) for pk in ids]
+
+    async def put(self, question: QuestionEntity) -> None:
+        if not question.published:
+            await self.remove(question.id)
+            return
+
+        if question.id not in self._positions:
+            self._positions[question.id] = len(self._ids)
+            self._ids.append(question.id)
+        self._questions[question.id] = question
+
+    async def remove(self, pk: int) -> None:
+        position = self._positions.pop(pk, None)
+        if position is None:
+            return
+
+        # на место удаляемого id ставим последний, чтобы не сдвигать массив
+        last_pk = self._ids.pop()
+        if last_pk != pk:
+            self._ids[position] = last_pk
+            self._positions[last_pk] = position
+        del self._questions[pk]
+
+    async def invalidate(self) -> None:
+        self._expire_at = 0.0
+
+    def _is_fresh(self) -> bool:
+        return self._loaded and time.monotonic() < self._expire_at
+
+    def _rebuild(self, questions: list[QuestionEntity]) -> None:
+        self._questions = {q.id: q for q in questions if q.published}
+        self._ids = list(self._questions.keys())
+        self._positions = {pk: i for i, pk in enumerate(self._ids)}
+        self._loaded = True
+        self._expire_at = time.monotonic() + self.ttl
+
+    @staticmethod
+    def _shuffled(question: QuestionEntity) -> QuestionEntity:
+        return replace(
+            question,
+            answers=random.sample(question.answers, len(question.answers)),
+        )
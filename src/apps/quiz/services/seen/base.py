@@ -0,0 +1,46 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+
+
+@dataclass
+class IQuestionSeenService(ABC):
+    """
+    Хранилище вопросов, недавно показанных профилю.
+    Используется, чтобы не выдавать игроку повторные вопросы.
+    """
+
+    @abstractmethod
+    async def filter_unseen(
+        self, profile_id: int, question_ids: list[int]
+    ) -> list[int]:
+        """
+        Отобрать вопросы, которые профиль еще не видел.
+
+        :param profile_id:      ID профиля.
+        :param question_ids:    ID вопросов-кандидатов.
+        :return:                ID не показанных вопросов в исходном порядке.
+        """
+
+    @abstractmethod
+    async def mark_seen(
+        self, profile_id: int, question_ids: list[int]
+    ) -> None:
+        """
+        Отметить вопросы показанными профилю.
+
+        :param profile_id:      ID профиля.
+        :param question_ids:    ID показанных вопросов.
+        :return:                None.
+        """
+
+    @abstractmethod
+    async def reset(self, profile_id: int) -> None:
+        """
+        Забыть все показанные профилю вопросы.
+
+        :param profile_id:  ID профиля.
+        :return:            None.
+        """
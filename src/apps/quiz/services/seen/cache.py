@@ -0,0 +1,96 @@
+import time
+import hashlib
+from dataclasses import dataclass
+
+from apps.quiz.services.seen.base import IQuestionSeenService
+from services.redis_pool import RedisPool
+
+
+@dataclass
+class RedisQuestionSeenService(IQuestionSeenService):
+    """
+    Показанные вопросы хранятся в Redis в скользящем фильтре Блума
+    фиксированного размера. Фильтр состоит из двух поколений: текущее
+    и предыдущее, поколение меняется раз в period секунд, поэтому
+    вопрос считается показанным от period до 2 * period секунд.
+    На профиль приходится не больше 2 * bits / 8 байт памяти, ключи
+    неактивных профилей удаляются по истечении срока хранения.
+
+    :param storage: Подключение к Redis.
+    :param period:  Длительность поколения фильтра, секунды.
+    :param bits:    Размер фильтра одного поколения, бит.
+    :param hashes:  Число хеш-функций фильтра.
+    """
+
+    storage: RedisPool
+    period: int
+    bits: int
+    hashes: int
+
+    async def filter_unseen(
+        self, profile_id: int, question_ids: list[int]
+    ) -> list[int]:
+        if not question_ids:
+            return []
+
+        keys = self._keys(profile_id)
+        conn = await self.storage.connect()
+        async with conn.pipeline(transaction=False) as pipe:
+            for question_id in question_ids:
+                offsets = self._offsets(question_id)
+                for key in keys:
+                    for offset in offsets:
+                        pipe.getbit(key, offset)
+            bits = iter(await pipe.execute())
+
+        unseen = []
+        for question_id in question_ids:
+            # вопрос показан, если в каком-либо из поколений
+            # фильтра выставлены все его биты
+            seen = False
+            for _ in keys:
+                key_bits = [next(bits) for _ in range(self.hashes)]
+                seen = seen or all(key_bits)
+            if not seen:
+                unseen.append(question_id)
+        return unseen
+
+    async def mark_seen(
+        self, profile_id: int, question_ids: list[int]
+    ) -> None:
+        if not question_ids:
+            return
+
+        current_key, _ = self._keys(profile_id)
+        conn = await self.storage.connect()
+        async with conn.pipeline(transaction=False) as pipe:
+            for question_id in question_ids:
+                for offset in self._offsets(question_id):
+                    pipe.setbit(current_key, offset, 1)
+            pipe.expire(current_key, 2 * self.period)
+            await pipe.execute()
+
+    async def reset(self, profile_id: int) -> None:
+        conn = await self.storage.connect()
+        await conn.delete(*self._keys(profile_id))
+
+    def _keys(self, profile_id: int) -> tuple[str, str]:
+        """
+        Ключи текущего и предыдущего поколения фильтра профиля.
+        """
+        generation = int(time.time()) // self.period
+        return (
+            f"seen_questions:{profile_id}:{generation}",
+            f"seen_questions:{profile_id}:{generation - 1}",
+        )
+
+    def _offsets(self, question_id: int) -> list[int]:
+        """
+        Номера битов вопроса в фильтре, двойное хеширование.
+        """
+        digest = hashlib.blake2b(
+            str(question_id).encode(), digest_size=8
+        ).digest()
+        h1 = int.from_bytes(digest[:4], "big")
+        h2 = int.from_bytes(digest[4:], "big") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
@@ -11,17 +11,19 @@ from apps.quiz.models import (
     ComplaintEntity,
     QuestionEntity,
 )
-from core.database.repository.base import IRepository
+from core.database.repository.base import (
+    IReferenceRepository,
+    IRepository,
+)
 
 
 @dataclass
 class IQuestionService(IRepository, ABC):
     @abstractmethod
-    async def get_random(self, limit: int) -> list[QuestionEntity]:
+    async def get_published(self) -> list[QuestionEntity]:
         """
-        Получить случайные вопросы.
+        Получить все опубликованные вопросы вместе с ответами.
 
-        :param limit:   Сколько вопросов получить.
         :return:        Список вопросов.
         """
 
@@ -183,7 +185,7 @@ class IComplaintService(IRepository, ABC):
 
 
 @dataclass
-class ICategoryComplaintService(IRepository, ABC):
+class ICategoryComplaintService(IReferenceRepository, ABC):
     @overload
     async def get_list(self) -> list[CategoryComplaintEntity]:  # noqa
         """
@@ -191,3 +193,13 @@ class ICategoryComplaintService(IRepository, ABC):
 
         :return: Список категорий.
         """
+
+    @overload
+    async def get_list_with_etag(  # noqa
+        self,
+    ) -> tuple[list[CategoryComplaintEntity], str]:
+        """
+        Получить список категорий жалоб вместе с его ETag.
+
+        :return: Кортеж из списка категорий и ETag.
+        """
@@ -8,6 +8,7 @@ from apps.quiz.services.storage.base import (
     ICategoryComplaintService,
     IComplaintService,
 )
+from core.database.repository.reference import ReferenceRepository
 from core.database.repository.sqla import CommonRepository
 
 
@@ -34,7 +35,9 @@ class ORMComplaintService(CommonRepository, IComplaintService):
 
 
 @dataclass
-class ORMCategoryComplaintService(CommonRepository, ICategoryComplaintService):
+class ORMCategoryComplaintService(
+    ReferenceRepository, ICategoryComplaintService
+):
     pass
 
 
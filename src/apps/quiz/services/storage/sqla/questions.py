@@ -1,4 +1,4 @@
-import random as python_random
+from collections import defaultdict
 from dataclasses import dataclass
 
 from loguru import logger
@@ -6,53 +6,55 @@ from loguru import logger
 from sqlalchemy import (
     insert,
     select,
-    tablesample,
     true,
 )
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import (
-    aliased,
     joinedload,
     selectinload,
 )
-from sqlalchemy.sql.functions import (
-    func,
-    random,
-)
+from sqlalchemy.sql.functions import func
 from sqlalchemy.sql.selectable import Select
 
 from apps.quiz.exceptions.question import QuestionIntegrityError
 from apps.quiz.models import (
+    Answer,
+    AnswerEntity,
     Complaint,
+    Question,
     QuestionEntity,
 )
 from apps.quiz.services.storage.base import IQuestionService
+from core.database.mapper import EntityMapper
 from core.database.repository.sqla import CommonRepository
 
 
+QUESTION_MAPPER = EntityMapper(
+    QuestionEntity,
+    id=Question.id,
+    text=Question.text,
+    published=Question.published,
+)
+ANSWER_MAPPER = EntityMapper(
+    AnswerEntity,
+    id=Answer.id,
+    text=Answer.text,
+    right=Answer.right,
+)
+
+
 @dataclass
 class ORMQuestionsService(CommonRepository, IQuestionService):
-    async def get_random(self, limit: int) -> list[QuestionEntity]:
+    async def get_published(self) -> list[QuestionEntity]:
         async with self._db.get_ro_session() as session:
-            q = aliased(
-                self.model, tablesample(self.model, func.bernoulli(0.2))
-            )
-            query = (
-                select(
-                    q,
-                )
-                .filter(q.published == true())
-                .order_by(random())
-                .limit(limit)
-                .options(selectinload(q.answers))
+            query = QUESTION_MAPPER.select().filter(
+                self.model.published == true()
             )
             result = await session.execute(query)
-            questions = result.scalars().all()
-            for question in questions:
-                question.answers = sorted(
-                    question.answers, key=lambda x: python_random.random()
-                )
-            return [q.to_entity() for q in questions]
+            questions = QUESTION_MAPPER.map_all(result.all())
+            await self._load_answers(session, questions)
+            return questions
 
     async def get_one(self, **filter_by) -> QuestionEntity | None:
         async with self._db.get_ro_session() as session:
@@ -99,14 +101,21 @@ class ORMQuestionsService(CommonRepository, IQuestionService):
         search: str | None = None,
     ) -> list[tuple[QuestionEntity, int]]:
         async with self._db.get_ro_session() as session:
-            query = self._select_complaints_count().offset(offset).limit(limit)
+            query = (
+                QUESTION_MAPPER.select(self._complaints_count())
+                .offset(offset)
+                .limit(limit)
+            )
 
             if search is not None:
                 query = query.filter(self.model.text.ilike(f"%{search}%"))
 
             result = await session.execute(query)
-            questions = result.fetchall()
-            return [(q.to_entity(), c) for q, c in questions]
+            rows = result.all()
+            questions = QUESTION_MAPPER.map_all(rows)
+            await self._load_answers(session, questions)
+            # количество жалоб идет в строке последней колонкой
+            return [(q, row[-1]) for q, row in zip(questions, rows)]
 
     async def get_count(self, search: str | None = None) -> int:
         async with self._db.get_ro_session() as session:
@@ -135,6 +144,36 @@ class ORMQuestionsService(CommonRepository, IQuestionService):
             )
             raise QuestionIntegrityError()
 
+    @staticmethod
+    async def _load_answers(
+        session: AsyncSession, questions: list[QuestionEntity]
+    ) -> None:
+        """
+        Загрузить ответы вопросов одним запросом, как selectinload.
+        """
+        if not questions:
+            return
+
+        query = ANSWER_MAPPER.select(Answer.question_id).where(
+            Answer.question_id.in_([q.id for q in questions])
+        )
+        result = await session.execute(query)
+        answers = defaultdict(list)
+        for row in result.all():
+            answers[row[-1]].append(ANSWER_MAPPER.convert(row))
+        for question in questions:
+            question.answers = answers[question.id]
+
+    def _complaints_count(self):
+        """
+        Количество жалоб на вопрос, коррелированный подзапрос.
+        """
+        return (
+            select(func.count(Complaint.id))
+            .where(Complaint.question_id == self.model.id)
+            .scalar_subquery()
+        )
+
     def _select_complaints_count(self) -> Select:
         subquery = (
             select(
@@ -1,15 +1,22 @@
 from dataclasses import dataclass
+from functools import partial
 
 from apps.users.exceptions.profile import DoesNotExistsProfile
 from apps.users.models import ProfileEntity
+from apps.users.services.devices import IDeviceCache
 from apps.users.services.storage import IProfileService
 from apps.users.validator.profile import ProfileValidator
+from core.database.db import Transaction
+from services.count_cache import ICountCache
 
 
 @dataclass
 class ProfileActions:
     __profile_repository: IProfileService
+    __counts: ICountCache
+    __devices: IDeviceCache
     validator: ProfileValidator
+    transaction: Transaction
 
     async def create(self, device_uuid: str) -> ProfileEntity:
         """
@@ -26,7 +33,14 @@ class ProfileActions:
 
         name = f"Игрок-{profile_pk}"
         #  присваиваем профилю новое имя
-        return await self.__profile_repository.update(profile_pk, name=name)
+        profile = await self.__profile_repository.update(profile_pk, name=name)
+        await self.transaction.on_commit(
+            partial(self.__counts.invalidate, "profiles")
+        )
+        await self.transaction.on_commit(
+            partial(self.__devices.invalidate, device_uuid)
+        )
+        return profile
 
     async def get_profile(self, **filter_by) -> ProfileEntity:
         """
@@ -88,7 +102,12 @@ class ProfileActions:
         :param search:  Условие поиска профилей, поиск ведется по имени.
         :return:        Кол-во профилей.
         """
-        return await self.__profile_repository.get_count(search)
+        return await self.__counts.get_or_count(
+            "profiles",
+            lambda: self.__profile_repository.get_count(search),
+            key=search,
+            estimator=self.__profile_repository.get_estimated_count,
+        )
 
     async def reset_name(self, pk: int) -> tuple[ProfileEntity, int]:
         """
@@ -1,16 +1,26 @@
+import math
 from dataclasses import dataclass
 from typing import (
     Generic,
     TypeVar,
 )
 
+from loguru import logger
+
 from apps.users.exceptions.profile import DoesNotExistsProfile
-from apps.users.exceptions.statistics import StatisticDoseNotExists
+from apps.users.exceptions.statistics import (
+    StatisticDoseNotExists,
+    StatisticIntegrityError,
+)
 from apps.users.models import (
     BestPlayerTitleEntity,
+    LadderKey,
     PeriodStatistic,
+    RoundsEntity,
     StatisticEntity,
 )
+from apps.users.services.ranking import IRankingService
+from apps.users.services.rounds.base import IRoundQueue
 from apps.users.services.storage import (
     IProfileService,
     IStatisticService,
@@ -27,24 +37,10 @@ class StatisticsActions(Generic[T]):
     __profile_repository: IProfileService
     __repository: IStatisticService[T]
     __title_repository: IProfileTitleService
+    __ranking: IRankingService[T]
+    __queue: IRoundQueue
     transaction: Transaction
 
-    async def _create(self, profile_id: int) -> StatisticEntity:
-        """
-        Создать статистику игрока. Статистика размещается с 0 параметрами
-        на последнее место среди игроков с неотрицательными очками.
-
-        :param profile_id:  ID профиля.
-        :return:            Статистика.
-        """
-        count = await self.__repository.get_count_positive_score()
-        place = count + 1
-        statistic = await self.__repository.create(
-            profile_id=profile_id, place=place
-        )
-        await self.__repository.down_place_negative_score()
-        return statistic
-
     async def patch(
         self,
         profile_pk: int,
@@ -54,8 +50,9 @@ class StatisticsActions(Generic[T]):
         perfect_round: bool,
     ) -> None:
         """
-        Обновить статистику после раунда. Сценарий перемещает всех затронутых
-        игроков на свои места в соответствии с набранными очками и играми.
+        Обновить статистику после раунда. Новая статистика создается
+        с 0 параметрами, затем игрок перемещается на свое место
+        в соответствии с набранными очками и играми.
 
         :param profile_pk:      ID профиля.
         :param score:           Набрано очков.
@@ -70,9 +67,8 @@ class StatisticsActions(Generic[T]):
         statistic = await self.__repository.get_one(profile_id=profile_pk)
 
         if statistic is None:
-            statistic = await self._create(profile_id=profile_pk)
+            statistic = await self.__ranking.insert(profile_id=profile_pk)
 
-        current_place = statistic.place
         statistic.play_round(
             score=score,
             rights=rights,
@@ -89,34 +85,54 @@ class StatisticsActions(Generic[T]):
             perfect_rounds=statistic.perfect_rounds,
             trend=statistic.trend,
         )
-        # получаем новое место игрока после обновления статистики
-        new_place = await self.__repository.get_user_rank(profile_pk)
-        # если место не изменилось, выходим из функции
-        if current_place == new_place:
-            return
-        # сдвигаем всех затронутых игроков и
-        # присваиваем новое место текущему игроку
-        await self.__repository.replace_profiles(new_place, current_place)
-        await self.__repository.update(
-            pk=statistic.id,
-            place=new_place,
-            trend=current_place - new_place,
-        )
+        # перемещаем игрока на новое место
+        await self.__ranking.move(profile_pk, statistic)
+
+    async def apply_rounds(self, rounds: dict[int, RoundsEntity]) -> None:
+        """
+        Записать накопленные раунды нескольких игроков и переместить
+        их на новые места. Новые статистики создаются на последнем
+        месте среди игроков с неотрицательными очками.
+
+        :param rounds:  Раунды по id профиля.
+        :return:        None.
+        """
+        count = await self.__repository.get_count_positive_score()
+        statistics = await self.__repository.apply_rounds(rounds, count + 1)
+        await self.__ranking.move_batch(statistics)
 
     async def get_by_profile(
         self, profile_pk: int
     ) -> tuple[StatisticEntity, BestPlayerTitleEntity]:
         """
-        Получить статистику и титулы по id профиля.
+        Получить статистику и титулы по id профиля. К статистике
+        добавляются раунды, еще не записанные в БД.
 
         :param profile_pk:  ID профиля.
         :return:            Статистика и титулы лучшего игрока.
         """
         stat = await self.__repository.get_one(profile_id=profile_pk)
+        rounds = await self.__queue.get(profile_pk)
+        if stat is None and rounds is not None:
+            # первые раунды игрока еще не записаны в БД
+            count = await self.__ranking.get_count()
+            stat = StatisticEntity(
+                id=0,
+                games=0,
+                score=0,
+                place=count + 1,
+                rights=0,
+                wrongs=0,
+                trend=0,
+                perfect_rounds=0,
+            )
         if stat is None:
             raise StatisticDoseNotExists(
                 detail=f"Статистика для игрока с id: {profile_pk} не найдена"
             )
+        if rounds is not None:
+            stat.play_rounds(rounds)
+        stat = await self.__ranking.actualize(profile_pk, stat)
         title = await self.__title_repository.get_one(profile_id=profile_pk)
         return stat, title
 
@@ -129,9 +145,7 @@ class StatisticsActions(Generic[T]):
         :return:        None.
         """
         async with self.transaction.begin():
-            first_place_profile = await self.__repository.get_profile_id(
-                place=1
-            )
+            first_place_profile = await self.__ranking.get_leader()
             if first_place_profile is None:
                 return
 
@@ -147,6 +161,7 @@ class StatisticsActions(Generic[T]):
                 best_of_the_month=profile_title.best_of_the_month,
             )
             await self.__repository.delete_all_statistics()
+            await self.__ranking.clear()
 
     async def get_top_ladder(
         self,
@@ -160,13 +175,55 @@ class StatisticsActions(Generic[T]):
         :param limit:   Сколько игроков получить.
         :return:        Список статистики игроков.
         """
-        return await self.__repository.get_top_gamers(offset, limit)
+        return await self.__ranking.get_top(offset, limit)
+
+    async def get_ladder_page(
+        self,
+        key: LadderKey | None,
+        limit: int,
+        backward: bool = False,
+    ) -> list[StatisticEntity]:
+        """
+        Получить страницу ладдера после позиции key (или перед ней).
+
+        :param key:         Позиция в ладдере, None - начало ладдера.
+        :param limit:       Сколько игроков получить.
+        :param backward:    Получить игроков перед позицией.
+        :return:            Список статистики игроков.
+        """
+        return await self.__ranking.get_page(key, limit, backward)
+
+    async def get_ladder_around(
+        self, profile_pk: int, limit: int
+    ) -> list[StatisticEntity]:
+        """
+        Получить страницу ладдера, в середине которой находится игрок.
+        Если у игрока нет статистики, возвращается начало ладдера.
+
+        :param profile_pk:  ID профиля.
+        :param limit:       Сколько игроков получить.
+        :return:            Список статистики игроков.
+        """
+        stat = await self.__repository.get_one(profile_id=profile_pk)
+        if stat is None:
+            return await self.__ranking.get_page(None, limit)
+
+        key = LadderKey(stat.score, stat.games, profile_pk)
+        # как в прежнем расчете offset = место - ceil(limit / 2):
+        # над игроком ceil(limit / 2) - 1 игроков, сам он и остальные ниже
+        before = await self.__ranking.get_page(
+            key, max(math.ceil(limit / 2) - 1, 0), backward=True
+        )
+        after = await self.__ranking.get_page(
+            key, limit - len(before), inclusive=True
+        )
+        return before + after
 
     async def get_count_statistic(self) -> int:
         """
         Возвращает общее число игроков со статистикой.
         """
-        return await self.__repository.get_count()
+        return await self.__ranking.get_count()
 
     async def get_user_rank(self, profile_id: int) -> int:
         """
@@ -175,13 +232,91 @@ class StatisticsActions(Generic[T]):
         :param profile_id:  ID профиля.
         :return:            Место в ладдере.
         """
-        return await self.__repository.get_user_rank(profile_id)
+        return await self.__ranking.get_rank(profile_id)
 
 
 @dataclass
 class CompositeStatisticAction:
     actions: list[StatisticsActions]
     transaction: Transaction
+    queue: IRoundQueue
+    profile_repository: IProfileService
+    write_behind: bool = False
+
+    async def record(
+        self,
+        profile_pk: int,
+        score: int,
+        rights: int,
+        wrongs: int,
+        perfect_round: bool,
+    ) -> None:
+        """
+        Записать результат раунда. При отложенной записи раунд
+        ставится в очередь и попадет в БД при следующей записи пачки.
+
+        :param profile_pk:      ID профиля.
+        :param score:           Набрано очков.
+        :param rights:          Верных ответов.
+        :param wrongs:          Неверных ответов.
+        :param perfect_round:   Раунд без ошибок True/False.
+        :return:                None.
+        """
+        if not self.write_behind:
+            await self.patch(profile_pk, score, rights, wrongs, perfect_round)
+            return
+        # как и при синхронной записи, раунды без профиля не принимаются
+        if not await self.profile_repository.exists(id=profile_pk):
+            raise DoesNotExistsProfile()
+        await self.queue.put(profile_pk, score, rights, wrongs, perfect_round)
+
+    async def flush(self, limit: int) -> int:
+        """
+        Записать пачку накопленных раундов сразу в 3 таблицы
+        (общая, дневная, месячная) одной транзакцией. Если данные
+        пачки нарушают ограничения БД, например профиль удален,
+        раунды записываются по одному профилю, а раунды, которые
+        записать нельзя, отбрасываются. При других ошибках
+        незаписанные раунды возвращаются в очередь.
+
+        :param limit:   Максимальное число профилей в пачке.
+        :return:        Сколько профилей взято из очереди.
+        """
+        rounds = await self.queue.take(limit)
+        unsaved = set(rounds)
+        try:
+            if rounds:
+                try:
+                    await self._save(rounds)
+                    unsaved.clear()
+                except StatisticIntegrityError:
+                    await self._save_each(rounds, unsaved)
+        finally:
+            await self.queue.release(unsaved)
+        return len(rounds)
+
+    async def _save(self, rounds: dict[int, RoundsEntity]) -> None:
+        async with self.transaction.begin():
+            for action in self.actions:
+                await action.apply_rounds(rounds)
+
+    async def _save_each(
+        self, rounds: dict[int, RoundsEntity], unsaved: set[int]
+    ) -> None:
+        """
+        Записать раунды по одному профилю, удаляя из unsaved
+        записанные и отброшенные.
+        """
+        for profile_id in list(unsaved):
+            try:
+                await self._save({profile_id: rounds[profile_id]})
+            except StatisticIntegrityError:
+                logger.error(
+                    "Раунды профиля {} не записаны и отброшены: {}",
+                    profile_id,
+                    rounds[profile_id],
+                )
+            unsaved.discard(profile_id)
 
     async def patch(
         self,
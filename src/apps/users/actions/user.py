@@ -1,11 +1,15 @@
 from dataclasses import dataclass
 
 from apps.users.exceptions.auth import (
+    AuthServiceBusy,
     InvalidAuthCredentials,
     InvalidToken,
 )
 from apps.users.services.auth.jwt_auth.models import BlacklistRefreshToken
-from apps.users.services.auth.pwd_hash import check_password
+from apps.users.services.auth.pwd_hash import (
+    PasswordHasher,
+    PasswordHasherBusy,
+)
 from apps.users.services.storage.base import IUserService
 from services.jwt_token.exceptions import (
     DecodeJWTError,
@@ -18,6 +22,7 @@ from services.jwt_token.exceptions import (
 class AuthAction:
     __repository: IUserService
     token_service: BlacklistRefreshToken
+    password_hasher: PasswordHasher
 
     async def login(self, username: str, password: str) -> tuple[str, str]:
         """
@@ -30,7 +35,13 @@ class AuthAction:
         """
         user = await self.__repository.get_one(username=username)
 
-        if user is None or not check_password(password, user.password):
+        if user is None:
+            raise InvalidAuthCredentials()
+        try:
+            valid = await self.password_hasher.verify(password, user.password)
+        except PasswordHasherBusy:
+            raise AuthServiceBusy()
+        if not valid:
             raise InvalidAuthCredentials()
 
         refresh = await self.token_service.for_user(user)
@@ -15,6 +15,12 @@ class InvalidToken(BaseHTTPException):
     detail: str = "Некорректный jwt токен"
 
 
+@dataclass(eq=False)
+class AuthServiceBusy(BaseHTTPException):
+    code: int = 503
+    detail: str = "Слишком много попыток входа, повторите позже"
+
+
 @dataclass(eq=False)
 class UserDoesNotExists(BaseHTTPException):
     code: int = 401
@@ -7,3 +7,9 @@ from core.constructor.exceptions import BaseHTTPException
 class StatisticDoseNotExists(BaseHTTPException):
     code: int = 400
     detail: str = "Статистика не найдена"
+
+
+@dataclass(eq=False)
+class StatisticIntegrityError(BaseHTTPException):
+    code: int = 400
+    detail: str = "Статистика не может быть записана"
@@ -1,7 +1,9 @@
 from .entity import (
     BestPlayerTitleEntity,
+    LadderKey,
     PeriodStatistic,
     ProfileEntity,
+    RoundsEntity,
     StatisticEntity,
     UserEntity,
 )
@@ -27,4 +29,6 @@ __all__ = (
     "StatisticEntity",
     "BestPlayerTitleEntity",
     "PeriodStatistic",
+    "RoundsEntity",
+    "LadderKey",
 )
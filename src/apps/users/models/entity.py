@@ -41,6 +41,56 @@ class StatisticEntity:
         self.perfect_rounds += int(perfect_round)
         self.trend = 0
 
+    def play_rounds(self, rounds: "RoundsEntity") -> None:
+        self.games += rounds.games
+        self.score += rounds.score
+        self.rights += rounds.rights
+        self.wrongs += rounds.wrongs
+        self.perfect_rounds += rounds.perfect_rounds
+        self.trend = 0
+
+
+@dataclass(frozen=True)
+class LadderKey:
+    """
+    Позиция игрока в ладдере. Игроки упорядочены по убыванию очков,
+    затем игр, при равенстве - по возрастанию id профиля.
+    """
+
+    score: int
+    games: int
+    profile_id: int
+
+
+@dataclass
+class RoundsEntity:
+    """
+    Суммарный результат нескольких раундов игрока,
+    еще не записанный в статистику.
+    """
+
+    games: int = 0
+    score: int = 0
+    rights: int = 0
+    wrongs: int = 0
+    perfect_rounds: int = 0
+
+    def add_round(
+        self, score: int, rights: int, wrongs: int, perfect_round: bool
+    ) -> None:
+        self.games += 1
+        self.score += score
+        self.rights += rights
+        self.wrongs += wrongs
+        self.perfect_rounds += int(perfect_round)
+
+    def merge(self, other: "RoundsEntity") -> None:
+        self.games += other.games
+        self.score += other.score
+        self.rights += other.rights
+        self.wrongs += other.wrongs
+        self.perfect_rounds += other.perfect_rounds
+
 
 @dataclass
 class BestPlayerTitleEntity:
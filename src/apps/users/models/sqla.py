@@ -4,6 +4,7 @@ from sqlalchemy import (
     Boolean,
     DateTime,
     ForeignKey,
+    Index,
     inspect,
     Integer,
     sql,
@@ -164,6 +165,17 @@ class Statistic(Base, StatisticToEntityMixin):
     __table_args__ = (UniqueConstraint("profile_id"),)
 
 
+# места в ладдере
+Index("ix_statistics_place", Statistic.place)
+# порядок игроков в ладдере: очки, игры, id профиля
+Index(
+    "ix_statistics_rank",
+    Statistic.score.desc(),
+    Statistic.games.desc(),
+    Statistic.profile_id,
+)
+
+
 class MonthStatistic(Base, StatisticToEntityMixin):
     __tablename__ = "month_statistics"
 
@@ -189,6 +201,17 @@ class MonthStatistic(Base, StatisticToEntityMixin):
     __table_args__ = (UniqueConstraint("profile_id"),)
 
 
+# места в ладдере
+Index("ix_month_statistics_place", MonthStatistic.place)
+# порядок игроков в ладдере: очки, игры, id профиля
+Index(
+    "ix_month_statistics_rank",
+    MonthStatistic.score.desc(),
+    MonthStatistic.games.desc(),
+    MonthStatistic.profile_id,
+)
+
+
 class DayStatistic(Base, StatisticToEntityMixin):
     __tablename__ = "day_statistics"
 
@@ -214,6 +237,17 @@ class DayStatistic(Base, StatisticToEntityMixin):
     __table_args__ = (UniqueConstraint("profile_id"),)
 
 
+# места в ладдере
+Index("ix_day_statistics_place", DayStatistic.place)
+# порядок игроков в ладдере: очки, игры, id профиля
+Index(
+    "ix_day_statistics_rank",
+    DayStatistic.score.desc(),
+    DayStatistic.games.desc(),
+    DayStatistic.profile_id,
+)
+
+
 class BestPlayerTitle(Base):
     __tablename__ = "best_player_title"
 
@@ -1,6 +1,7 @@
 from dataclasses import dataclass
 
 from apps.users.exceptions.profile import ProfileDoesNotMatchTheDevice
+from apps.users.services.devices import IDeviceCache
 from apps.users.services.storage import IProfileService
 from core.constructor.permissions import BasePermission
 from core.security.fingerprint_auth.exceptions import UnauthorizedDevice
@@ -9,11 +10,13 @@ from core.security.fingerprint_auth.exceptions import UnauthorizedDevice
 @dataclass(frozen=True, eq=False)
 class ProfilePermissions(BasePermission):
     repository: IProfileService
+    devices: IDeviceCache
 
     async def has_permission(self, profile_pk: int, token: str) -> None:
-        try:
-            profile = await self.repository.get_one(device_uuid=token)
-            if profile.id != profile_pk:
-                raise ProfileDoesNotMatchTheDevice()
-        except AttributeError:
+        profile_id = await self.devices.get_or_load(
+            token, lambda: self.repository.get_id_by_device(token)
+        )
+        if profile_id is None:
             raise UnauthorizedDevice()
+        if profile_id != profile_pk:
+            raise ProfileDoesNotMatchTheDevice()
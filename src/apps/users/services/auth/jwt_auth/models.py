@@ -56,6 +56,7 @@ class RefreshToken(Token):
             "id": user.id,
             "superuser": user.is_superuser,
             "active": user.is_active,
+            "username": user.username,
         }
         return self.encode()
 
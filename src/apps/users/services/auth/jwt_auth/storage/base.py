@@ -28,3 +28,15 @@ class ITokenStorage(ABC):
         :param key: Jti подпись токена.
         :return:    Токен или None, если не найден.
         """
+
+    @abstractmethod
+    def start(self) -> None:
+        """
+        Начать получать блокировки токенов из других процессов.
+        """
+
+    @abstractmethod
+    async def stop(self) -> None:
+        """
+        Перестать получать блокировки токенов из других процессов.
+        """
@@ -1,12 +1,55 @@
-from dataclasses import dataclass
+import time
+import asyncio
+from contextlib import suppress
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from loguru import logger
 
 from apps.users.services.auth.jwt_auth.storage.base import ITokenStorage
+from services.bloom import BloomFilter
 from services.redis_pool import RedisPool
 
 
+CHANNEL = "token_blacklist:add"
+# ключи черного списка - jti токенов, uuid4 в hex
+JTI_PATTERN = "[0-9a-f]" * 32
+# как часто во время сборки фильтра проверять, закончилась ли она
+REBUILD_POLL_INTERVAL = 0.1
+
+
 @dataclass
 class RedisTokenStorage(ITokenStorage):
+    """
+    Черный список refresh токенов в Redis с фильтром Блума в памяти
+    процесса перед ним. Почти все проверяемые токены не заблокированы,
+    фильтр отвечает на них без обращения к Redis, и только вероятные
+    попадания проверяются в Redis.
+
+    Фильтр пересобирается из ключей Redis раз в sync_interval секунд,
+    поэтому токены уходят из него вместе с ключами по истечении exp.
+    Новые блокировки из других процессов приходят через канал Redis,
+    сообщения из него читаются и во время сборки фильтра, поэтому
+    сборка не задерживает блокировки. Пока фильтр не собран или
+    подписка на канал потеряна, каждый токен проверяется в Redis.
+
+    :param storage:         Подключение к Redis.
+    :param capacity:        Ожидаемое число заблокированных токенов.
+    :param error_rate:      Доля ложных срабатываний фильтра.
+    :param sync_interval:   Период пересборки фильтра, секунды.
+    """
+
     storage: RedisPool
+    capacity: int
+    error_rate: float
+    sync_interval: float
+    _filter: BloomFilter | None = field(init=False, default=None)
+    # фильтр, который сейчас собирается, в него тоже попадают
+    # блокировки, пришедшие во время сборки
+    _building: BloomFilter | None = field(init=False, default=None)
+    _task: asyncio.Task | None = field(init=False, default=None)
 
     async def set_token(
         self, key: str, value: str, expire: int | float
@@ -16,6 +59,93 @@ class RedisTokenStorage(ITokenStorage):
             value=value,
             timestamp_ex=round(expire),
         )
+        self._add(key)
+        conn = await self.storage.connect()
+        await conn.publish(CHANNEL, key)
 
     async def get_token(self, key: str) -> str | None:
+        if self._filter is not None and key not in self._filter:
+            return None
         return await self.storage.get_value(key)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self._filter = None
+
+    async def _listen(self) -> None:
+        while True:
+            rebuild: asyncio.Task | None = None
+            try:
+                conn = await self.storage.connect()
+                async with conn.pubsub() as pubsub:
+                    await pubsub.subscribe(CHANNEL)
+                    # блокировки до подписки попадут в фильтр из Redis,
+                    # после подписки - из канала. Фильтр собирается
+                    # в отдельной задаче, чтобы канал читался и во время
+                    # сборки
+                    rebuild = asyncio.create_task(self._rebuild())
+                    rebuild_at = 0.0
+                    while True:
+                        if rebuild is None:
+                            timeout = max(rebuild_at - time.monotonic(), 0)
+                        else:
+                            timeout = REBUILD_POLL_INTERVAL
+                        message = await pubsub.get_message(
+                            ignore_subscribe_messages=True, timeout=timeout
+                        )
+                        if message is not None:
+                            self._add(message["data"].decode())
+                        if rebuild is not None and rebuild.done():
+                            # ошибка сборки переподписывает на канал
+                            rebuild.result()
+                            rebuild = None
+                            rebuild_at = time.monotonic() + self.sync_interval
+                        elif (
+                            rebuild is None and time.monotonic() >= rebuild_at
+                        ):
+                            rebuild = asyncio.create_task(self._rebuild())
+            except asyncio.CancelledError:
+                await self._cancel(rebuild)
+                raise
+            except Exception:
+                # незаконченная сборка не должна вернуть фильтр,
+                # пока подписки нет
+                await self._cancel(rebuild)
+                self._filter = None
+                self._building = None
+                logger.exception("Потеряна подписка на черный список токенов")
+                await asyncio.sleep(1)
+
+    @staticmethod
+    async def _cancel(task: asyncio.Task | None) -> None:
+        if task is None:
+            return
+        task.cancel()
+        with suppress(asyncio.CancelledError, Exception):
+            await task
+
+    async def _rebuild(self) -> None:
+        conn = await self.storage.connect()
+        count = await conn.dbsize()
+        self._building = BloomFilter(
+            max(self.capacity, 2 * count), self.error_rate
+        )
+        async for key in conn.scan_iter(match=JTI_PATTERN, count=1000):
+            self._building.add(key.decode())
+        self._filter, self._building = self._building, None
+        logger.debug(
+            "Фильтр черного списка токенов пересобран, токенов: {}",
+            self._filter.count,
+        )
+
+    def _add(self, key: str) -> None:
+        for bloom in (self._filter, self._building):
+            if bloom is not None:
+                bloom.add(key)
@@ -1,6 +1,21 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Callable,
+    TypeVar,
+)
+
 import bcrypt
 
 
+T = TypeVar("T")
+
+
 def hash_password(password: str) -> str:
     salt = bcrypt.gensalt()
     pwd_hash = bcrypt.hashpw(password.encode(), salt)
@@ -11,3 +26,113 @@ def check_password(password: str, hashed_password: str) -> bool:
     b_password: bytes = password.encode()
     b_hashed_password: bytes = hashed_password.encode()
     return bcrypt.checkpw(b_password, b_hashed_password)
+
+
+class PasswordHasherBusy(Exception):
+    """
+    Очередь на проверку паролей переполнена.
+    """
+
+
+@dataclass
+class PasswordHasherMetrics:
+    """
+    Метрики пула хеширования паролей.
+
+    :param running:     Сколько операций выполняется сейчас.
+    :param waiting:     Сколько операций ждут свободного потока.
+    :param max_waiting: Самая длинная очередь.
+    :param completed:   Число выполненных операций.
+    :param rejected:    Число операций, отклоненных из-за очереди.
+    :param total_wait:  Суммарное время ожидания в очереди, секунды.
+    :param max_wait:    Самое долгое ожидание в очереди, секунды.
+    """
+
+    running: int = 0
+    waiting: int = 0
+    max_waiting: int = 0
+    completed: int = 0
+    rejected: int = 0
+    total_wait: float = 0.0
+    max_wait: float = 0.0
+
+
+@dataclass
+class PasswordHasher:
+    """
+    Хеширование и проверка паролей bcrypt в отдельных потоках.
+    bcrypt отпускает GIL на время вычисления хеша, поэтому проверка
+    пароля не останавливает событийный цикл на сотни миллисекунд.
+    Одновременно выполняется не больше workers операций, остальные
+    ждут в очереди. Если в очереди уже queue_size операций,
+    новая отклоняется с PasswordHasherBusy.
+
+    :param workers:     Размер пула потоков.
+    :param queue_size:  Максимальная длина очереди.
+    """
+
+    workers: int
+    queue_size: int
+    metrics: PasswordHasherMetrics = field(
+        init=False, default_factory=PasswordHasherMetrics
+    )
+    _executor: ThreadPoolExecutor | None = field(init=False, default=None)
+    _semaphore: asyncio.Semaphore | None = field(init=False, default=None)
+
+    async def hash(self, password: str) -> str:
+        """
+        Получить хеш пароля.
+
+        :param password:    Пароль.
+        :return:            Хеш пароля с солью.
+        """
+        return await self._run(hash_password, password)
+
+    async def verify(self, password: str, hashed_password: str) -> bool:
+        """
+        Проверить пароль по хешу.
+
+        :param password:        Пароль.
+        :param hashed_password: Хеш пароля.
+        :return:                True, если пароль верный.
+        """
+        return await self._run(check_password, password, hashed_password)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="bcrypt"
+            )
+            self._semaphore = asyncio.Semaphore(self.workers)
+
+        if self._semaphore.locked():
+            if self.metrics.waiting >= self.queue_size:
+                self.metrics.rejected += 1
+                raise PasswordHasherBusy()
+
+        self.metrics.waiting += 1
+        self.metrics.max_waiting = max(
+            self.metrics.max_waiting, self.metrics.waiting
+        )
+        queued_at = time.monotonic()
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.metrics.waiting -= 1
+
+        wait = time.monotonic() - queued_at
+        self.metrics.total_wait += wait
+        self.metrics.max_wait = max(self.metrics.max_wait, wait)
+        self.metrics.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.metrics.running -= 1
+            self.metrics.completed += 1
+            self._semaphore.release()
@@ -0,0 +1,10 @@
+from .base import IDeviceCache
+from .cache import RedisDeviceCache
+from .memory import MemoryDeviceCache
+
+
+__all__ = (
+    "IDeviceCache",
+    "MemoryDeviceCache",
+    "RedisDeviceCache",
+)
@@ -0,0 +1,43 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+
+ProfileLoader = Callable[[], Awaitable[int | None]]
+
+
+@dataclass
+class IDeviceCache(ABC):
+    """
+    Кеш соответствия токена устройства и ID профиля. Используется
+    при проверке прав, чтобы не обращаться к БД на каждом запросе.
+    Кешируются только найденные профили.
+    """
+
+    @abstractmethod
+    async def get_or_load(
+        self, token: str, loader: ProfileLoader
+    ) -> int | None:
+        """
+        Получить ID профиля устройства, при промахе загрузить его.
+
+        :param token:   Токен устройства.
+        :param loader:  Корутина, возвращающая ID профиля или None,
+                        если профиля с таким устройством нет.
+        :return:        ID профиля или None.
+        """
+
+    @abstractmethod
+    async def invalidate(self, token: str) -> None:
+        """
+        Сбросить закешированный профиль устройства.
+
+        :param token:   Токен устройства.
+        :return:        None.
+        """
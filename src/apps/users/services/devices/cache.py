@@ -0,0 +1,50 @@
+from dataclasses import dataclass
+
+from apps.users.services.devices.base import (
+    IDeviceCache,
+    ProfileLoader,
+)
+from services.redis_pool import RedisPool
+
+
+@dataclass
+class RedisDeviceCache(IDeviceCache):
+    """
+    Двухуровневый кеш профилей устройств: сначала память процесса,
+    затем Redis, общий для всех воркеров, и только потом БД.
+
+    :param storage: Подключение к Redis.
+    :param local:   Кеш в памяти процесса.
+    :param ttl:     Сколько секунд профиль устройства хранится в Redis.
+    """
+
+    storage: RedisPool
+    local: IDeviceCache
+    ttl: int
+
+    async def get_or_load(
+        self, token: str, loader: ProfileLoader
+    ) -> int | None:
+        async def load_shared() -> int | None:
+            key = self._key(token)
+            cached = await self.storage.get_value(key)
+            if cached is not None:
+                return int(cached)
+
+            profile_id = await loader()
+            if profile_id is not None:
+                await self.storage.set_exp_value(
+                    key, profile_id, time_ex=self.ttl
+                )
+            return profile_id
+
+        return await self.local.get_or_load(token, load_shared)
+
+    async def invalidate(self, token: str) -> None:
+        await self.local.invalidate(token)
+        conn = await self.storage.connect()
+        await conn.delete(self._key(token))
+
+    @staticmethod
+    def _key(token: str) -> str:
+        return f"device_profile:{token}"
@@ -0,0 +1,51 @@
+import time
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from apps.users.services.devices.base import (
+    IDeviceCache,
+    ProfileLoader,
+)
+
+
+@dataclass
+class MemoryDeviceCache(IDeviceCache):
+    """
+    Кеш профилей устройств в памяти процесса с вытеснением давно
+    не запрошенных устройств. Сброс действует только в текущем
+    процессе, остальные воркеры увидят изменения по истечении ttl.
+
+    :param ttl:         Сколько секунд хранится профиль устройства.
+    :param max_size:    Максимальное число устройств в кеше.
+    """
+
+    ttl: float
+    max_size: int
+    _profiles: OrderedDict[str, tuple[int, float]] = field(
+        init=False, default_factory=OrderedDict
+    )
+
+    async def get_or_load(
+        self, token: str, loader: ProfileLoader
+    ) -> int | None:
+        cached = self._profiles.get(token)
+        if cached is not None and cached[1] > time.monotonic():
+            self._profiles.move_to_end(token)
+            return cached[0]
+
+        profile_id = await loader()
+        if profile_id is None:
+            self._profiles.pop(token, None)
+            return None
+
+        self._profiles[token] = (profile_id, time.monotonic() + self.ttl)
+        self._profiles.move_to_end(token)
+        while len(self._profiles) > self.max_size:
+            self._profiles.popitem(last=False)
+        return profile_id
+
+    async def invalidate(self, token: str) -> None:
+        self._profiles.pop(token, None)
@@ -0,0 +1,14 @@
+from .base import IRankingService
+from .ladder import LadderRankingService
+from .periodic import PeriodicRankingService
+from .rebuilder import RankRebuilder
+from .shift import ShiftRankingService
+
+
+__all__ = (
+    "IRankingService",
+    "LadderRankingService",
+    "PeriodicRankingService",
+    "RankRebuilder",
+    "ShiftRankingService",
+)
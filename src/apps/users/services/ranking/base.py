@@ -0,0 +1,132 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import Generic
+
+from apps.users.models import (
+    LadderKey,
+    StatisticEntity,
+)
+from apps.users.services.storage import TModel
+
+
+@dataclass
+class IRankingService(ABC, Generic[TModel]):
+    """
+    Расчет мест игроков в ладдере. Место определяется очками, затем
+    числом игр (больше - выше), при равенстве - меньшим id профиля.
+    """
+
+    @abstractmethod
+    async def insert(self, profile_id: int) -> StatisticEntity:
+        """
+        Создать статистику игрока с 0 параметрами и разместить ее в ладдере.
+
+        :param profile_id:  ID профиля.
+        :return:            Статистика.
+        """
+
+    @abstractmethod
+    async def move(self, profile_id: int, statistic: StatisticEntity) -> None:
+        """
+        Переместить игрока на новое место после раунда. Статистика
+        в БД к этому моменту уже содержит результаты раунда.
+
+        :param profile_id:  ID профиля.
+        :param statistic:   Статистика игрока после раунда, с местом
+                            до раунда.
+        :return:            None.
+        """
+
+    @abstractmethod
+    async def move_batch(self, statistics: dict[int, StatisticEntity]) -> None:
+        """
+        Переместить сразу нескольких игроков после записи пачки раундов.
+
+        :param statistics:  Статистики игроков после раундов по id
+                            профиля, с местами до раундов.
+        :return:            None.
+        """
+
+    @abstractmethod
+    async def get_rank(self, profile_id: int) -> int:
+        """
+        Возвращает место игрока в ладдере.
+
+        :param profile_id:  ID профиля.
+        :return:            Номер места.
+        """
+
+    @abstractmethod
+    async def get_top(
+        self,
+        offset: int | None,
+        limit: int | None,
+    ) -> list[StatisticEntity]:
+        """
+        Возвращает топ ладдера, отсортированный по месту.
+        Профиль подгружается к статистике.
+
+        :param offset:  С какого места получить список.
+        :param limit:   Сколько записей получить.
+        :return:        Список статистик.
+        """
+
+    @abstractmethod
+    async def get_page(
+        self,
+        key: LadderKey | None,
+        limit: int,
+        backward: bool = False,
+        inclusive: bool = False,
+    ) -> list[StatisticEntity]:
+        """
+        Возвращает страницу ладдера рядом с позицией key, отсортированную
+        по месту. Стоимость не зависит от того, насколько далеко от начала
+        ладдера позиция. Профиль подгружается к статистике.
+
+        :param key:         Позиция в ладдере, None - начало ладдера.
+        :param limit:       Сколько записей получить.
+        :param backward:    Получить записи перед позицией, а не после.
+        :param inclusive:   Включить в выборку игрока на позиции.
+        :return:            Список статистик.
+        """
+
+    @abstractmethod
+    async def actualize(
+        self, profile_id: int, statistic: StatisticEntity
+    ) -> StatisticEntity:
+        """
+        Проставить статистике актуальное место в ладдере.
+
+        :param profile_id:  ID профиля.
+        :param statistic:   Статистика игрока.
+        :return:            Статистика с актуальным местом.
+        """
+
+    @abstractmethod
+    async def get_count(self) -> int:
+        """
+        Возвращает число игроков в ладдере.
+        """
+
+    @abstractmethod
+    async def get_leader(self) -> int | None:
+        """
+        Возвращает id профиля на первом месте или None, если ладдер пуст.
+        """
+
+    @abstractmethod
+    async def clear(self) -> None:
+        """
+        Очистить ладдер. Вызывается после удаления всех статистик.
+        """
+
+    @abstractmethod
+    async def refresh(self) -> None:
+        """
+        Привести места в соответствие с данными БД.
+        Вызывается по расписанию RankRebuilder.
+        """
@@ -0,0 +1,295 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Generic,
+    Type,
+)
+
+from apps.users.exceptions.statistics import StatisticDoseNotExists
+from apps.users.models import (
+    LadderKey,
+    StatisticEntity,
+)
+from apps.users.services.ranking.base import IRankingService
+from apps.users.services.storage import (
+    IStatisticService,
+    TModel,
+)
+from core.database.db import Transaction
+from services.redis_pool import RedisPool
+
+
+# очки и игры упаковываются в один вес: score * SCORE_FACTOR + games,
+# число игр игрока должно быть меньше SCORE_FACTOR
+SCORE_FACTOR = 2**21
+# id профиля дополняется нулями, чтобы при равном весе
+# лексикографический порядок совпадал с порядком id
+MEMBER_WIDTH = 10
+# сколько игроков записывать в Redis за одну команду при построении ладдера
+REBUILD_CHUNK = 10_000
+# через сколько секунд блокировка построения ладдера снимается сама,
+# если построивший ее процесс упал
+REBUILD_LOCK_TIMEOUT = 60
+
+
+@dataclass
+class LadderRankingService(IRankingService, Generic[TModel]):
+    """
+    Ладдер хранится в Redis в sorted set, место игрока - его ранг
+    в множестве, поэтому перемещение и получение места стоят O(log N).
+    В БД место и тренд записываются только игроку, сыгравшему раунд,
+    места остальных игроков подставляются при чтении, а их тренды
+    сдвигаются на разницу между местом в БД и текущим. Игроки
+    перемещаются в ладдере после коммита раундов в БД. Если ладдера
+    нет в Redis, он строится заново по данным из БД одним запросом
+    под блокировкой, остальные запросы ждут его.
+
+    :param storage:     Подключение к Redis.
+    :param model:       Модель статистики, по ней формируется ключ ладдера.
+    :param transaction: Транзакция, после коммита которой
+                        перемещаются игроки и очищается ладдер.
+    """
+
+    __repository: IStatisticService[TModel]
+    storage: RedisPool
+    model: Type[TModel]
+    transaction: Transaction
+
+    async def insert(self, profile_id: int) -> StatisticEntity:
+        conn = await self._connect()
+        # новая статистика встает на последнее место среди игроков
+        # с неотрицательными очками, в ладдер она попадет после раунда
+        count = await conn.zcount(self._key, "-inf", 0)
+        return await self.__repository.create(
+            profile_id=profile_id, place=count + 1
+        )
+
+    async def move(self, profile_id: int, statistic: StatisticEntity) -> None:
+        await self.move_batch({profile_id: statistic})
+
+    async def move_batch(self, statistics: dict[int, StatisticEntity]) -> None:
+        if not statistics:
+            return
+        # при откате раундов ладдер не должен разойтись с БД
+        await self.transaction.on_commit(partial(self._move, statistics))
+
+    async def _move(self, statistics: dict[int, StatisticEntity]) -> None:
+        """
+        Переместить игроков в ладдере и записать им в БД новые места
+        и тренды.
+        """
+        members = {
+            self._member(profile_id): statistic
+            for profile_id, statistic in statistics.items()
+        }
+        conn = await self._connect()
+        async with conn.pipeline(transaction=True) as pipe:
+            for member in members:
+                pipe.zrank(self._key, member)
+            pipe.zadd(
+                self._key,
+                {
+                    member: self._weight(statistic.score, statistic.games)
+                    for member, statistic in members.items()
+                },
+            )
+            for member in members:
+                pipe.zrank(self._key, member)
+            ranks = await pipe.execute()
+
+        count = len(members)
+        old_ranks, new_ranks = ranks[:count], ranks[count + 1 :]
+        places = []
+        for statistic, old_rank, new_rank in zip(
+            members.values(), old_ranks, new_ranks
+        ):
+            current_place = (
+                statistic.place if old_rank is None else old_rank + 1
+            )
+            new_place = new_rank + 1
+            # место в БД могло устареть, тогда его нужно записать
+            # даже если место в ладдере не изменилось
+            if current_place == new_place and statistic.place == new_place:
+                continue
+            places.append((statistic.id, new_place, current_place - new_place))
+        await self.__repository.update_places(places)
+
+    async def get_rank(self, profile_id: int) -> int:
+        conn = await self._connect()
+        rank = await conn.zrank(self._key, self._member(profile_id))
+        if rank is None:
+            raise StatisticDoseNotExists()
+        return rank + 1
+
+    async def get_top(
+        self,
+        offset: int | None,
+        limit: int | None,
+    ) -> list[StatisticEntity]:
+        offset = offset or 0
+        if limit == 0:
+            return []
+
+        conn = await self._connect()
+        stop = -1 if limit is None else offset + limit - 1
+        members = await conn.zrange(self._key, offset, stop)
+        return await self._load(members, offset)
+
+    async def get_page(
+        self,
+        key: LadderKey | None,
+        limit: int,
+        backward: bool = False,
+        inclusive: bool = False,
+    ) -> list[StatisticEntity]:
+        if limit == 0 or (key is None and backward):
+            return []
+
+        conn = await self._connect()
+        position = 0
+        if key is not None:
+            # при выборке вперед без игрока на позиции и назад вместе
+            # с ним позицию нужно считать включительно
+            position = await self._position(
+                conn, key, or_equal=inclusive == backward
+            )
+        start, stop = position, position + limit - 1
+        if backward:
+            start, stop = max(position - limit, 0), position - 1
+        if stop < start:
+            return []
+
+        members = await conn.zrange(self._key, start, stop)
+        return await self._load(members, start)
+
+    async def actualize(
+        self, profile_id: int, statistic: StatisticEntity
+    ) -> StatisticEntity:
+        conn = await self._connect()
+        rank = await conn.zrank(self._key, self._member(profile_id))
+        if rank is not None:
+            self._set_place(statistic, rank + 1)
+        return statistic
+
+    async def get_count(self) -> int:
+        conn = await self._connect()
+        return await conn.zcard(self._key)
+
+    async def get_leader(self) -> int | None:
+        conn = await self._connect()
+        members = await conn.zrange(self._key, 0, 0)
+        return int(members[0]) if members else None
+
+    async def clear(self) -> None:
+        # до коммита конкурентный запрос построил бы ладдер заново
+        # из еще не удаленных статистик
+        await self.transaction.on_commit(self._delete)
+
+    async def _delete(self) -> None:
+        conn = await self.storage.connect()
+        # построение, начатое до коммита, могло прочитать старые
+        # статистики, поэтому ключ удаляется после него
+        async with self._rebuild_lock(conn):
+            await conn.delete(self._key)
+
+    async def refresh(self) -> None:
+        # ладдер в Redis актуальнее БД, он строится, только если его нет
+        await self._connect()
+
+    async def _position(self, conn, key: LadderKey, or_equal: bool) -> int:
+        """
+        Число игроков в ладдере перед позицией key, с игроком
+        на позиции, если or_equal. Стоит O(log N) плюс число
+        игроков с тем же весом.
+        """
+        weight = self._weight(key.score, key.games)
+        member = self._member(key.profile_id)
+        async with conn.pipeline(transaction=True) as pipe:
+            pipe.zcount(self._key, "-inf", f"({weight}")
+            pipe.zrangebyscore(self._key, weight, weight)
+            before, ties = await pipe.execute()
+
+        for tie in ties:
+            tie = tie.decode()
+            if tie < member or (or_equal and tie == member):
+                before += 1
+        return before
+
+    async def _load(
+        self, members: list[bytes], start: int
+    ) -> list[StatisticEntity]:
+        """
+        Загрузить статистики игроков страницы ладдера из БД
+        и проставить им места.
+
+        :param members: Игроки страницы в порядке ладдера.
+        :param start:   Ранг первого игрока страницы, с 0.
+        :return:        Список статистик.
+        """
+        places = {
+            int(member): place
+            for place, member in enumerate(members, start=start + 1)
+        }
+        statistics = await self.__repository.get_by_profiles(list(places))
+        for statistic in statistics:
+            self._set_place(statistic, places[statistic.profile.id])
+        return statistics
+
+    @staticmethod
+    def _set_place(statistic: StatisticEntity, place: int) -> None:
+        # место в БД записано после последнего раунда игрока,
+        # сдвиг с тех пор - это перемещения из-за других игроков
+        statistic.trend += statistic.place - place
+        statistic.place = place
+
+    @property
+    def _key(self) -> str:
+        return f"ladder:{self.model.__tablename__}"
+
+    async def _connect(self):
+        """
+        Подключение к Redis. Если ладдера еще нет, он строится из БД.
+        """
+        conn = await self.storage.connect()
+        if not await conn.exists(self._key):
+            async with self._rebuild_lock(conn):
+                # пока ждали блокировку, ладдер мог построить другой запрос
+                if not await conn.exists(self._key):
+                    await self._rebuild(conn)
+        return conn
+
+    def _rebuild_lock(self, conn):
+        return conn.lock(
+            f"{self._key}:rebuild",
+            timeout=REBUILD_LOCK_TIMEOUT,
+            blocking_timeout=REBUILD_LOCK_TIMEOUT,
+        )
+
+    async def _rebuild(self, conn) -> None:
+        """
+        Построить ладдер по всем статистикам из БД. Игроки добавляются
+        в текущий ключ без замены: если во время построения игрок
+        переместился после раунда, в ладдере остается его новый вес,
+        а не прочитанный из БД раньше.
+        """
+        entries = await self.__repository.get_ranking_entries()
+        for i in range(0, len(entries), REBUILD_CHUNK):
+            await conn.zadd(
+                self._key,
+                {
+                    self._member(profile_id): self._weight(score, games)
+                    for profile_id, score, games in entries[
+                        i : i + REBUILD_CHUNK
+                    ]
+                },
+                nx=True,
+            )
+
+    @staticmethod
+    def _member(profile_id: int) -> str:
+        return str(profile_id).zfill(MEMBER_WIDTH)
+
+    @staticmethod
+    def _weight(score: int, games: int) -> int:
+        # ранг в sorted set растет с весом, а места - с убыванием очков
+        return -(score * SCORE_FACTOR + games)
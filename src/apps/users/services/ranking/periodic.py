@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Generic,
+    Type,
+)
+
+from apps.users.exceptions.statistics import StatisticDoseNotExists
+from apps.users.models import (
+    LadderKey,
+    StatisticEntity,
+)
+from apps.users.services.ranking.base import IRankingService
+from apps.users.services.storage import (
+    IStatisticService,
+    TModel,
+)
+from core.database.db import Transaction
+from services.count_cache import ICountCache
+
+
+@dataclass
+class PeriodicRankingService(IRankingService, Generic[TModel]):
+    """
+    Места хранятся только в БД и после раунда не пересчитываются,
+    их пересчитывает по расписанию RankRebuilder. До пересчета
+    игроки видят места на момент последнего пересчета.
+    """
+
+    __repository: IStatisticService[TModel]
+    __counts: ICountCache
+    model: Type[TModel]
+    transaction: Transaction
+
+    async def insert(self, profile_id: int) -> StatisticEntity:
+        count = await self.__repository.get_count_positive_score()
+        statistic = await self.__repository.create(
+            profile_id=profile_id, place=count + 1
+        )
+        await self._invalidate_count()
+        return statistic
+
+    async def move(self, profile_id: int, statistic: StatisticEntity) -> None:
+        return
+
+    async def move_batch(self, statistics: dict[int, StatisticEntity]) -> None:
+        # в пачке могли быть новые игроки
+        await self._invalidate_count()
+
+    async def get_rank(self, profile_id: int) -> int:
+        statistic = await self.__repository.get_one(profile_id=profile_id)
+        if statistic is None:
+            raise StatisticDoseNotExists()
+        return statistic.place
+
+    async def get_top(
+        self,
+        offset: int | None,
+        limit: int | None,
+    ) -> list[StatisticEntity]:
+        return await self.__repository.get_top_gamers(offset, limit)
+
+    async def get_page(
+        self,
+        key: LadderKey | None,
+        limit: int,
+        backward: bool = False,
+        inclusive: bool = False,
+    ) -> list[StatisticEntity]:
+        return await self.__repository.get_ladder_page(
+            key, limit, backward, inclusive
+        )
+
+    async def actualize(
+        self, profile_id: int, statistic: StatisticEntity
+    ) -> StatisticEntity:
+        return statistic
+
+    async def get_count(self) -> int:
+        return await self.__counts.get_or_count(
+            self._namespace,
+            self.__repository.get_count,
+            estimator=self.__repository.get_estimated_count,
+        )
+
+    async def get_leader(self) -> int | None:
+        # лидер определяется перед очисткой статистики,
+        # поэтому места должны быть актуальны
+        await self.__repository.rerank()
+        return await self.__repository.get_profile_id(place=1)
+
+    async def clear(self) -> None:
+        await self._invalidate_count()
+
+    async def refresh(self) -> None:
+        await self.__repository.rerank()
+
+    async def _invalidate_count(self) -> None:
+        # до коммита конкурентный запрос снова закешировал бы
+        # прежнее число игроков
+        await self.transaction.on_commit(
+            partial(self.__counts.invalidate, self._namespace)
+        )
+
+    @property
+    def _namespace(self) -> str:
+        return self.model.__tablename__
@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+from typing import Generic
+
+from apps.users.services.ranking.base import IRankingService
+from apps.users.services.storage import TModel
+
+
+@dataclass
+class RankRebuilder(Generic[TModel]):
+    """
+    Пересчет мест по расписанию. В режимах shift и periodic места
+    и тренды всей таблицы пересчитываются в БД одним запросом.
+    В режиме ladder места хранятся в Redis, и ладдер строится
+    из БД, только если его там нет.
+    """
+
+    __ranking: IRankingService[TModel]
+
+    async def rebuild(self) -> None:
+        await self.__ranking.refresh()
@@ -0,0 +1,117 @@
+from dataclasses import dataclass
+from functools import partial
+from typing import (
+    Generic,
+    Type,
+)
+
+from apps.users.models import (
+    LadderKey,
+    StatisticEntity,
+)
+from apps.users.services.ranking.base import IRankingService
+from apps.users.services.storage import (
+    IStatisticService,
+    TModel,
+)
+from core.database.db import Transaction
+from services.count_cache import ICountCache
+
+
+@dataclass
+class ShiftRankingService(IRankingService, Generic[TModel]):
+    """
+    Места хранятся только в БД. После каждого раунда место игрока
+    пересчитывается оконной функцией по всей таблице, а все игроки
+    между старым и новым местом сдвигаются на одно место.
+    """
+
+    __repository: IStatisticService[TModel]
+    __counts: ICountCache
+    model: Type[TModel]
+    transaction: Transaction
+
+    async def insert(self, profile_id: int) -> StatisticEntity:
+        # новая статистика встает на последнее место
+        # среди игроков с неотрицательными очками
+        count = await self.__repository.get_count_positive_score()
+        statistic = await self.__repository.create(
+            profile_id=profile_id, place=count + 1
+        )
+        await self.__repository.down_place_negative_score()
+        await self._invalidate_count()
+        return statistic
+
+    async def move(self, profile_id: int, statistic: StatisticEntity) -> None:
+        current_place = statistic.place
+        new_place = await self.__repository.get_user_rank(profile_id)
+        if current_place == new_place:
+            return
+        # сдвигаем всех затронутых игроков и
+        # присваиваем новое место текущему игроку
+        await self.__repository.replace_profiles(new_place, current_place)
+        await self.__repository.update(
+            pk=statistic.id,
+            place=new_place,
+            trend=current_place - new_place,
+        )
+
+    async def move_batch(self, statistics: dict[int, StatisticEntity]) -> None:
+        # сдвигать игроков по одному дороже, чем пересчитать все места
+        await self.__repository.rerank()
+        # в пачке могли быть новые игроки
+        await self._invalidate_count()
+
+    async def get_rank(self, profile_id: int) -> int:
+        return await self.__repository.get_user_rank(profile_id)
+
+    async def get_top(
+        self,
+        offset: int | None,
+        limit: int | None,
+    ) -> list[StatisticEntity]:
+        return await self.__repository.get_top_gamers(offset, limit)
+
+    async def get_page(
+        self,
+        key: LadderKey | None,
+        limit: int,
+        backward: bool = False,
+        inclusive: bool = False,
+    ) -> list[StatisticEntity]:
+        return await self.__repository.get_ladder_page(
+            key, limit, backward, inclusive
+        )
+
+    async def actualize(
+        self, profile_id: int, statistic: StatisticEntity
+    ) -> StatisticEntity:
+        return statistic
+
+    async def get_count(self) -> int:
+        return await self.__counts.get_or_count(
+            self._namespace,
+            self.__repository.get_count,
+            estimator=self.__repository.get_estimated_count,
+        )
+
+    async def get_leader(self) -> int | None:
+        return await self.__repository.get_profile_id(place=1)
+
+    async def clear(self) -> None:
+        await self._invalidate_count()
+
+    async def refresh(self) -> None:
+        # исправляет расхождения мест, накопленные при сдвигах
+        await self.__repository.rerank()
+
+    async def _invalidate_count(self) -> None:
+        # до коммита конкурентный запрос снова закешировал бы
+        # прежнее число игроков
+        await self.transaction.on_commit(
+            partial(self.__counts.invalidate, self._namespace)
+        )
+
+    @property
+    def _namespace(self) -> str:
+        return self.model.__tablename__
@@ -0,0 +1,67 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import Collection
+
+from apps.users.models import RoundsEntity
+
+
+@dataclass
+class IRoundQueue(ABC):
+    """
+    Очередь результатов раундов, еще не записанных в статистику.
+    Раунды одного профиля суммируются в одну запись.
+    """
+
+    @abstractmethod
+    async def put(
+        self,
+        profile_id: int,
+        score: int,
+        rights: int,
+        wrongs: int,
+        perfect_round: bool,
+    ) -> None:
+        """
+        Добавить результат раунда в очередь.
+
+        :param profile_id:      ID профиля.
+        :param score:           Набрано очков.
+        :param rights:          Верных ответов.
+        :param wrongs:          Неверных ответов.
+        :param perfect_round:   Раунд без ошибок True/False.
+        :return:                None.
+        """
+
+    @abstractmethod
+    async def get(self, profile_id: int) -> RoundsEntity | None:
+        """
+        Получить незаписанные раунды профиля, включая
+        раунды, которые записываются в данный момент.
+
+        :param profile_id:  ID профиля.
+        :return:            Сумма раундов или None, если их нет.
+        """
+
+    @abstractmethod
+    async def take(self, limit: int) -> dict[int, RoundsEntity]:
+        """
+        Забрать раунды из очереди для записи в БД. После записи
+        нужно вызвать release.
+
+        :param limit:   Максимальное число профилей.
+        :return:        Раунды по id профиля.
+        """
+
+    @abstractmethod
+    async def release(self, failed: Collection[int] = ()) -> None:
+        """
+        Завершить запись забранных раундов. Раунды профилей, которые
+        записать не удалось, возвращаются в очередь, остальные
+        считаются записанными или отброшенными.
+
+        :param failed:  ID профилей, раунды которых вернуть в очередь.
+        :return:        None.
+        """
@@ -0,0 +1,63 @@
+import asyncio
+from contextlib import suppress
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+from loguru import logger
+
+
+RoundsFlush = Callable[[int], Awaitable[int]]
+
+
+@dataclass
+class RoundFlusher:
+    """
+    Фоновая задача, которая раз в interval секунд записывает
+    накопленные раунды в БД пачками не больше batch_size профилей.
+
+    :param flush:       Корутина записи пачки раундов, принимает размер
+                        пачки и возвращает число записанных профилей.
+    :param interval:    Пауза между записями, секунды.
+    :param batch_size:  Максимальный размер пачки.
+    """
+
+    flush: RoundsFlush
+    interval: float
+    batch_size: int
+    _task: asyncio.Task | None = field(init=False, default=None)
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        Остановить задачу и записать оставшиеся раунды.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        await self.flush_all()
+
+    async def flush_all(self) -> None:
+        while True:
+            try:
+                flushed = await self.flush(self.batch_size)
+            except Exception:
+                logger.exception("Не удалось записать статистику раундов")
+                return
+            # очередь опустела, ждем следующего интервала
+            if flushed < self.batch_size:
+                return
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            await self.flush_all()
@@ -0,0 +1,61 @@
+from dataclasses import (
+    dataclass,
+    field,
+    replace,
+)
+from itertools import islice
+from typing import Collection
+
+from apps.users.models import RoundsEntity
+from apps.users.services.rounds.base import IRoundQueue
+
+
+@dataclass
+class MemoryRoundQueue(IRoundQueue):
+    """
+    Очередь раундов в памяти процесса. Незаписанные раунды видны только
+    воркеру, который их принял, и теряются при аварийной остановке.
+    """
+
+    _pending: dict[int, RoundsEntity] = field(init=False, default_factory=dict)
+    # раунды, которые записываются в БД в данный момент
+    _flushing: dict[int, RoundsEntity] = field(
+        init=False, default_factory=dict
+    )
+
+    async def put(
+        self,
+        profile_id: int,
+        score: int,
+        rights: int,
+        wrongs: int,
+        perfect_round: bool,
+    ) -> None:
+        rounds = self._pending.setdefault(profile_id, RoundsEntity())
+        rounds.add_round(score, rights, wrongs, perfect_round)
+
+    async def get(self, profile_id: int) -> RoundsEntity | None:
+        pending = self._pending.get(profile_id)
+        flushing = self._flushing.get(profile_id)
+        if pending is None and flushing is None:
+            return None
+
+        rounds = RoundsEntity()
+        for part in (pending, flushing):
+            if part is not None:
+                rounds.merge(part)
+        return rounds
+
+    async def take(self, limit: int) -> dict[int, RoundsEntity]:
+        assert not self._flushing, "Предыдущие раунды еще записываются"
+
+        for profile_id in list(islice(self._pending, limit)):
+            self._flushing[profile_id] = self._pending.pop(profile_id)
+        return {pk: replace(r) for pk, r in self._flushing.items()}
+
+    async def release(self, failed: Collection[int] = ()) -> None:
+        for profile_id in failed:
+            self._pending.setdefault(profile_id, RoundsEntity()).merge(
+                self._flushing[profile_id]
+            )
+        self._flushing = {}
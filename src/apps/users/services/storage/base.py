@@ -10,7 +10,9 @@ from typing import (
 
 from apps.users.models import (
     BestPlayerTitleEntity,
+    LadderKey,
     ProfileEntity,
+    RoundsEntity,
     StatisticEntity,
     UserEntity,
 )
@@ -66,6 +68,15 @@ class IProfileService(IRepository, ABC):
         :return:            Профиль.
         """
 
+    @abstractmethod
+    async def get_id_by_device(self, device_uuid: str) -> int | None:
+        """
+        Получить ID профиля по идентификатору устройства.
+
+        :param device_uuid: Уникальный идентификатор устройства.
+        :return:            ID профиля или None, если профиль не найден.
+        """
+
     @overload
     async def get_count(self, search: str | None = None) -> int:  # noqa
         """
@@ -167,6 +178,26 @@ class IStatisticService(IRepository, ABC, Generic[TModel]):
         :return:        Список статистик.
         """
 
+    @abstractmethod
+    async def get_ladder_page(
+        self,
+        key: LadderKey | None,
+        limit: int,
+        backward: bool = False,
+        inclusive: bool = False,
+    ) -> list[StatisticEntity]:
+        """
+        Возвращает страницу ладдера рядом с позицией key без OFFSET,
+        отсортированную по порядку в ладдере. Профиль подгружается
+        к статистике.
+
+        :param key:         Позиция в ладдере, None - начало ладдера.
+        :param limit:       Сколько записей получить.
+        :param backward:    Получить записи перед позицией, а не после.
+        :param inclusive:   Включить в выборку игрока на позиции.
+        :return:            Список статистик.
+        """
+
     @abstractmethod
     async def replace_profiles(self, new_place, old_place) -> None:
         """
@@ -207,6 +238,56 @@ class IStatisticService(IRepository, ABC, Generic[TModel]):
         :return:        Id профиля.
         """
 
+    @abstractmethod
+    async def get_by_profiles(
+        self, profile_ids: list[int]
+    ) -> list[StatisticEntity]:
+        """
+        Возвращает статистики указанных профилей в порядке profile_ids.
+        Профиль подгружается к статистике.
+
+        :param profile_ids: Id профилей.
+        :return:            Список статистик.
+        """
+
+    @abstractmethod
+    async def get_ranking_entries(self) -> list[tuple[int, int, int]]:
+        """
+        Возвращает данные всех статистик, по которым строится ладдер.
+
+        :return:    Список кортежей (profile_id, score, games).
+        """
+
+    @abstractmethod
+    async def apply_rounds(
+        self, rounds: dict[int, RoundsEntity], place: int
+    ) -> dict[int, StatisticEntity]:
+        """
+        Добавить результаты раундов к статистикам одним запросом.
+        Отсутствующие статистики создаются. Места не пересчитываются.
+
+        :param rounds:  Раунды по id профиля.
+        :param place:   Место для создаваемых статистик.
+        :return:        Обновленные статистики по id профиля, место
+                        в них прежнее.
+        """
+
+    @abstractmethod
+    async def update_places(self, places: list[tuple[int, int, int]]) -> None:
+        """
+        Записать новые места статистик одним запросом.
+
+        :param places:  Список кортежей (id статистики, место, тренд).
+        :return:        None.
+        """
+
+    @abstractmethod
+    async def rerank(self) -> None:
+        """
+        Пересчитать места всех статистик одним запросом. Тренд
+        статистик, сменивших место, равен смещению.
+        """
+
 
 @dataclass
 class IProfileTitleService(IRepository, ABC):
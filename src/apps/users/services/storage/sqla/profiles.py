@@ -22,6 +22,14 @@ class ORMProfileService(CommonRepository, IProfileService):
 
         return profile
 
+    async def get_id_by_device(self, device_uuid: str) -> int | None:
+        async with self._db.get_ro_session() as session:
+            query = select(self.model.id).where(
+                self.model.device_uuid == device_uuid
+            )
+            result = await session.execute(query)
+            return result.scalar_one_or_none()
+
     async def get_count(self, search: str | None = None) -> int:
         async with self._db.get_ro_session() as session:
             query = select(func.count(self.model.name))
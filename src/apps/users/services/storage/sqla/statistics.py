@@ -1,19 +1,36 @@
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Generic
 
+from loguru import logger
+
 from sqlalchemy import (
     and_,
+    column,
     delete,
     desc,
+    Integer,
+    or_,
     select,
     update,
+    values,
 )
-from sqlalchemy.orm import joinedload
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.sql import func
+from sqlalchemy.sql.selectable import Select
 
-from apps.users.exceptions.statistics import StatisticDoseNotExists
+from apps.users.exceptions.statistics import (
+    StatisticDoseNotExists,
+    StatisticIntegrityError,
+)
 from apps.users.models import (
+    BestPlayerTitle,
+    BestPlayerTitleEntity,
+    LadderKey,
     Profile,
+    ProfileEntity,
+    RoundsEntity,
     Statistic,
     StatisticEntity,
 )
@@ -21,9 +38,44 @@ from apps.users.services.storage import (
     IStatisticService,
     TModel,
 )
+from core.database.mapper import EntityMapper
 from core.database.repository.sqla import CommonRepository
 
 
+@lru_cache
+def statistic_mapper(model: type[TModel]) -> EntityMapper[StatisticEntity]:
+    """
+    Маппер статистики вместе с профилем и его титулом. Строки
+    выбираются с join профиля и outer join титула, профиль без
+    титула получает пустой титул, как и в Profile.to_entity.
+    """
+    return EntityMapper(
+        StatisticEntity,
+        id=model.id,
+        games=model.games,
+        score=model.score,
+        place=model.place,
+        rights=model.rights,
+        wrongs=model.wrongs,
+        trend=model.trend,
+        perfect_rounds=model.perfect_rounds,
+        profile=EntityMapper(
+            ProfileEntity,
+            id=Profile.id,
+            name=Profile.name,
+            device_uuid=Profile.device_uuid,
+            last_visit=Profile.last_visit,
+            title=EntityMapper(
+                BestPlayerTitleEntity,
+                optional=True,
+                missing=BestPlayerTitleEntity,
+                best_of_the_day=BestPlayerTitle.best_of_the_day,
+                best_of_the_month=BestPlayerTitle.best_of_the_month,
+            ),
+        ),
+    )
+
+
 @dataclass
 class ORMStatisticService(
     CommonRepository, IStatisticService, Generic[TModel]
@@ -104,19 +156,93 @@ class ORMStatisticService(
     ) -> list[StatisticEntity]:
         async with self._db.get_ro_session() as session:
             query = (
-                select(self.model)
+                self._select_ladder()
                 .order_by(self.model.place)
-                .join(self.model.profile)
-                .outerjoin(Profile.title)
-                .options(
-                    joinedload(self.model.profile).joinedload(Profile.title)
-                )
                 .offset(offset)
                 .limit(limit)
             )
-            orm_result = await session.execute(query)
-            statistics = orm_result.scalars().all()
-            return [s.to_entity() for s in statistics]
+            result = await session.execute(query)
+            return self._mapper.map_all(result.all())
+
+    async def get_ladder_page(
+        self,
+        key: LadderKey | None,
+        limit: int,
+        backward: bool = False,
+        inclusive: bool = False,
+    ) -> list[StatisticEntity]:
+        order_by = [
+            desc(self.model.score),
+            desc(self.model.games),
+            self.model.profile_id,
+        ]
+        if backward:
+            order_by = [
+                self.model.score,
+                self.model.games,
+                desc(self.model.profile_id),
+            ]
+
+        async with self._db.get_ro_session() as session:
+            query = self._select_ladder().order_by(*order_by).limit(limit)
+            if key is not None:
+                query = query.where(
+                    self._ladder_seek(key, backward, inclusive)
+                )
+            result = await session.execute(query)
+            statistics = self._mapper.map_all(result.all())
+            return statistics[::-1] if backward else statistics
+
+    @property
+    def _mapper(self) -> EntityMapper[StatisticEntity]:
+        return statistic_mapper(self.model)
+
+    def _select_ladder(self) -> Select:
+        """
+        Запрос колонок статистики с профилем и титулом для маппера.
+        """
+        return (
+            self._mapper.select()
+            .select_from(self.model)
+            .join(self.model.profile)
+            .outerjoin(Profile.title)
+        )
+
+    def _ladder_seek(self, key: LadderKey, backward: bool, inclusive: bool):
+        """
+        Условие отбора игроков после позиции key в порядке ладдера
+        (или перед ней, если backward). Направления сортировки колонок
+        разные, поэтому сравнение строк не подходит. По цепочке OR
+        индекс ладдера не используется, его использует избыточное
+        условие на очки: выборка начинается с позиции key в индексе.
+        """
+        if backward:
+            bound = self.model.score >= key.score
+            score = self.model.score > key.score
+            games = self.model.games > key.games
+            profile_id = self.model.profile_id < key.profile_id
+        else:
+            bound = self.model.score <= key.score
+            score = self.model.score < key.score
+            games = self.model.games < key.games
+            profile_id = self.model.profile_id > key.profile_id
+        if inclusive:
+            profile_id = or_(
+                profile_id, self.model.profile_id == key.profile_id
+            )
+
+        return and_(
+            bound,
+            or_(
+                score,
+                and_(self.model.score == key.score, games),
+                and_(
+                    self.model.score == key.score,
+                    self.model.games == key.games,
+                    profile_id,
+                ),
+            ),
+        )
 
     async def get_count_positive_score(self) -> int:
         async with self._db.get_ro_session() as session:
@@ -148,6 +274,126 @@ class ORMStatisticService(
             res = await session.execute(query)
             return res.scalar()
 
+    async def get_by_profiles(
+        self, profile_ids: list[int]
+    ) -> list[StatisticEntity]:
+        if not profile_ids:
+            return []
+
+        async with self._db.get_ro_session() as session:
+            query = self._select_ladder().where(
+                self.model.profile_id.in_(profile_ids)
+            )
+            result = await session.execute(query)
+            statistics = {
+                s.profile.id: s for s in self._mapper.map_all(result.all())
+            }
+            return [statistics[pk] for pk in profile_ids if pk in statistics]
+
+    async def get_ranking_entries(self) -> list[tuple[int, int, int]]:
+        async with self._db.get_ro_session() as session:
+            query = select(
+                self.model.profile_id,
+                self.model.score,
+                self.model.games,
+            )
+            result = await session.execute(query)
+            return [tuple(row) for row in result.all()]
+
+    async def apply_rounds(
+        self, rounds: dict[int, RoundsEntity], place: int
+    ) -> dict[int, StatisticEntity]:
+        if not rounds:
+            return {}
+
+        async with self._db.get_session() as session:
+            query = insert(self.model).values(
+                [
+                    dict(
+                        profile_id=profile_id,
+                        games=r.games,
+                        score=r.score,
+                        rights=r.rights,
+                        wrongs=r.wrongs,
+                        perfect_rounds=r.perfect_rounds,
+                        place=place,
+                        trend=0,
+                    )
+                    for profile_id, r in rounds.items()
+                ]
+            )
+            query = query.on_conflict_do_update(
+                index_elements=[self.model.profile_id],
+                set_=dict(
+                    games=self.model.games + query.excluded.games,
+                    score=self.model.score + query.excluded.score,
+                    rights=self.model.rights + query.excluded.rights,
+                    wrongs=self.model.wrongs + query.excluded.wrongs,
+                    perfect_rounds=(
+                        self.model.perfect_rounds
+                        + query.excluded.perfect_rounds
+                    ),
+                    trend=0,
+                ),
+            ).returning(self.model)
+            try:
+                result = await session.execute(query)
+            except IntegrityError as e:
+                logger.error(
+                    "Ошибка при записи раундов: {}\nпрофили: {}",
+                    e,
+                    list(rounds),
+                )
+                raise StatisticIntegrityError()
+            return {s.profile_id: s.to_entity() for s in result.scalars()}
+
+    async def update_places(self, places: list[tuple[int, int, int]]) -> None:
+        if not places:
+            return
+
+        async with self._db.get_session() as session:
+            new_places = values(
+                column("id", Integer),
+                column("place", Integer),
+                column("trend", Integer),
+                name="new_places",
+            ).data(places)
+            query = (
+                update(self.model)
+                .where(self.model.id == new_places.c.id)
+                .values(place=new_places.c.place, trend=new_places.c.trend)
+            )
+            await session.execute(query)
+
+    async def rerank(self) -> None:
+        async with self._db.get_session() as session:
+            ranked = select(
+                self.model.id,
+                func.row_number()
+                .over(
+                    order_by=[
+                        desc(self.model.score),
+                        desc(self.model.games),
+                        self.model.profile_id,
+                    ]
+                )
+                .label("rank"),
+            ).subquery()
+            query = (
+                update(self.model)
+                .where(
+                    and_(
+                        self.model.id == ranked.c.id,
+                        self.model.place != ranked.c.rank,
+                    )
+                )
+                .values(
+                    place=ranked.c.rank,
+                    trend=self.model.place - ranked.c.rank,
+                )
+            )
+            await session.execute(query)
+
 
 if __name__ == "__main__":
     import asyncio
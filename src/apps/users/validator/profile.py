@@ -1,20 +1,18 @@
 from dataclasses import dataclass
 
-import aiohttp
-
 from apps.users.exceptions.profile import (
     InvalidProfileName,
     ProfanityServiceNotAvailable,
     ProfileNameIsProfanity,
 )
 from core.constructor.validators import BaseValidator
-
-
-TIMEOUT = aiohttp.ClientTimeout(total=2)
+from services.profanity import IProfanityFilter
 
 
 @dataclass
 class ProfileValidator(BaseValidator):
+    profanity: IProfanityFilter
+
     async def validate(self, name: str | None = None) -> None:
         """
         Валидация имени пользователя.
@@ -26,19 +24,13 @@ class ProfileValidator(BaseValidator):
         if name is not None:
             await self._profile_name_validate(name)
 
-    @staticmethod
-    async def _profile_name_validate(name: str) -> None:
+    async def _profile_name_validate(self, name: str) -> None:
         if len(name) > 50:
             raise InvalidProfileName()
 
         try:
-            async with aiohttp.ClientSession(timeout=TIMEOUT) as session:
-                async with session.post(
-                    f"http://profanity:8000/censor-word/{name}"  # noqa: E231
-                ) as response:
-                    res = await response.text()
-                    if res == "true":
-                        raise ProfileNameIsProfanity()
+            if await self.profanity.is_profane(name):
+                raise ProfileNameIsProfanity()
         except TimeoutError:
             raise ProfanityServiceNotAvailable()
 
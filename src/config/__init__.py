@@ -1,10 +1,16 @@
 from config.config_builder import ConfigBuilder
 
+from .base_settings.auth import AuthConf
+from .base_settings.cache import CacheConf
 from .base_settings.common import GlobalConf
 from .base_settings.database import DatabaseConf
 from .base_settings.firebase import FirebaseConf
+from .base_settings.http import HttpConf
+from .base_settings.profanity import ProfanityConf
+from .base_settings.quiz import QuizConf
 from .base_settings.rabbitmq import RabbitMQConf
 from .base_settings.redis import RedisConf
+from .base_settings.statistic import StatisticConf
 
 
 class Settings(
@@ -13,6 +19,12 @@ class Settings(
     RedisConf,
     RabbitMQConf,
     FirebaseConf,
+    QuizConf,
+    StatisticConf,
+    CacheConf,
+    ProfanityConf,
+    HttpConf,
+    AuthConf,
 ):
     pass
 
@@ -0,0 +1,19 @@
+from pydantic_settings import BaseSettings
+
+
+class AuthConf(BaseSettings):
+    # сколько паролей bcrypt проверяется одновременно
+    password_hash_workers: int = 2
+    # сколько проверок пароля может ждать в очереди,
+    # следующие отклоняются
+    password_hash_queue: int = 32
+    # сколько проверенных jwt токенов хранить в памяти процесса
+    jwt_cache_size: int = 10_000
+    # брать админа из claim user в токене, не читая его из БД
+    jwt_trust_user_claim: bool = False
+    # ожидаемое число заблокированных refresh токенов
+    token_blacklist_capacity: int = 100_000
+    # доля ложных срабатываний фильтра черного списка токенов
+    token_blacklist_error_rate: float = 0.001
+    # как часто пересобирать фильтр черного списка из Redis, секунды
+    token_blacklist_sync_interval: float = 300.0
@@ -0,0 +1,25 @@
+from pydantic_settings import BaseSettings
+
+
+class CacheConf(BaseSettings):
+    # сколько секунд хранится число записей для пагинации
+    count_cache_ttl: float = 30.0
+    # сколько разных значений числа записей хранить (по таблице и поиску)
+    count_cache_size: int = 1024
+    # с какого числа записей в таблице брать оценку из pg_class
+    # вместо COUNT, 0 - всегда считать точно
+    count_estimate_threshold: int = 0
+    # сколько секунд хранится профиль устройства для проверки прав
+    device_cache_ttl: int = 300
+    # сколько устройств хранить в памяти процесса
+    device_cache_size: int = 100_000
+    # дублировать кеш устройств в Redis, общий для всех воркеров
+    device_cache_redis: bool = False
+    # сколько секунд хранятся настройки игры, если сообщение
+    # о их изменении не дошло до воркера
+    game_settings_cache_ttl: int = 300
+    # сколько секунд справочники хранятся в памяти процесса,
+    # изменения из других воркеров видны только по истечении
+    reference_cache_ttl: int = 60
+    # сколько секунд клиенты и CDN могут не перезапрашивать справочники
+    reference_cache_max_age: int = 600
@@ -8,6 +8,28 @@ class DatabaseConf(BaseSettings):
     db_host: str
     db_name: str
     db_port: int
+    # одна сессия и один коммит на HTTP запрос вместо коммита
+    # после каждого вызова репозитория
+    db_unit_of_work: bool = False
+    # пул соединений на запись, на каждый воркер
+    db_pool_size: int = 10
+    db_max_overflow: int = 5
+    # пул соединений на чтение, на каждый воркер
+    db_ro_pool_size: int = 10
+    db_ro_max_overflow: int = 5
+    # сколько секунд ждать свободное соединение из пула
+    db_pool_timeout: float = 30.0
+    # через сколько секунд пересоздавать соединение
+    db_pool_recycle: int = 1800
+    # размер кеша подготовленных выражений asyncpg на соединение,
+    # 0 - без кеша (нужно за pgbouncer в режиме транзакций)
+    db_statement_cache_size: int = 100
+    # адрес реплики для чтения, None - читать с основного сервера
+    db_replica_url: str | None = None
+    # таймаут подключения к реплике, секунды
+    db_replica_connect_timeout: float = 2.0
+    # сколько секунд не обращаться к реплике после ошибки
+    db_replica_retry_interval: int = 30
 
     @property
     def database_url(self):
@@ -11,6 +11,11 @@ class FirebaseConf(BaseSettings):
     scopes: list[str] = [
         "https://www.googleapis.com/auth/firebase.remoteconfig"
     ]
+    # раз в сколько секунд перечитывать api_key из RemoteConfig
+    firebase_config_ttl: int = 300
+    # не чаще скольких секунд перечитывать RemoteConfig,
+    # если пришел api_key, не совпавший с сохраненным
+    firebase_config_min_reload: int = 10
 
     @property
     def remote_config_endpoint(self):
@@ -0,0 +1,12 @@
+from pydantic_settings import BaseSettings
+
+
+class HttpConf(BaseSettings):
+    # максимум исходящих соединений всего
+    http_limit: int = 100
+    # максимум исходящих соединений к одному хосту
+    http_limit_per_host: int = 20
+    # сколько секунд держать простаивающее соединение открытым
+    http_keepalive_timeout: float = 30.0
+    # таймаут исходящего запроса по умолчанию, секунды
+    http_timeout: float = 10.0
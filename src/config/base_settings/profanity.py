@@ -0,0 +1,13 @@
+from pydantic_settings import BaseSettings
+
+
+class ProfanityConf(BaseSettings):
+    # файл словаря запрещенных слов для имен игроков
+    profanity_words_file: str = "services/profanity/words.txt"
+    # раз в сколько секунд проверять, не изменился ли словарь
+    profanity_reload_interval: int = 60
+    # адрес сервиса цензуры, им проверяются имена, если словарь
+    # не загрузился, None - без сервиса
+    profanity_url: str | None = None
+    # таймаут запроса к сервису цензуры, секунды
+    profanity_timeout: float = 2.0
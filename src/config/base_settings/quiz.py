@@ -0,0 +1,12 @@
+from pydantic_settings import BaseSettings
+
+
+class QuizConf(BaseSettings):
+    # через сколько секунд колода вопросов перечитывается из БД
+    question_deck_ttl: int = 600
+    # сколько секунд профиль не получает повторно показанные вопросы
+    seen_questions_period: int = 6 * 3600
+    # размер фильтра Блума показанных вопросов на профиль, бит
+    seen_questions_filter_bits: int = 2048
+    # число хеш-функций фильтра Блума
+    seen_questions_filter_hashes: int = 3
@@ -7,3 +7,11 @@ class RedisConf(BaseSettings):
     redis_pass: str
     redis_port: int
     redis_db_token: int
+    redis_db_quiz: int = 1
+    redis_db_ranking: int = 2
+    # максимальное число соединений в пуле одной базы
+    redis_max_connections: int = 50
+    # сколько секунд ждать свободное соединение из пула
+    redis_pool_timeout: int = 5
+    # раз в сколько секунд проверять простаивающее соединение
+    redis_health_check_interval: int = 30
@@ -0,0 +1,28 @@
+from enum import Enum
+
+from pydantic_settings import BaseSettings
+
+
+class RankingMode(Enum):
+    # места пересчитываются в БД после каждого раунда сдвигом игроков
+    shift: str = "shift"
+    # места считаются в Redis sorted set, в БД записывается только
+    # место сыгравшего игрока
+    ladder: str = "ladder"
+    # места в БД пересчитываются только по расписанию RankRebuilder
+    periodic: str = "periodic"
+
+
+class StatisticConf(BaseSettings):
+    # места в БД, как и раньше, ladder требует Redis и включается явно
+    ranking_mode: RankingMode = RankingMode.shift
+    # раз в сколько секунд места пересчитываются в БД, в режиме ladder
+    # ладдер строится из БД, только если его нет в Redis
+    rank_rebuild_interval: int = 300
+    # результаты раундов копятся в памяти воркера и записываются
+    # в БД пачками, ответ на запрос не ждет записи
+    statistic_write_behind: bool = False
+    # раз в сколько секунд накопленные раунды записываются в БД
+    statistic_flush_interval: float = 1.0
+    # сколько профилей записывать в БД за одну транзакцию
+    statistic_flush_batch: int = 500
@@ -18,11 +18,14 @@ class ConfigBuilder:
     def build_from_env(cls, config: Type[T]) -> T:
         attrs = {}
         for field, value in config.model_fields.items():
-            # преимущество над значением в init над env.
-            # если в init есть значение по умолчанию, значит оно не обязательно
-            # и мы записываем в конфиг значение по умолчанию, иначе ищем в env
+            # обязательные поля берутся только из env, необязательные
+            # из env, а если там их нет или значение пустое, например
+            # DB_REPLICA_URL=, - значение по умолчанию.
+            # строки из env приводит к типу поля pydantic
             if not value.is_required():
-                attrs.update({field: value.default})
+                attrs.update(
+                    {field: os.getenv(field.upper()) or value.default}
+                )
             else:
                 attrs.update({field: os.getenv(field.upper())})
         return config(**attrs)
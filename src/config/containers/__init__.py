@@ -2,9 +2,11 @@ from .containers import (
     Container,
     get_container,
 )
+from .di import request_scope
 
 
 __all__ = (
     get_container,
     Container,
+    request_scope,
 )
@@ -5,6 +5,10 @@ from apps.feedback.services.storage.base import IFeedbackService
 from apps.feedback.services.storage.sqla import ORMFeedbackService
 from apps.game_settings.actions import GameSettingsActions
 from apps.game_settings.models import GameSettings
+from apps.game_settings.services.cache import (
+    IGameSettingsCache,
+    RedisGameSettingsCache,
+)
 from apps.game_settings.services.storage.base import IGameSettingsService
 from apps.game_settings.services.storage.sqla import ORMGameSettingsService
 from apps.quiz.actions import (
@@ -19,6 +23,10 @@ from apps.quiz.models import (
     Question,
 )
 from apps.quiz.permissions.quiz import DevicePermissions
+from apps.quiz.services.deck.base import IQuestionDeck
+from apps.quiz.services.deck.memory import MemoryQuestionDeck
+from apps.quiz.services.seen.base import IQuestionSeenService
+from apps.quiz.services.seen.cache import RedisQuestionSeenService
 from apps.quiz.services.storage.base import (
     IAnswerService,
     ICategoryComplaintService,
@@ -51,6 +59,21 @@ from apps.users.permissions.profile import ProfilePermissions
 from apps.users.services.auth.jwt_auth.models import BlacklistRefreshToken
 from apps.users.services.auth.jwt_auth.storage.base import ITokenStorage
 from apps.users.services.auth.jwt_auth.storage.cache import RedisTokenStorage
+from apps.users.services.auth.pwd_hash import PasswordHasher
+from apps.users.services.devices import (
+    IDeviceCache,
+    MemoryDeviceCache,
+    RedisDeviceCache,
+)
+from apps.users.services.ranking import (
+    IRankingService,
+    LadderRankingService,
+    PeriodicRankingService,
+    RankRebuilder,
+    ShiftRankingService,
+)
+from apps.users.services.rounds.base import IRoundQueue
+from apps.users.services.rounds.memory import MemoryRoundQueue
 from apps.users.services.storage import (
     IProfileService,
     IProfileTitleService,
@@ -67,6 +90,7 @@ from apps.users.validator.profile import (
 )
 from config import settings
 from config.base_settings.common import EnvironVariables
+from config.base_settings.statistic import RankingMode
 from config.containers.di import (
     Container,
     ContainerBuilder,
@@ -80,6 +104,21 @@ from core.database.db import (
     Transaction,
 )
 from core.security.fingerprint_auth.device_validator import DeviceTokenValidate
+from services.count_cache import (
+    ICountCache,
+    MemoryCountCache,
+)
+from services.firebase import (
+    CredentialsProvider,
+    RemoteConfigCache,
+)
+from services.http_client import HttpClient
+from services.jwt_token.cache import VerifiedTokenCache
+from services.profanity import (
+    HttpProfanityFilter,
+    IProfanityFilter,
+    LocalProfanityFilter,
+)
 from services.redis_pool import RedisPool
 
 
@@ -125,7 +164,8 @@ class DiContainer:
     def __init_orm_containers(self):
         # обязательно синглтон, иначе пробьет лимит по подключениям
         self.builder.singleton(DatabaseConnection, DatabaseConnection)
-        self.builder.register(Database, Database, scope=Scope.cached)
+        # одна на запрос, вне запроса - одна на вызов resolve
+        self.builder.register(Database, Database, scope=Scope.request)
         self.builder.register(Transaction, Transaction)
 
         # users app
@@ -174,21 +214,184 @@ class DiContainer:
         self.builder.register(IFeedbackService, ORMFeedbackService, model=...)
 
     def __init_service_containers(self):
+        # одна сессия на процесс, чтобы переиспользовать соединения
+        self.builder.singleton(
+            HttpClient,
+            HttpClient,
+            limit=settings.http_limit,
+            limit_per_host=settings.http_limit_per_host,
+            keepalive_timeout=settings.http_keepalive_timeout,
+            timeout=settings.http_timeout,
+        )
+        self.builder.singleton(
+            CredentialsProvider,
+            CredentialsProvider,
+            service_account_file=settings.firebase_json_conf,
+            scopes=settings.scopes,
+        )
+        self.builder.singleton(
+            RemoteConfigCache,
+            RemoteConfigCache,
+            ttl=settings.firebase_config_ttl,
+            min_reload=settings.firebase_config_min_reload,
+        )
+
         self.builder.singleton(
             "RedisTokenDBConnection",
             RedisPool,
             db_number=settings.redis_db_token,
         )
 
-        self.builder.register(
+        # фильтр черного списка хранится в памяти процесса,
+        # поэтому синглтон
+        self.builder.singleton(
             ITokenStorage,
-            lambda: RedisTokenStorage(
-                self.container.resolve(
-                    "RedisTokenDBConnection",
-                )
-            ),
+            RedisTokenStorage,
+            storage=Dep("RedisTokenDBConnection"),
+            capacity=settings.token_blacklist_capacity,
+            error_rate=settings.token_blacklist_error_rate,
+            sync_interval=settings.token_blacklist_sync_interval,
         )
         self.builder.register(BlacklistRefreshToken, BlacklistRefreshToken)
+        # кеш проверенных токенов хранится в памяти процесса,
+        # поэтому синглтон
+        self.builder.singleton(
+            VerifiedTokenCache,
+            VerifiedTokenCache,
+            max_size=settings.jwt_cache_size,
+        )
+        # пул потоков bcrypt общий для процесса, поэтому синглтон
+        self.builder.singleton(
+            PasswordHasher,
+            PasswordHasher,
+            workers=settings.password_hash_workers,
+            queue_size=settings.password_hash_queue,
+        )
+
+        # колода вопросов хранится в памяти процесса, поэтому синглтон
+        self.builder.singleton(
+            IQuestionDeck,
+            MemoryQuestionDeck,
+            ttl=settings.question_deck_ttl,
+        )
+
+        self.builder.singleton(
+            "RedisQuizDBConnection",
+            RedisPool,
+            db_number=settings.redis_db_quiz,
+        )
+        self.builder.register(
+            IQuestionSeenService,
+            RedisQuestionSeenService,
+            storage=Dep("RedisQuizDBConnection"),
+            period=settings.seen_questions_period,
+            bits=settings.seen_questions_filter_bits,
+            hashes=settings.seen_questions_filter_hashes,
+        )
+
+        # кеш числа записей хранится в памяти процесса, поэтому синглтон
+        self.builder.singleton(
+            ICountCache,
+            MemoryCountCache,
+            ttl=settings.count_cache_ttl,
+            max_size=settings.count_cache_size,
+            estimate_threshold=settings.count_estimate_threshold,
+        )
+
+        # настройки игры хранятся в памяти процесса, поэтому синглтон
+        self.builder.singleton(
+            IGameSettingsCache,
+            RedisGameSettingsCache,
+            storage=Dep("RedisQuizDBConnection"),
+            ttl=settings.game_settings_cache_ttl,
+        )
+        self.__register_device_cache()
+        self.__register_profanity_filter()
+
+        self.builder.singleton(
+            "RedisRankingDBConnection",
+            RedisPool,
+            db_number=settings.redis_db_ranking,
+        )
+        self.__register_ranking(Statistic)
+        self.__register_ranking(DayStatistic)
+        self.__register_ranking(MonthStatistic)
+        # очередь раундов хранится в памяти процесса, поэтому синглтон
+        self.builder.singleton(IRoundQueue, MemoryRoundQueue)
+
+    def __register_device_cache(self):
+        # кеш устройств хранится в памяти процесса, поэтому синглтон
+        if not settings.device_cache_redis:
+            self.builder.singleton(
+                IDeviceCache,
+                MemoryDeviceCache,
+                ttl=settings.device_cache_ttl,
+                max_size=settings.device_cache_size,
+            )
+            return
+
+        self.builder.singleton(
+            "LocalDeviceCache",
+            MemoryDeviceCache,
+            ttl=settings.device_cache_ttl,
+            max_size=settings.device_cache_size,
+        )
+        self.builder.singleton(
+            IDeviceCache,
+            RedisDeviceCache,
+            storage=Dep("RedisTokenDBConnection"),
+            local=Dep("LocalDeviceCache"),
+            ttl=settings.device_cache_ttl,
+        )
+
+    def __register_profanity_filter(self):
+        # словарь хранится в памяти процесса, поэтому синглтон
+        if settings.profanity_url is None:
+            self.builder.singleton(
+                IProfanityFilter,
+                LocalProfanityFilter,
+                words_file=settings.profanity_words_file,
+                reload_interval=settings.profanity_reload_interval,
+                fallback=None,
+            )
+            return
+
+        self.builder.register(
+            "ProfanityFallback",
+            HttpProfanityFilter,
+            url=settings.profanity_url,
+            timeout=settings.profanity_timeout,
+        )
+        self.builder.singleton(
+            IProfanityFilter,
+            LocalProfanityFilter,
+            words_file=settings.profanity_words_file,
+            reload_interval=settings.profanity_reload_interval,
+            fallback=Dep("ProfanityFallback"),
+        )
+
+    def __register_ranking(self, model):
+        match settings.ranking_mode:
+            case RankingMode.ladder:
+                self.builder.register(
+                    IRankingService[model],
+                    LadderRankingService[model],
+                    storage=Dep("RedisRankingDBConnection"),
+                    model=model,
+                )
+            case RankingMode.shift:
+                self.builder.register(
+                    IRankingService[model],
+                    ShiftRankingService[model],
+                    model=model,
+                )
+            case RankingMode.periodic:
+                self.builder.register(
+                    IRankingService[model],
+                    PeriodicRankingService[model],
+                    model=model,
+                )
+        self.builder.register(RankRebuilder[model], RankRebuilder[model])
 
     def __init_validators_containers(self):
         self.builder.register(ProfileValidator, ProfileValidator)
@@ -227,6 +430,9 @@ class DiContainer:
             CompositeStatisticAction,
             actions=Dep("list_statistic_actions"),
             transaction=Dep(Transaction),
+            queue=Dep(IRoundQueue),
+            profile_repository=Dep(IProfileService),
+            write_behind=settings.statistic_write_behind,
         )
 
         self.builder.register(QuestionsActions, QuestionsActions)
@@ -1,10 +1,13 @@
 import copy
+from contextlib import contextmanager
+from contextvars import ContextVar
 from dataclasses import dataclass
 from enum import Enum
 from typing import (
     Any,
     Callable,
     Dict,
+    Iterator,
     Type,
     TypeVar,
     Union,
@@ -28,7 +31,29 @@ ObjType = Union[str, Type[_T]]
 class Scope(Enum):
     transient: int = 0
     singleton: int = 1
+    # общий экземпляр в пределах одного вызова resolve
     cached: int = 2
+    # общий экземпляр в пределах request_scope, вне его как cached
+    request: int = 3
+
+
+# экземпляры Scope.request текущего запроса
+_request_cache: ContextVar[dict | None] = ContextVar(
+    "request_cache", default=None
+)
+
+
+@contextmanager
+def request_scope() -> Iterator[None]:
+    """
+    Область запроса: все resolve внутри нее получают одни и те же
+    экземпляры зависимостей со Scope.request.
+    """
+    token = _request_cache.set({})
+    try:
+        yield
+    finally:
+        _request_cache.reset(token)
 
 
 @dataclass
@@ -67,25 +92,71 @@ def _update_localns(cls: ObjType[Any], localns: Dict[str, Any]) -> None:
         localns[cls] = cls
 
 
-class ResolutionCache:
-    def __init__(self):
-        self.cache: dict[str, Any] = {}
+class _Plan:
+    """
+    Заранее разобранная регистрация: фабрика, константы и планы
+    зависимостей. Сигнатура фабрики разбирается один раз при сборке
+    контейнера, а не при каждом resolve.
+    """
 
-    def __setitem__(self, key, instance):
-        self.cache[key] = instance
+    __slots__ = ("key", "factory", "scope", "constants", "deps", "resolved")
+
+    def __init__(
+        self,
+        registration: Registration,
+        resolved: Dict[ObjType[Any], Any],
+    ):
+        self.key = registration.cls
+        self.factory = registration.factory
+        self.scope = registration.scope
+        self.constants = _resolve_constants(registration.kwargs)
+        self.deps: tuple[tuple[str, "_Plan"], ...] = ()
+        self.resolved = resolved
+
+    def build(self, cache: dict, request_cache: dict) -> Any:
+        """
+        Создать экземпляр вместе с зависимостями.
+
+        :param cache:           Экземпляры Scope.cached текущего resolve.
+        :param request_cache:   Экземпляры Scope.request текущего запроса.
+        :return:                Экземпляр зарегистрированного типа.
+        """
+        if self.scope is Scope.singleton:
+            if self.key in self.resolved:
+                return self.resolved[self.key]
+        elif self.scope is Scope.cached:
+            if self in cache:
+                return cache[self]
+        elif self.scope is Scope.request:
+            if self in request_cache:
+                return request_cache[self]
+
+        args = self.constants.copy()
+        for name, dep in self.deps:
+            args[name] = dep.build(cache, request_cache)
+        result = self.factory(**args)
+
+        if self.scope is Scope.singleton:
+            self.resolved[self.key] = result
+        elif self.scope is Scope.cached:
+            cache[self] = result
+        elif self.scope is Scope.request:
+            request_cache[self] = result
+        return result  # noqa: R504
 
-    def __getitem__(self, key) -> Any:
-        return self.cache.get(key)
 
-    def has_cached(self, key) -> bool:
-        return key in self.cache
+class _MissingPlan:
+    __slots__ = ("key",)
 
-    def clear(self):
-        self.cache = {}
+    def __init__(self, key: ObjType[Any]):
+        self.key = key
+
+    def build(self, cache: dict, request_cache: dict) -> Any:
+        raise ContainerError(f"No dependency of type {self.key}")
 
 
 class Container(LibContainer):  # pylint: disable=R0903
-    __slots__ = ["_registry", "_localns", "_resolved", "_cache"]
+    __slots__ = ["_registry", "_localns", "_resolved", "_plans"]
 
     def __init__(
         self,
@@ -95,37 +166,41 @@ class Container(LibContainer):  # pylint: disable=R0903
         self._registry = registry
         self._localns = localns
         self._resolved: Dict[ObjType[Any], Any] = {}
-        self._cache = ResolutionCache()
+        self._plans: Dict[ObjType[Any], _Plan] | None = None
+
+    def compile(self) -> None:
+        """
+        Построить планы создания всех зарегистрированных типов.
+        Вызывается после того, как реестр заполнен.
+        """
+        plans = {
+            key: _Plan(registration, self._resolved)
+            for key, registration in self._registry.items()
+        }
+        for key, plan in plans.items():
+            deps = get_deps(self._registry[key], self._localns)
+            plan.deps = tuple(
+                (name, self._find_plan(plans, dep))
+                for name, dep in deps.items()
+            )
+        self._plans = plans
 
     def resolve(self, cls: ObjType[Any]) -> Any:
-        result = self.resolve_impl(cls)
-        self._cache.clear()
-        return result
+        if self._plans is None:
+            self.compile()
+        plan = self._find_plan(self._plans, cls)
+        cache: dict = {}
+        request_cache = _request_cache.get()
+        return plan.build(
+            cache, request_cache if request_cache is not None else cache
+        )
 
-    def resolve_impl(self, cls: ObjType[Any]) -> Any:
+    def _find_plan(
+        self, plans: Dict[ObjType[Any], _Plan], cls: ObjType[Any]
+    ) -> _Plan | _MissingPlan:
         cls = get_from_localns(cls, self._localns)
-
-        if cls in self._resolved:
-            return self._resolved[cls]
-
-        if self._cache.has_cached(cls):
-            return self._cache[cls]
-
-        try:
-            current = self._registry[cls]
-        except KeyError as e:
-            raise ContainerError(f"No dependency of type {cls}") from e
-
-        args = _resolve_constants(current.kwargs)
-        deps_to_resolve = get_deps(current, self._localns)
-        for key, d in deps_to_resolve.items():
-            args[key] = self.resolve_impl(d)
-        result = current.factory(**args)
-        if current.scope is Scope.singleton:
-            self._resolved[current.cls] = result
-        if current.scope is Scope.cached:
-            self._cache[cls] = result
-        return result  # noqa: R504
+        plan = plans.get(cls)
+        return plan if plan is not None else _MissingPlan(cls)
 
     def create_test_container(self) -> "TestContainer":
         registry = copy.deepcopy(self._registry)
@@ -138,6 +213,7 @@ class Container(LibContainer):  # pylint: disable=R0903
             kwargs={},
         )
         _update_localns(Container, localns)
+        test_container.compile()
         return test_container
 
 
@@ -168,6 +244,7 @@ class TestContainer(Container):
             kwargs={},
         )
         _update_localns(Container, localns)
+        container.compile()
         return container
 
     def with_overridden_singleton(
@@ -197,6 +274,7 @@ class ContainerBuilder(LibContainerBuilder):
         )
         _update_localns(Container, localns)
         self._check_resolvable(registry, localns)
+        container.compile()
         return container
 
     def singleton(
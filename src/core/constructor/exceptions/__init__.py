@@ -1,4 +1,8 @@
 from .base import BaseHTTPException
+from .pagination import InvalidPaginationCursor
 
 
-__all__ = ("BaseHTTPException",)
+__all__ = (
+    "BaseHTTPException",
+    "InvalidPaginationCursor",
+)
@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+from .base import BaseHTTPException
+
+
+@dataclass(eq=False)
+class InvalidPaginationCursor(BaseHTTPException):
+    code: int = 400
+    detail: str = "Некорректный курсор пагинации"
@@ -1,4 +1,9 @@
-from contextlib import asynccontextmanager
+import time
+from contextlib import (
+    asynccontextmanager,
+    contextmanager,
+)
+from contextvars import ContextVar
 from dataclasses import (
     dataclass,
     field,
@@ -6,13 +11,24 @@ from dataclasses import (
 from typing import (
     Any,
     AsyncGenerator,
+    Awaitable,
+    Callable,
+    Generator,
 )
 
 from loguru import logger
 
-from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy import (
+    event,
+    make_url,
+)
+from sqlalchemy.exc import (
+    DBAPIError,
+    SQLAlchemyError,
+)
 from sqlalchemy.ext.asyncio import (
     async_sessionmaker,
+    AsyncEngine,
     AsyncSession,
     create_async_engine,
 )
@@ -23,33 +39,119 @@ from config import settings
 
 Base = declarative_base()
 
+AfterCommit = Callable[[], Awaitable[Any]]
+
+
+async def _run_after_commit(callbacks: list[AfterCommit]) -> None:
+    # изменения уже закоммичены, поэтому ошибка одного действия
+    # не должна отменять остальные
+    for callback in callbacks:
+        try:
+            await callback()
+        except Exception:
+            logger.opt(exception=True).error("After commit error:\n")
+
+
+@dataclass
+class DatabaseMetrics:
+    """
+    Счетчики работы с БД за время жизни процесса. Внутри
+    measure_database те же события считаются и для текущего
+    контекста, например запроса.
+
+    :param checkouts:   Сколько раз соединение выдавалось из пула.
+    :param commits:     Число коммитов.
+    :param rollbacks:   Число откатов.
+    """
+
+    checkouts: int = 0
+    commits: int = 0
+    rollbacks: int = 0
+
+    def listen(self, engine: AsyncEngine) -> None:
+        event.listen(engine.sync_engine.pool, "checkout", self._on_checkout)
+        event.listen(engine.sync_engine, "commit", self._on_commit)
+        event.listen(engine.sync_engine, "rollback", self._on_rollback)
+
+    def _on_checkout(self, *_) -> None:
+        for metrics in self._targets():
+            metrics.checkouts += 1
+
+    def _on_commit(self, *_) -> None:
+        for metrics in self._targets():
+            metrics.commits += 1
+
+    def _on_rollback(self, *_) -> None:
+        for metrics in self._targets():
+            metrics.rollbacks += 1
+
+    def _targets(self) -> list["DatabaseMetrics"]:
+        scoped = _scoped_metrics.get()
+        return [self] if scoped is None else [self, scoped]
+
+
+_scoped_metrics: ContextVar[DatabaseMetrics | None] = ContextVar(
+    "database_metrics", default=None
+)
+
+
+@contextmanager
+def measure_database() -> Generator[DatabaseMetrics, None, None]:
+    """
+    Считать работу с БД в текущем контексте. События движков
+    приходят в контексте корутины, выполнившей запрос, поэтому
+    счетчики конкурентных запросов не смешиваются.
+
+    :return:    Генератор со счетчиками контекста.
+    """
+    metrics = DatabaseMetrics()
+    token = _scoped_metrics.set(metrics)
+    try:
+        yield metrics
+    finally:
+        _scoped_metrics.reset(token)
+
 
 class DatabaseConnection:
+    """
+    Движки БД: основной для записи и для чтения в режиме AUTOCOMMIT.
+    Если задан адрес реплики, чтения идут на нее, а пока реплика
+    недоступна - на основной сервер. Размеры пулов задаются
+    настройками и действуют в каждом воркере.
+    """
+
     def __init__(self):
-        db_engine = create_async_engine(
+        self.metrics = DatabaseMetrics()
+        db_engine = self._create_engine(
             settings.database_url,
-            pool_size=20,
-            max_overflow=10,
-            pool_pre_ping=False,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
             isolation_level="READ COMMITTED",
         )
-        self._session = async_sessionmaker(
-            bind=db_engine,
-            expire_on_commit=False,
-            class_=AsyncSession,
-        )
-        read_only_db_engine = create_async_engine(
+        self._session = self._create_sessionmaker(db_engine)
+        read_only_db_engine = self._create_engine(
             settings.database_url,
-            pool_size=20,
-            max_overflow=10,
-            pool_pre_ping=False,
+            pool_size=settings.db_ro_pool_size,
+            max_overflow=settings.db_ro_max_overflow,
             isolation_level="AUTOCOMMIT",
         )
-        self._read_only_session = async_sessionmaker(
-            bind=read_only_db_engine,
-            expire_on_commit=False,
-            class_=AsyncSession,
+        self._read_only_session = self._create_sessionmaker(
+            read_only_db_engine
         )
+        self._engines = [db_engine, read_only_db_engine]
+
+        self._replica_session = None
+        self._replica_retry_at = 0.0
+        if settings.db_replica_url is not None:
+            replica_engine = self._create_engine(
+                settings.db_replica_url,
+                pool_size=settings.db_ro_pool_size,
+                max_overflow=settings.db_ro_max_overflow,
+                isolation_level="AUTOCOMMIT",
+                connect_timeout=settings.db_replica_connect_timeout,
+            )
+            self._replica_session = self._create_sessionmaker(replica_engine)
+            self._engines.append(replica_engine)
 
     def get_session(self):
         return self._session
@@ -57,6 +159,178 @@ class DatabaseConnection:
     def get_ro_session(self):
         return self._read_only_session
 
+    async def open_ro_session(self) -> AsyncSession:
+        """
+        Открыть сессию для чтения на реплике, если она доступна,
+        иначе на основном сервере. Соединение берется сразу, чтобы
+        недоступность реплики обнаружилась до выполнения запроса.
+        После ошибки реплика не используется db_replica_retry_interval
+        секунд.
+
+        :return:    Сессия для чтения.
+        """
+        if (
+            self._replica_session is not None
+            and time.monotonic() >= self._replica_retry_at
+        ):
+            session = self._replica_session()
+            try:
+                await session.connection()
+                return session
+            except (DBAPIError, OSError):
+                await session.close()
+                logger.opt(exception=True).warning(
+                    "Реплика недоступна, чтение с основного сервера"
+                )
+                self._replica_retry_at = (
+                    time.monotonic() + settings.db_replica_retry_interval
+                )
+        return self._read_only_session()
+
+    async def dispose(self) -> None:
+        """
+        Закрыть соединения пулов всех движков.
+
+        :return:    None.
+        """
+        for engine in self._engines:
+            await engine.dispose()
+
+    def forget_connections(self) -> None:
+        """
+        Сбросить пулы после fork, не закрывая соединения: они
+        принадлежат родительскому процессу, а дочерний откроет свои.
+
+        :return:    None.
+        """
+        for engine in self._engines:
+            engine.sync_engine.dispose(close=False)
+
+    def _create_engine(
+        self,
+        url: str,
+        pool_size: int,
+        max_overflow: int,
+        isolation_level: str,
+        connect_timeout: float | None = None,
+    ) -> AsyncEngine:
+        connect_args = {}
+        url = make_url(url)
+        if url.get_driver_name() == "asyncpg":
+            # 0 отключает кеш подготовленных выражений,
+            # это нужно за pgbouncer в режиме транзакций
+            connect_args["statement_cache_size"] = (
+                settings.db_statement_cache_size
+            )
+            url = url.update_query_dict(
+                {
+                    "prepared_statement_cache_size": str(
+                        settings.db_statement_cache_size
+                    )
+                }
+            )
+            if connect_timeout is not None:
+                connect_args["timeout"] = connect_timeout
+
+        engine = create_async_engine(
+            url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+            pool_pre_ping=False,
+            isolation_level=isolation_level,
+            connect_args=connect_args,
+        )
+        self.metrics.listen(engine)
+        return engine
+
+    @staticmethod
+    def _create_sessionmaker(engine: AsyncEngine) -> async_sessionmaker:
+        return async_sessionmaker(
+            bind=engine,
+            expire_on_commit=False,
+            class_=AsyncSession,
+        )
+
+
+@dataclass
+class UnitOfWork:
+    """
+    Единица работы запроса: все репозитории, вызванные за время
+    запроса, пишут через одну сессию, а коммит один - в конце
+    запроса. Сессия открывается при первой записи, поэтому запросы
+    только на чтение соединение на запись не занимают.
+    """
+
+    connection: DatabaseConnection
+    _session: AsyncSession | None = field(init=False, default=None)
+    _after_commit: list[AfterCommit] = field(init=False, default_factory=list)
+
+    @property
+    def has_session(self) -> bool:
+        return self._session is not None
+
+    def on_commit(self, callback: AfterCommit) -> None:
+        self._after_commit.append(callback)
+
+    def get_session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = self.connection.get_session()()
+        return self._session
+
+    async def complete(self, commit: bool) -> None:
+        """
+        Завершить единицу работы.
+
+        :param commit:  Закоммитить изменения, иначе откатить.
+        :return:        None.
+        """
+        if not commit:
+            self._after_commit.clear()
+        if self._session is None:
+            return
+        try:
+            if commit:
+                await self._session.commit()
+            else:
+                await self._session.rollback()
+        finally:
+            await self._session.close()
+            self._session = None
+
+
+_unit_of_work: ContextVar[UnitOfWork | None] = ContextVar(
+    "unit_of_work", default=None
+)
+
+
+@asynccontextmanager
+async def unit_of_work(
+    connection: DatabaseConnection,
+) -> AsyncGenerator[UnitOfWork, None]:
+    """
+    Открыть единицу работы для текущего контекста, например запроса.
+    Изменения коммитятся при выходе, при исключении откатываются.
+    Действия, отложенные до коммита, выполняются уже вне единицы
+    работы, поэтому их записи в БД коммитятся сразу.
+
+    :param connection:  Подключение к БД.
+    :return:            Асинхронный генератор.
+    """
+    uow = UnitOfWork(connection)
+    token = _unit_of_work.set(uow)
+    try:
+        yield uow
+    except Exception:
+        await uow.complete(commit=False)
+        raise
+    else:
+        await uow.complete(commit=True)
+    finally:
+        _unit_of_work.reset(token)
+    await _run_after_commit(uow._after_commit)
+
 
 @dataclass
 class Database:
@@ -64,11 +338,40 @@ class Database:
     __in_transaction: bool = field(init=False, default=False)
     __session: AsyncSession | None = field(init=False, default=None)
     __ro_session: AsyncSession | None = field(init=False, default=None)
+    __after_commit: list[AfterCommit] = field(init=False, default_factory=list)
+    __wrote: bool = field(init=False, default=False)
+
+    async def on_commit(self, callback: AfterCommit) -> None:
+        """
+        Выполнить действие после коммита текущей транзакции или
+        единицы работы, а вне них - сразу. При откате действие
+        отменяется. Так изменения в кешах и Redis не расходятся
+        с БД и не видны другим воркерам раньше самих записей.
+
+        :param callback:    Корутинная функция без аргументов.
+        :return:            None.
+        """
+        if self.__in_transaction:
+            self.__after_commit.append(callback)
+            return
+        uow = _unit_of_work.get()
+        if uow is not None:
+            uow.on_commit(callback)
+            return
+        await callback()
 
     @asynccontextmanager
     async def get_session(self) -> AsyncGenerator[AsyncSession, Any]:
+        uow = _unit_of_work.get()
+        if uow is not None and not self.__in_transaction:
+            # коммит будет один, в конце единицы работы
+            async with self.__uow_session(uow) as session:
+                yield session
+            return
+
         if self.__session is None:
             self.__session = self.__connection.get_session()()
+        self.__wrote = True
         try:
             yield self.__session
         except SQLAlchemyError:
@@ -84,16 +387,44 @@ class Database:
 
     @asynccontextmanager
     async def get_ro_session(self) -> AsyncGenerator[AsyncSession, Any]:
-        if self.__ro_session is None:
-            self.__ro_session = self.__connection.get_ro_session()()
+        uow = _unit_of_work.get()
+        if uow is not None and uow.has_session and not self.__in_transaction:
+            # после записи читаем через сессию единицы работы,
+            # иначе не увидим еще не закоммиченные изменения
+            async with self.__uow_session(uow) as session:
+                yield session
+            return
+
+        # вне транзакции каждое чтение получает свою сессию,
+        # поэтому запросы на чтение можно выполнять конкурентно.
+        # После записи читаем с основного сервера: реплика
+        # может еще не получить закоммиченные изменения
+        if self.__in_transaction:
+            session = self.__ro_session
+        elif self.__wrote:
+            session = self.__connection.get_ro_session()()
+        else:
+            session = await self.__connection.open_ro_session()
         try:
-            yield self.__ro_session
+            yield session
         except SQLAlchemyError:
             logger.opt(exception=True).error("Session error:\n")
             raise
         finally:
             if not self.__in_transaction:
-                await self.__ro_session.close()
+                await session.close()
+
+    @asynccontextmanager
+    async def __uow_session(
+        self, uow: UnitOfWork
+    ) -> AsyncGenerator[AsyncSession, Any]:
+        session = uow.get_session()
+        try:
+            yield session
+        except SQLAlchemyError:
+            logger.opt(exception=True).error("Session error:\n")
+            raise
+        await session.flush()
 
     @asynccontextmanager
     async def _transaction(self) -> AsyncGenerator[None, None]:
@@ -103,6 +434,27 @@ class Database:
         if self.__in_transaction:
             raise RuntimeError("Repository already begun transaction")
 
+        uow = _unit_of_work.get()
+        if uow is not None:
+            # внутри единицы работы транзакция - это точка сохранения,
+            # при ошибке откатываются только ее изменения
+            self.__in_transaction = True
+            self.__session = self.__ro_session = uow.get_session()
+            try:
+                async with self.__session.begin_nested():
+                    yield
+            except Exception:
+                self.__after_commit.clear()
+                raise
+            finally:
+                self.__in_transaction = False
+                self.__session = self.__ro_session = None
+            # действия выполнятся после коммита единицы работы
+            for callback in self.__after_commit:
+                uow.on_commit(callback)
+            self.__after_commit.clear()
+            return
+
         # Внутри транзакции сессия на запись и чтения должна быть одна,
         # чтобы можно было внутри транзакции читать изменения. Также для
         # удобства сессии созданы тут, чтобы избежать ошибки в finally блоке,
@@ -114,11 +466,14 @@ class Database:
             yield
         except Exception as error:
             await self.__session.rollback()
+            self.__after_commit.clear()
             raise error
         finally:
             await self.__session.commit()
             await self.__session.close()
             self.__in_transaction = False
+        callbacks, self.__after_commit = self.__after_commit, []
+        await _run_after_commit(callbacks)
 
 
 @dataclass
@@ -141,3 +496,13 @@ class Transaction:
         """
         async with self.__db._transaction():  # noqa
             yield
+
+    async def on_commit(self, callback: AfterCommit) -> None:
+        """
+        Выполнить действие после коммита транзакции,
+        см. Database.on_commit.
+
+        :param callback:    Корутинная функция без аргументов.
+        :return:            None.
+        """
+        await self.__db.on_commit(callback)
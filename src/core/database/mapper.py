@@ -0,0 +1,91 @@
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Iterable,
+    Sequence,
+    TypeVar,
+)
+
+from sqlalchemy import select
+from sqlalchemy.sql.elements import ColumnElement
+from sqlalchemy.sql.selectable import Select
+
+
+TEntity = TypeVar("TEntity")
+
+
+class EntityMapper(Generic[TEntity]):
+    """
+    Преобразование строк выборки в Entity без ORM объектов.
+    Поля Entity сопоставляются колонкам, вложенные Entity - другим
+    мапперам. По описанию один раз генерируется функция-конвертер,
+    которая собирает Entity из кортежа по позициям колонок:
+    Entity(id=row[0], profile=ProfileEntity(id=row[1], ...)).
+    Колонки вложенных мапперов идут в выборке следом за колонками
+    родителя, лишние колонки в конце строки конвертер не трогает.
+
+    Вложенный маппер с optional=True используется для outer join:
+    если первая его колонка NULL, вместо Entity подставляется
+    результат missing() или None. Поэтому первой колонкой такого
+    маппера должна быть колонка, которая не бывает NULL в БД.
+
+    :param entity:      Класс Entity.
+    :param optional:    Связанной строки может не быть.
+    :param missing:     Фабрика значения для отсутствующей строки.
+    :param fields:      Поле Entity - колонка или вложенный маппер.
+    """
+
+    def __init__(
+        self,
+        entity: type[TEntity],
+        optional: bool = False,
+        missing: Callable[[], Any] | None = None,
+        **fields: "ColumnElement | EntityMapper",
+    ) -> None:
+        self.entity = entity
+        self.optional = optional
+        self.missing = missing
+        self.fields = fields
+        self.columns: list[ColumnElement] = []
+        namespace: dict[str, Any] = {}
+        source = self._source(self.columns, namespace)
+        exec(f"def convert(row):\n    return {source}\n", namespace)
+        self.convert: Callable[[Sequence], TEntity] = namespace["convert"]
+
+    def select(self, *extra: ColumnElement) -> Select:
+        """
+        Запрос колонок маппера, extra добавляются в конец строки.
+        """
+        return select(*self.columns, *extra)
+
+    def map_all(self, rows: Iterable[Sequence]) -> list[TEntity]:
+        return list(map(self.convert, rows))
+
+    def _source(
+        self, columns: list[ColumnElement], namespace: dict[str, Any]
+    ) -> str:
+        """
+        Выражение сборки Entity, колонки маппера дописываются в columns.
+        """
+        name = f"entity_{len(namespace)}"
+        namespace[name] = self.entity
+        first = len(columns)
+        args = []
+        for field_name, value in self.fields.items():
+            if isinstance(value, EntityMapper):
+                nested = value._source(columns, namespace)
+                args.append(f"{field_name}={nested}")
+            else:
+                args.append(f"{field_name}=row[{len(columns)}]")
+                columns.append(value)
+
+        source = f"{name}({', '.join(args)})"
+        if not self.optional:
+            return source
+
+        missing = "None"
+        if self.missing is not None:
+            missing = f"missing_{len(namespace)}()"
+            namespace[missing[:-2]] = self.missing
+        return f"({source} if row[{first}] is not None else {missing})"
@@ -3,7 +3,10 @@ from abc import (
     abstractmethod,
 )
 from dataclasses import dataclass
-from typing import TypeVar
+from typing import (
+    Any,
+    TypeVar,
+)
 
 from core.database.db import Base
 
@@ -31,6 +34,15 @@ class IRepository(ABC):
         :return: число записей
         """
 
+    @abstractmethod
+    async def get_estimated_count(self) -> int | None:
+        """
+        Получить оценку количества записей в БД из статистики
+        планировщика, без подсчета строк.
+
+        :return: оценка числа записей или None, если статистики нет
+        """
+
     @abstractmethod
     async def get_one(self, **filter_by): ...
 
@@ -60,3 +72,26 @@ class IRepository(ABC):
         :param pk:  ID объекта.
         :return:    None.
         """
+
+
+@dataclass
+class IReferenceRepository(IRepository, ABC):
+    """
+    Репозиторий справочника: небольшой таблицы, которая меняется редко
+    и поэтому может целиком храниться в памяти.
+    """
+
+    @abstractmethod
+    async def get_list_with_etag(self) -> tuple[list[Any], str]:
+        """
+        Получить все записи справочника вместе с их ETag.
+
+        :return: Кортеж из списка записей и ETag.
+        """
+
+    @abstractmethod
+    def invalidate(self) -> None:
+        """
+        Сбросить записи справочника, при следующем
+        обращении они будут перечитаны из БД.
+        """
@@ -0,0 +1,106 @@
+import json
+import time
+import hashlib
+from dataclasses import (
+    asdict,
+    dataclass,
+)
+from typing import (
+    Any,
+    ClassVar,
+    Generic,
+)
+
+from config import settings
+from core.database.repository.base import (
+    IReferenceRepository,
+    TModel,
+)
+from core.database.repository.sqla import CommonRepository
+
+
+@dataclass
+class _ReferenceData:
+    rows: list[Any]
+    ids: set[int]
+    etag: str
+    expire_at: float
+
+
+@dataclass
+class ReferenceRepository(
+    CommonRepository, IReferenceRepository, Generic[TModel]
+):
+    """
+    Репозиторий небольшого, редко меняющегося справочника. Таблица
+    читается целиком один раз и хранится в памяти процесса, общей для
+    всех экземпляров репозитория этой модели. Данные перечитываются
+    по истечении reference_cache_ttl секунд или после изменения
+    справочника через этот репозиторий. Другие воркеры и изменения
+    в обход приложения узнаются только по ttl, поэтому отсутствие
+    записи в памяти проверяется в БД.
+    """
+
+    _data: ClassVar[dict[type, _ReferenceData]] = {}
+
+    async def get_list(self, **filter_by):
+        if filter_by:
+            return await super().get_list(**filter_by)
+        data = await self._load()
+        return list(data.rows)
+
+    async def get_list_with_etag(self) -> tuple[list[Any], str]:
+        data = await self._load()
+        return list(data.rows), data.etag
+
+    async def exists(self, **filter_by) -> bool | None:
+        if filter_by.keys() != {"id"}:
+            return await super().exists(**filter_by)
+        data = await self._load()
+        if filter_by["id"] in data.ids:
+            return True
+        # запись могла появиться после загрузки справочника
+        if not await super().exists(**filter_by):
+            return False
+        self.invalidate()
+        return True
+
+    async def create(self, **data):
+        obj = await super().create(**data)
+        await self._db.on_commit(self._invalidate)
+        return obj
+
+    async def update(self, pk, **fields):
+        obj = await super().update(pk, **fields)
+        await self._db.on_commit(self._invalidate)
+        return obj
+
+    async def delete(self, pk: int) -> None:
+        await super().delete(pk)
+        await self._db.on_commit(self._invalidate)
+
+    def invalidate(self) -> None:
+        self._data.pop(self.model, None)
+
+    async def _invalidate(self) -> None:
+        # до коммита справочник перечитался бы со старыми данными
+        self.invalidate()
+
+    async def _load(self) -> _ReferenceData:
+        data = self._data.get(self.model)
+        if data is not None and time.monotonic() < data.expire_at:
+            return data
+
+        rows = await super().get_list()
+        payload = json.dumps(
+            [asdict(row) for row in rows], sort_keys=True, default=str
+        )
+        digest = hashlib.blake2b(payload.encode(), digest_size=8)
+        data = _ReferenceData(
+            rows=rows,
+            ids={row.id for row in rows},
+            etag=f'"{digest.hexdigest()}"',
+            expire_at=time.monotonic() + settings.reference_cache_ttl,
+        )
+        self._data[self.model] = data
+        return data
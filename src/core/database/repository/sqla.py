@@ -5,11 +5,15 @@ from typing import (
 )
 
 from sqlalchemy import (
+    BigInteger,
+    cast,
+    column,
     delete,
     exists,
     func,
     insert,
     select,
+    table,
     update,
 )
 from sqlalchemy.exc import (
@@ -42,6 +46,22 @@ class CommonRepository(IRepository, Generic[TModel]):
             result = await session.execute(query)
             return result.scalar_one()
 
+    async def get_estimated_count(self) -> int | None:
+        async with self._db.get_ro_session() as session:
+            query = (
+                select(cast(column("reltuples"), BigInteger))
+                .select_from(table("pg_class"))
+                .where(
+                    column("oid") == func.to_regclass(self.model.__tablename__)
+                )
+            )
+            result = await session.execute(query)
+            estimate = result.scalar()
+            # для таблицы, по которой еще не собрана статистика, -1
+            if estimate is None or estimate < 0:
+                return None
+            return estimate
+
     async def get_one(self, **filter_by):
         async with self._db.get_ro_session() as session:
             query = select(self.model).filter_by(**filter_by)
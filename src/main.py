@@ -1,4 +1,7 @@
+from contextlib import asynccontextmanager
+
 from api.routers import routers
+from loguru import logger
 
 from fastapi import (
     FastAPI,
@@ -7,8 +10,72 @@ from fastapi import (
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
+from apps.game_settings.services.cache import IGameSettingsCache
+from apps.users.actions import CompositeStatisticAction
+from apps.users.services.auth.jwt_auth.storage.base import ITokenStorage
+from apps.users.services.auth.pwd_hash import PasswordHasher
+from apps.users.services.rounds.flusher import RoundFlusher
 from config import settings
+from config.base_settings.common import EnvironVariables
+from config.containers import (
+    get_container,
+    request_scope,
+)
 from core.constructor.exceptions import BaseHTTPException
+from core.database.db import (
+    DatabaseConnection,
+    measure_database,
+    unit_of_work,
+)
+from services.firebase import RemoteConfigCache
+from services.http_client import HttpClient
+from services.redis_pool import RedisPool
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    container = get_container()
+    http_client: HttpClient = container.resolve(HttpClient)
+    http_client.open()
+    remote_config: RemoteConfigCache = container.resolve(RemoteConfigCache)
+    game_settings: IGameSettingsCache = container.resolve(IGameSettingsCache)
+    game_settings.start()
+    password_hasher: PasswordHasher = container.resolve(PasswordHasher)
+    token_storage: ITokenStorage = container.resolve(ITokenStorage)
+    token_storage.start()
+
+    flusher = None
+    if settings.statistic_write_behind:
+
+        async def flush(limit: int) -> int:
+            composite: CompositeStatisticAction = container.resolve(
+                CompositeStatisticAction
+            )
+            return await composite.flush(limit)
+
+        flusher = RoundFlusher(
+            flush=flush,
+            interval=settings.statistic_flush_interval,
+            batch_size=settings.statistic_flush_batch,
+        )
+        flusher.start()
+
+    if settings.environ is EnvironVariables.prod:
+        remote_config.start()
+
+    yield
+
+    await remote_config.stop()
+    await game_settings.stop()
+    await token_storage.stop()
+    if flusher is not None:
+        await flusher.stop()
+    password_hasher.close()
+    await http_client.close()
+    connection: DatabaseConnection = container.resolve(DatabaseConnection)
+    logger.info("Метрики БД воркера: {}", connection.metrics)
+    await connection.dispose()
+    await RedisPool.close_all()
 
 
 def create_app() -> FastAPI:
@@ -17,6 +84,7 @@ def create_app() -> FastAPI:
         docs_url="/api/docs",
         description="Mobile application",
         debug=settings.debug,
+        lifespan=lifespan,
     )
 
     @app.exception_handler(BaseHTTPException)
@@ -43,5 +111,33 @@ def create_app() -> FastAPI:
         allow_headers=["*"],
     )
 
+    @app.middleware("http")
+    async def request_scope_middleware(request: Request, call_next):
+        # зависимости со Scope.request общие для всех resolve запроса
+        with request_scope():
+            return await call_next(request)
+
+    if settings.db_unit_of_work:
+        connection: DatabaseConnection = get_container().resolve(
+            DatabaseConnection
+        )
+
+        @app.middleware("http")
+        async def unit_of_work_middleware(request: Request, call_next):
+            with measure_database() as metrics:
+                async with unit_of_work(connection) as uow:
+                    response = await call_next(request)
+                    if response.status_code >= 500:
+                        await uow.complete(commit=False)
+            logger.debug(
+                "{} {}: соединений из пула {}, коммитов {}, откатов {}",
+                request.method,
+                request.url.path,
+                metrics.checkouts,
+                metrics.commits,
+                metrics.rollbacks,
+            )
+            return response
+
     app.include_router(routers, prefix="/api/v1")
     return app
@@ -0,0 +1,4 @@
+from .filter import BloomFilter
+
+
+__all__ = ("BloomFilter",)
@@ -0,0 +1,44 @@
+import math
+import hashlib
+
+
+class BloomFilter:
+    """
+    Фильтр Блума в памяти процесса. Отвечает, что элемента точно
+    нет или что он, вероятно, есть. Размер и число хеш-функций
+    подбираются по ожидаемому числу элементов и доле ложных
+    срабатываний, при переполнении доля ложных срабатываний растет.
+    Удалять элементы нельзя, фильтр пересоздается целиком.
+
+    :param capacity:    Ожидаемое число элементов.
+    :param error_rate:  Допустимая доля ложных срабатываний.
+    """
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        capacity = max(capacity, 1)
+        self.bits = math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        )
+        self.hashes = max(1, round(self.bits / capacity * math.log(2)))
+        self.count = 0
+        self._array = bytearray((self.bits + 7) // 8)
+
+    def add(self, item: str) -> None:
+        for offset in self._offsets(item):
+            self._array[offset >> 3] |= 1 << (offset & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self._array[offset >> 3] & (1 << (offset & 7))
+            for offset in self._offsets(item)
+        )
+
+    def _offsets(self, item: str) -> list[int]:
+        """
+        Номера битов элемента, двойное хеширование.
+        """
+        digest = hashlib.blake2b(item.encode(), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        return [(h1 + i * h2) % self.bits for i in range(self.hashes)]
@@ -0,0 +1,8 @@
+from .base import ICountCache
+from .memory import MemoryCountCache
+
+
+__all__ = (
+    "ICountCache",
+    "MemoryCountCache",
+)
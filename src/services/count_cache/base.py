@@ -0,0 +1,50 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+from typing import (
+    Awaitable,
+    Callable,
+)
+
+
+Counter = Callable[[], Awaitable[int]]
+Estimator = Callable[[], Awaitable[int | None]]
+
+
+@dataclass
+class ICountCache(ABC):
+    """
+    Кеш числа записей для пагинации. Значения сгруппированы
+    по пространствам имен, обычно одно пространство на таблицу.
+    """
+
+    @abstractmethod
+    async def get_or_count(
+        self,
+        namespace: str,
+        counter: Counter,
+        key: str | None = None,
+        estimator: Estimator | None = None,
+    ) -> int:
+        """
+        Получить число записей из кеша, при промахе посчитать его.
+
+        :param namespace:   Пространство имен, например имя таблицы.
+        :param counter:     Корутина точного подсчета записей.
+        :param key:         Условие фильтрации, None - без фильтрации.
+        :param estimator:   Корутина оценки числа записей без фильтрации,
+                            если оценки нет - возвращает None.
+        :return:            Число записей.
+        """
+
+    @abstractmethod
+    async def invalidate(self, namespace: str) -> None:
+        """
+        Сбросить все значения пространства имен. Вызывается
+        при создании и удалении записей.
+
+        :param namespace:   Пространство имен.
+        :return:            None.
+        """
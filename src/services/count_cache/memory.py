@@ -0,0 +1,67 @@
+import time
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from services.count_cache.base import (
+    Counter,
+    Estimator,
+    ICountCache,
+)
+
+
+@dataclass
+class MemoryCountCache(ICountCache):
+    """
+    Кеш числа записей в памяти процесса с вытеснением давно
+    не запрошенных значений. Сброс значений действует только
+    в текущем процессе, остальные воркеры увидят изменения
+    по истечении ttl.
+
+    :param ttl:                 Сколько секунд хранится значение.
+    :param max_size:            Максимальное число значений в кеше.
+    :param estimate_threshold:  С какого числа записей вместо точного
+                                подсчета использовать оценку,
+                                0 - всегда считать точно.
+    """
+
+    ttl: float
+    max_size: int
+    estimate_threshold: int
+    _counts: OrderedDict[tuple[str, str | None], tuple[int, float]] = field(
+        init=False, default_factory=OrderedDict
+    )
+
+    async def get_or_count(
+        self,
+        namespace: str,
+        counter: Counter,
+        key: str | None = None,
+        estimator: Estimator | None = None,
+    ) -> int:
+        cache_key = (namespace, key)
+        cached = self._counts.get(cache_key)
+        if cached is not None and cached[1] > time.monotonic():
+            self._counts.move_to_end(cache_key)
+            return cached[0]
+
+        count = None
+        if key is None and estimator is not None and self.estimate_threshold:
+            estimate = await estimator()
+            # на небольших таблицах оценка неточна, а подсчет дешевый
+            if estimate is not None and estimate >= self.estimate_threshold:
+                count = estimate
+        if count is None:
+            count = await counter()
+
+        self._counts[cache_key] = (count, time.monotonic() + self.ttl)
+        self._counts.move_to_end(cache_key)
+        while len(self._counts) > self.max_size:
+            self._counts.popitem(last=False)
+        return count
+
+    async def invalidate(self, namespace: str) -> None:
+        for cache_key in [k for k in self._counts if k[0] == namespace]:
+            del self._counts[cache_key]
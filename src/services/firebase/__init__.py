@@ -1,4 +1,14 @@
-from .firebase import check_firebase_apikey
+from .cache import RemoteConfigCache
+from .credentials import CredentialsProvider
+from .firebase import (
+    change_api_key,
+    check_firebase_apikey,
+)
 
 
-__all__ = ("check_firebase_apikey",)
+__all__ = (
+    "CredentialsProvider",
+    "RemoteConfigCache",
+    "change_api_key",
+    "check_firebase_apikey",
+)
@@ -0,0 +1,119 @@
+import time
+import asyncio
+from contextlib import suppress
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from google.oauth2.service_account import Credentials
+from loguru import logger
+
+from services.firebase.credentials import CredentialsProvider
+from services.firebase.query import (
+    _get_api_key,
+    _get_remote_config,
+)
+from services.http_client import HttpClient
+
+
+@dataclass
+class RemoteConfigCache:
+    """
+    Учетные данные сервисного аккаунта и текущий api_key из Firebase
+    RemoteConfig в памяти процесса. Фоновая задача раз в ttl секунд
+    перечитывает конфиг и заранее обновляет токен доступа, поэтому
+    проверка api_key не обращается к Firebase. Ключ меняется задачей
+    Celery в другом процессе, поэтому при несовпадении ключа конфиг
+    перечитывается, но не чаще раза в min_reload секунд.
+
+    :param provider:    Учетные данные сервисного аккаунта.
+    :param client:      HTTP клиент.
+    :param ttl:         Раз в сколько секунд перечитывать конфиг.
+    :param min_reload:  Минимальная пауза между перечитываниями
+                        конфига при несовпадении ключа, секунды.
+    """
+
+    provider: CredentialsProvider
+    client: HttpClient
+    ttl: float
+    min_reload: float
+    _api_key: str | None = field(init=False, default=None)
+    _loaded_at: float = field(init=False, default=0.0)
+    _lock: asyncio.Lock = field(init=False, default_factory=asyncio.Lock)
+    _task: asyncio.Task | None = field(init=False, default=None)
+
+    async def credentials(self) -> Credentials:
+        """
+        Учетные данные с действующим токеном доступа. Токен обновляется,
+        если до истечения его срока осталось меньше нескольких минут.
+
+        :return:    Учетные данные сервисного аккаунта.
+        """
+        return await self.provider.get()
+
+    async def check(self, api_key: str) -> bool:
+        """
+        Сравнить api_key с ключом из RemoteConfig.
+
+        :param api_key: Ключ из запроса.
+        :return:        True, если ключ совпадает.
+        """
+        if self._api_key is None or self._is_stale(self.ttl):
+            await self.reload(self.ttl)
+        if api_key == self._api_key:
+            return True
+
+        # возможно, ключ уже сменили в другом процессе
+        await self.reload(self.min_reload)
+        return api_key == self._api_key
+
+    async def reload(self, max_age: float = 0.0) -> None:
+        """
+        Перечитать api_key из RemoteConfig, если он загружен
+        раньше max_age секунд назад.
+
+        :param max_age: Допустимый возраст ключа, секунды.
+        :return:        None.
+        """
+        async with self._lock:
+            # пока ждали блокировку, ключ мог перечитать другой запрос
+            if self._api_key is not None and not self._is_stale(max_age):
+                return
+            credentials = await self.credentials()
+            remote_config, _ = await _get_remote_config(
+                self.client.session, credentials
+            )
+            self.update(_get_api_key(remote_config))
+
+    def update(self, api_key: str) -> None:
+        """
+        Запомнить новый api_key, например после его смены.
+
+        :param api_key: Ключ из RemoteConfig.
+        :return:        None.
+        """
+        self._api_key = api_key
+        self._loaded_at = time.monotonic()
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            with suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        self.provider.close()
+
+    def _is_stale(self, max_age: float) -> bool:
+        return time.monotonic() - self._loaded_at >= max_age
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.reload()
+            except Exception:
+                logger.exception("Не удалось обновить Firebase RemoteConfig")
+            await asyncio.sleep(self.ttl)
@@ -0,0 +1,130 @@
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from google.auth.transport.requests import Request
+from google.oauth2.service_account import Credentials
+from loguru import logger
+
+
+@dataclass
+class RefreshMetrics:
+    """
+    Метрики обновления токена доступа Google.
+
+    :param refreshes:       Число успешных обновлений.
+    :param failures:        Число неудачных обновлений.
+    :param last_refresh:    Длительность последнего обновления, секунды.
+    :param max_refresh:     Самое долгое обновление, секунды.
+    :param total_refresh:   Суммарное время обновлений, секунды.
+    :param last_loop_lag:   Сколько секунд событийный цикл не мог
+                            продолжить корутину после обновления.
+    :param max_loop_lag:    Самая большая задержка цикла, секунды.
+    """
+
+    refreshes: int = 0
+    failures: int = 0
+    last_refresh: float = 0.0
+    max_refresh: float = 0.0
+    total_refresh: float = 0.0
+    last_loop_lag: float = 0.0
+    max_loop_lag: float = 0.0
+
+    def observe(self, refresh: float, loop_lag: float) -> None:
+        self.refreshes += 1
+        self.last_refresh = refresh
+        self.max_refresh = max(self.max_refresh, refresh)
+        self.total_refresh += refresh
+        self.last_loop_lag = loop_lag
+        self.max_loop_lag = max(self.max_loop_lag, loop_lag)
+
+
+@dataclass
+class CredentialsProvider:
+    """
+    Учетные данные сервисного аккаунта Google, общие для всех
+    корутин процесса. Чтение файла и обновление токена выполняют
+    сетевой и файловый ввод-вывод, поэтому идут в отдельном потоке,
+    не блокируя событийный цикл. Одновременные запросы токена ждут
+    одно и то же обновление.
+
+    :param service_account_file:    Путь к JSON сервисного аккаунта.
+    :param scopes:                  Области доступа токена.
+    """
+
+    service_account_file: str
+    scopes: list[str]
+    metrics: RefreshMetrics = field(init=False, default_factory=RefreshMetrics)
+    _credentials: Credentials | None = field(init=False, default=None)
+    _request: Request = field(init=False, default_factory=Request)
+    _executor: ThreadPoolExecutor | None = field(init=False, default=None)
+    _refreshing: asyncio.Future | None = field(init=False, default=None)
+
+    async def get(self) -> Credentials:
+        """
+        Учетные данные с действующим токеном. Токен обновляется,
+        если до истечения его срока осталось меньше нескольких минут.
+
+        :return:    Учетные данные сервисного аккаунта.
+        """
+        if self._credentials is not None and self._credentials.valid:
+            return self._credentials
+        return await self.refresh()
+
+    async def refresh(self) -> Credentials:
+        """
+        Обновить токен. Если обновление уже идет, дождаться его.
+
+        :return:    Учетные данные сервисного аккаунта.
+        """
+        if self._refreshing is None:
+            self._refreshing = asyncio.ensure_future(self._refresh())
+        # отмена одного из ожидающих не должна прерывать общее обновление
+        return await asyncio.shield(self._refreshing)
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+    async def _refresh(self) -> Credentials:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="google-auth"
+            )
+        loop = asyncio.get_running_loop()
+        try:
+            credentials, duration, finished_at = await loop.run_in_executor(
+                self._executor, self._refresh_sync
+            )
+        except Exception:
+            self.metrics.failures += 1
+            raise
+        finally:
+            self._refreshing = None
+
+        loop_lag = time.monotonic() - finished_at
+        self.metrics.observe(duration, loop_lag)
+        logger.debug(
+            "Токен Google обновлен за {:.3f} c, задержка цикла {:.3f} c",
+            duration,
+            loop_lag,
+        )
+        self._credentials = credentials
+        return credentials
+
+    def _refresh_sync(self) -> tuple[Credentials, float, float]:
+        started_at = time.monotonic()
+        credentials = self._credentials
+        if credentials is None:
+            credentials = Credentials.from_service_account_file(
+                self.service_account_file,
+                scopes=self.scopes,
+            )
+        credentials.refresh(self._request)
+        finished_at = time.monotonic()
+        return credentials, finished_at - started_at, finished_at
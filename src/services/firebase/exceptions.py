@@ -15,6 +15,12 @@ class FirebaseGetConfigError(BaseHTTPException):
     detail: str = "Не удалось загрузить RemoteConfig из Firebase"
 
 
+@dataclass(eq=False)
+class FirebaseSetConfigError(BaseHTTPException):
+    code: int = 503
+    detail: str = "Не удалось сохранить RemoteConfig в Firebase"
+
+
 @dataclass(eq=False)
 class FirebaseGetEtagHeaderError(BaseHTTPException):
     code: int = 503
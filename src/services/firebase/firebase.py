@@ -1,10 +1,11 @@
 from loguru import logger
 
 from config import settings
+from config.base_settings.common import EnvironVariables
+from services.firebase.cache import RemoteConfigCache
 from services.firebase.exceptions import FirebaseInvalidApiKey
 from services.firebase.query import (
     _get_api_key,
-    _get_credentials,
     _get_etag_header,
     _get_remote_config,
     _set_api_key,
@@ -12,30 +13,23 @@ from services.firebase.query import (
 )
 
 
-async def check_firebase_apikey(api_key: str) -> None:
-    if settings.environ != "prod":
+async def check_firebase_apikey(
+    api_key: str, remote_config: RemoteConfigCache
+) -> None:
+    if settings.environ is not EnvironVariables.prod:
         return
 
-    credentials = await _get_credentials()
-    remote_config, _ = await _get_remote_config(credentials)
-    remote_api_key = _get_api_key(remote_config)
-
-    if api_key != remote_api_key:
-        logger.debug(
-            "Получен невалидный api_key: {} != {}", api_key, remote_api_key
-        )
+    if not await remote_config.check(api_key):
+        logger.debug("Получен невалидный api_key: {}", api_key)
         raise FirebaseInvalidApiKey()
 
 
-async def change_api_key() -> None:
-    credentials = await _get_credentials()
-    config, header = await _get_remote_config(credentials)
+async def change_api_key(remote_config: RemoteConfigCache) -> None:
+    session = remote_config.client.session
+    credentials = await remote_config.credentials()
+    config, header = await _get_remote_config(session, credentials)
     new_conf = _set_api_key(config)
     etag = _get_etag_header(header)
-    await _set_new_conf(new_conf, credentials, etag)
-
-
-if __name__ == "__main__":
-    import asyncio
-
-    asyncio.run(check_firebase_apikey("qwrert1234"))
+    await _set_new_conf(session, new_conf, credentials, etag)
+    # ключ в памяти меняется, только если Firebase принял новый конфиг
+    remote_config.update(_get_api_key(config))
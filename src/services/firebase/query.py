@@ -3,7 +3,6 @@ import uuid
 from typing import Any
 
 import aiohttp
-from google.auth.transport.requests import Request
 from google.oauth2.service_account import Credentials
 from loguru import logger
 
@@ -12,37 +11,30 @@ from services.firebase.exceptions import (
     FirebaseGetConfigError,
     FirebaseGetEtagHeaderError,
     FirebaseRemoteConfigError,
+    FirebaseSetConfigError,
 )
 
 
-async def _get_credentials() -> Credentials:
-    credentials = Credentials.from_service_account_file(
-        settings.firebase_json_conf,
-        scopes=settings.scopes,
-    )
-    credentials.refresh(Request())
-    return credentials
-
-
-async def _get_remote_config(cred: Credentials) -> tuple[Any, dict]:
+async def _get_remote_config(
+    session: aiohttp.ClientSession, cred: Credentials
+) -> tuple[Any, dict]:
     headers = {"Authorization": "Bearer " + cred.token}
-    async with aiohttp.ClientSession() as session:
-        async with session.get(
-            settings.remote_config_url,
-            headers=headers,
-        ) as response:
-            if response.status != 200:
-                logger.error(
-                    "Ошибка получения Firebase RemoteConfig. "
-                    "Статус: {}. Ответ: {}",
-                    response.status,
-                    await response.text(),
-                )
-                raise FirebaseGetConfigError()
+    async with session.get(
+        settings.remote_config_url,
+        headers=headers,
+    ) as response:
+        if response.status != 200:
+            logger.error(
+                "Ошибка получения Firebase RemoteConfig. "
+                "Статус: {}. Ответ: {}",
+                response.status,
+                await response.text(),
+            )
+            raise FirebaseGetConfigError()
 
-            response_json = await response.json()
-            response_headers = dict(response.headers)
-        return response_json, response_headers
+        response_json = await response.json()
+        response_headers = dict(response.headers)
+    return response_json, response_headers
 
 
 def _get_etag_header(headers: dict) -> str:
@@ -74,21 +66,29 @@ def _set_api_key(conf: dict) -> str:
         raise FirebaseRemoteConfigError()
 
 
-async def _set_new_conf(conf: str, cred: Credentials, etag: str) -> None:
+async def _set_new_conf(
+    session: aiohttp.ClientSession, conf: str, cred: Credentials, etag: str
+) -> None:
     headers = {
         "Authorization": "Bearer " + cred.token,
         "Content-Type": "application/json; charset=UTF-8",
         "If-Match": etag,
     }
-    async with aiohttp.ClientSession() as session:
-        async with session.put(
-            settings.remote_config_url,
-            headers=headers,
-            data=conf,
-        ) as response:
-            logger.debug(
-                "Отправлен запрос на смену Firebase RemoteConfig. "
-                "Статус ответа: {}. Ответ: {}",
+    async with session.put(
+        settings.remote_config_url,
+        headers=headers,
+        data=conf,
+    ) as response:
+        if response.status != 200:
+            logger.error(
+                "Ошибка смены Firebase RemoteConfig. Статус: {}. Ответ: {}",
                 response.status,
                 await response.text(),
             )
+            raise FirebaseSetConfigError()
+        logger.debug(
+            "Отправлен запрос на смену Firebase RemoteConfig. "
+            "Статус ответа: {}. Ответ: {}",
+            response.status,
+            await response.text(),
+        )
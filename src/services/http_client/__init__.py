@@ -0,0 +1,4 @@
+from .client import HttpClient
+
+
+__all__ = ("HttpClient",)
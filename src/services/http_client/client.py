@@ -0,0 +1,51 @@
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+import aiohttp
+
+
+@dataclass
+class HttpClient:
+    """
+    Общая сессия aiohttp для исходящих запросов. Соединения
+    переиспользуются между запросами, поэтому DNS, TCP и TLS
+    не повторяются на каждый вызов. Сессия открывается при старте
+    приложения или при первом запросе и закрывается при остановке.
+
+    :param limit:               Максимум соединений всего.
+    :param limit_per_host:      Максимум соединений к одному хосту.
+    :param keepalive_timeout:   Сколько секунд держать простаивающее
+                                соединение.
+    :param timeout:             Таймаут запроса по умолчанию, секунды.
+    """
+
+    limit: int
+    limit_per_host: int
+    keepalive_timeout: float
+    timeout: float
+    _session: aiohttp.ClientSession | None = field(init=False, default=None)
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        self.open()
+        return self._session
+
+    def open(self) -> None:
+        if self._session is not None and not self._session.closed:
+            return
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        )
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
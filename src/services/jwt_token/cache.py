@@ -0,0 +1,50 @@
+import time
+from collections import OrderedDict
+from dataclasses import (
+    dataclass,
+    field,
+)
+from typing import Callable
+
+
+@dataclass
+class VerifiedTokenCache:
+    """
+    Payload токенов, подпись которых уже проверена. Повторный запрос
+    с тем же токеном не проверяет подпись HS512 заново. Ключ - подпись
+    токена, но payload отдается только если совпадает и весь токен,
+    иначе подменить payload при той же подписи было бы можно. Токен
+    хранится до своего exp, при переполнении вытесняются давно не
+    использованные токены. Ошибки декодирования не кешируются.
+
+    :param max_size:    Максимальное число токенов в кеше.
+    """
+
+    max_size: int
+    _tokens: OrderedDict[str, tuple[str, dict]] = field(
+        init=False, default_factory=OrderedDict
+    )
+
+    def decode(self, token: str, decode: Callable[[str], dict]) -> dict:
+        """
+        Получить payload токена из кеша или декодировать его.
+
+        :param token:   Jwt токен.
+        :param decode:  Функция проверки и декодирования токена.
+        :return:        Payload токена, изменять его нельзя.
+        """
+        signature = token.rpartition(".")[2]
+        cached = self._tokens.get(signature)
+        if cached is not None and cached[0] == token:
+            payload = cached[1]
+            if payload["exp"] > time.time():
+                self._tokens.move_to_end(signature)
+                return payload
+            del self._tokens[signature]
+
+        payload = decode(token)
+        if "exp" in payload:
+            self._tokens[signature] = (token, payload)
+            while len(self._tokens) > self.max_size:
+                self._tokens.popitem(last=False)
+        return payload
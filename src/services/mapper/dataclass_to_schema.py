@@ -1,17 +1,26 @@
-from types import UnionType
+import sys
+from dataclasses import (
+    fields,
+    is_dataclass,
+)
 from typing import (
     Any,
-    Sequence,
+    Callable,
+    ForwardRef,
+    Iterator,
     Type,
     TypeVar,
-    Union,
 )
 
+from pydantic import BaseModel
+
 
 TSchema = TypeVar("TSchema")
 
 
-def dataclass_to_schema(schema: Type[TSchema], obj: Any) -> TSchema:
+def dataclass_to_schema(
+    schema: Type[TSchema], obj: Any, trusted: bool = False
+) -> TSchema:
     """
     Функция конвертирует объекты dataclass в pydantic схему.
     Правила:
@@ -42,53 +51,171 @@ def dataclass_to_schema(schema: Type[TSchema], obj: Any) -> TSchema:
                 list_field: list[BSchema] = Field(default_factory=list)
 
             dataclass_to_schema(CSchema, dataclass_obj)
+        6. Схема и датакласс сопоставляются один раз: для пары
+        (схема, класс датакласса) строится функция конвертации и
+        кешируется, дальше аннотации схемы не разбираются.
+        7. trusted=True создает схемы без валидации, как
+        model_construct. Только для Entity, типы полей которых уже
+        совпадают с типами схемы.
     :param schema:  pydantic схема в которую нужно конвертировать.
     :param obj:     Объект dataclass.
+    :param trusted: Не валидировать данные объекта.
     :return:        Конвертированный объект pydantic схемы.
     """
-    attrs = {}
-    if isinstance(schema, Sequence):
-        for c in schema:
+    if isinstance(schema, (tuple, list)):
+        converter = _choose_converter(tuple(schema), type(obj), trusted)
+    else:
+        converter = _get_converter(schema, type(obj), trusted)
+    return converter(obj)
+
+
+Converter = Callable[[Any], Any]
+
+_converters: dict[tuple[Any, type, bool], Converter | None] = {}
+_choices: dict[tuple[tuple, type, bool], Converter | None] = {}
+
+
+def _get_converter(schema: Any, cls: type, trusted: bool) -> Converter:
+    key = (schema, cls, trusted)
+    try:
+        converter = _converters[key]
+    except KeyError:
+        converter = _converters[key] = _compile(schema, cls, trusted)
+    if converter is None:
+        raise AttributeError(
+            f"{cls.__name__} не подходит для схемы {schema!r}"
+        )
+    return converter
+
+
+def _choose_converter(schemas: tuple, cls: type, trusted: bool) -> Converter:
+    """
+    Конвертер первой из схем, все поля которой есть у датакласса.
+    """
+    key = (schemas, cls, trusted)
+    try:
+        converter = _choices[key]
+    except KeyError:
+        converter = _choices[key] = _choose(schemas, cls, trusted)
+    if converter is None:
+        raise AttributeError(
+            f"{cls.__name__} не подходит ни для одной из схем {schemas!r}"
+        )
+    return converter
+
+
+def _choose(schemas: tuple, cls: type, trusted: bool) -> Converter | None:
+    for schema in schemas:
+        try:
+            return _get_converter(schema, cls, trusted)
+        except AttributeError:
+            continue
+    return None
+
+
+def _compile(schema: Any, cls: type, trusted: bool) -> Converter | None:
+    """
+    Сгенерировать функцию конвертации датакласса cls в схему:
+    schema(id=obj.id, answers=convert_value(obj.answers, ...)).
+    Поля без схем в аннотации передаются как есть, для остальных
+    тип значения проверяется при конвертации. None, если у датакласса
+    нет какого-либо поля схемы.
+    """
+    model_fields = getattr(schema, "model_fields", None)
+    if model_fields is None:
+        return None
+    names = {f.name for f in fields(cls)} if is_dataclass(cls) else set()
+    if any(
+        field not in names and not hasattr(cls, field)
+        for field in model_fields
+    ):
+        return None
+
+    namespace: dict[str, Any] = {
+        "schema": schema,
+        "build": schema.model_construct if trusted else schema,
+        "convert_value": _convert_value,
+        "trusted": trusted,
+        "new": object.__new__,
+        "setattr": object.__setattr__,
+    }
+    values = {}
+    for field, info in model_fields.items():
+        schemas = tuple(_extract_schemas(info.annotation, schema.__module__))
+        if not schemas:
+            values[field] = f"obj.{field}"
+            continue
+        namespace[f"schemas_{field}"] = schemas
+        values[field] = f"convert_value(obj.{field}, schemas_{field}, trusted)"
+
+    if trusted and _is_plain(schema):
+        # то же, что делает model_construct, но без обхода полей
+        # схемы и подстановки значений по умолчанию на каждый объект
+        items = ", ".join(f"{k!r}: {v}" for k, v in values.items())
+        fields_set = ", ".join(repr(k) for k in values)
+        fields_set = f"{{{fields_set}}}" if values else "set()"
+        source = (
+            "def convert(obj):\n"
+            "    m = new(schema)\n"
+            f"    setattr(m, '__dict__', {{{items}}})\n"
+            f"    setattr(m, '__pydantic_fields_set__', {fields_set})\n"
+            "    setattr(m, '__pydantic_extra__', None)\n"
+            "    setattr(m, '__pydantic_private__', None)\n"
+            "    return m\n"
+        )
+    else:
+        args = ", ".join(f"{k}={v}" for k, v in values.items())
+        source = f"def convert(obj):\n    return build({args})\n"
+    exec(source, namespace)
+    return namespace["convert"]
+
+
+def _is_plain(schema: Any) -> bool:
+    """
+    Схему можно собрать без model_construct: у нее нет приватных
+    атрибутов, post_init, дополнительных полей и это не RootModel.
+    """
+    return not (
+        schema.__pydantic_root_model__
+        or schema.__pydantic_post_init__
+        or schema.__private_attributes__
+        or schema.model_config.get("extra") == "allow"
+    )
+
+
+def _convert_value(value: Any, schemas: tuple, trusted: bool) -> Any:
+    if hasattr(value, "__dataclass_fields__"):
+        return _choose_converter(schemas, type(value), trusted)(value)
+    if (
+        isinstance(value, (list, tuple))
+        and value
+        and hasattr(value[0], "__dataclass_fields__")
+    ):
+        result = []
+        for v in value:
             try:
-                return dataclass_to_schema(c, obj)
+                converter = _choose_converter(schemas, type(v), trusted)
             except AttributeError:
+                # как и раньше, неподходящие элементы списка пропускаются
                 continue
-        raise
-    for field in schema.model_fields.keys():
-        value = getattr(obj, field)
-        sub_schema = schema.model_fields[field]
-        field_type = _extract_field_type_schema(sub_schema.annotation)
-        if (
-            isinstance(value, Sequence)
-            and len(value) > 0
-            and hasattr(value[0], "__dataclass_fields__")
-            and isinstance(field_type, Sequence)
-        ):
-            attrs[field] = []
-            for v in value:
-                for ft in field_type:
-                    try:
-                        attrs[field].append(dataclass_to_schema(ft, v))
-                        break
-                    except AttributeError:
-                        continue
-
-        elif hasattr(value, "__dataclass_fields__"):
-            attrs[field] = dataclass_to_schema(field_type, value)
-        else:
-            attrs[field] = value
-    return schema(**attrs)
-
-
-def _extract_field_type_schema(field_type: Any) -> Any:
-    if isinstance(field_type, UnionType):
-        return field_type.__args__
-    elif hasattr(field_type, "__origin__"):
-        if field_type.__origin__ is list:
-            field_type = field_type.__args__
-            if isinstance(field_type[0], UnionType):
-                field_type = field_type[0].__args__
-            return field_type
-        if field_type.__origin__ is Union:
-            field_type = field_type.__args__
-    return field_type
+            result.append(converter(v))
+        return result
+    return value
+
+
+def _extract_schemas(
+    annotation: Any, module: str
+) -> Iterator[type[BaseModel]]:
+    """
+    Pydantic схемы из аннотации поля, в том числе из Union и list.
+    Строковые ссылки ищутся в модуле схемы.
+    """
+    if isinstance(annotation, ForwardRef):
+        annotation = annotation.__forward_arg__
+    if isinstance(annotation, str):
+        annotation = getattr(sys.modules[module], annotation, None)
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        yield annotation
+        return
+    for arg in getattr(annotation, "__args__", ()):
+        yield from _extract_schemas(arg, module)
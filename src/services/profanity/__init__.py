@@ -0,0 +1,10 @@
+from .base import IProfanityFilter
+from .http import HttpProfanityFilter
+from .local import LocalProfanityFilter
+
+
+__all__ = (
+    "HttpProfanityFilter",
+    "IProfanityFilter",
+    "LocalProfanityFilter",
+)
@@ -0,0 +1,65 @@
+from collections import deque
+from typing import Iterable
+
+
+class Automaton:
+    """
+    Автомат Ахо-Корасик для поиска любого из набора слов в тексте
+    за один проход, время поиска не зависит от размера словаря.
+    Переходы по несуществующим в боре буквам заранее заменены
+    переходами по суффиксным ссылкам, поэтому поиск - это
+    один словарный переход на символ.
+    """
+
+    __slots__ = ("_transitions", "_terminal")
+
+    def __init__(self, words: Iterable[str]):
+        transitions: list[dict[str, int]] = [{}]
+        terminal: list[bool] = [False]
+        for word in words:
+            if not word:
+                continue
+            state = 0
+            for char in word:
+                following = transitions[state].get(char)
+                if following is None:
+                    following = len(transitions)
+                    transitions[state][char] = following
+                    transitions.append({})
+                    terminal.append(False)
+                state = following
+            terminal[state] = True
+
+        # обход в ширину: суффиксная ссылка состояния уже посчитана,
+        # и все переходы из нее уже достроены
+        links = [0] * len(transitions)
+        queue = deque(transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            link = links[state]
+            # состояние завершает слово, если его завершает суффикс
+            terminal[state] = terminal[state] or terminal[link]
+            for char, following in transitions[state].items():
+                links[following] = transitions[link].get(char, 0)
+                queue.append(following)
+            for char, target in transitions[link].items():
+                transitions[state].setdefault(char, target)
+
+        self._transitions = transitions
+        self._terminal = terminal
+
+    def search(self, text: str) -> bool:
+        """
+        Есть ли в тексте хотя бы одно слово из словаря.
+
+        :param text:    Текст.
+        :return:        True, если слово найдено.
+        """
+        transitions = self._transitions
+        terminal = self._terminal
+        state = 0
+        for char in text:
+            state = transitions[state].get(char, 0)
+            if terminal[state]:
+                return True
+        return False
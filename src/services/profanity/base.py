@@ -0,0 +1,21 @@
+from abc import (
+    ABC,
+    abstractmethod,
+)
+from dataclasses import dataclass
+
+
+@dataclass
+class IProfanityFilter(ABC):
+    """
+    Проверка текста на нецензурную лексику.
+    """
+
+    @abstractmethod
+    async def is_profane(self, text: str) -> bool:
+        """
+        Содержит ли текст нецензурную лексику.
+
+        :param text:    Проверяемый текст.
+        :return:        True, если содержит.
+        """
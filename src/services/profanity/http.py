@@ -0,0 +1,29 @@
+from dataclasses import dataclass
+
+import aiohttp
+
+from services.http_client import HttpClient
+from services.profanity.base import IProfanityFilter
+
+
+@dataclass
+class HttpProfanityFilter(IProfanityFilter):
+    """
+    Проверка текста внешним сервисом цензуры.
+    При недоступности сервиса поднимается TimeoutError.
+
+    :param client:  HTTP клиент.
+    :param url:     Адрес сервиса.
+    :param timeout: Таймаут запроса, секунды.
+    """
+
+    client: HttpClient
+    url: str
+    timeout: float
+
+    async def is_profane(self, text: str) -> bool:
+        async with self.client.session.post(
+            f"{self.url}/censor-word/{text}",  # noqa: E231
+            timeout=aiohttp.ClientTimeout(total=self.timeout),
+        ) as response:
+            return await response.text() == "true"
@@ -0,0 +1,112 @@
+import os
+import time
+from dataclasses import (
+    dataclass,
+    field,
+)
+
+from loguru import logger
+
+from services.profanity.automaton import Automaton
+from services.profanity.base import IProfanityFilter
+from services.profanity.normalize import (
+    is_cyrillic,
+    latin_words,
+    normalize,
+)
+
+
+@dataclass
+class LocalProfanityFilter(IProfanityFilter):
+    """
+    Поиск запрещенных слов в памяти процесса. Кириллические слова
+    словаря - корни, они ищутся в любом месте текста автоматом
+    Ахо-Корасик. Латинские слова ищутся только целыми словами
+    текста, а слова со звездочкой на конце - в начале слов,
+    иначе короткие транслиты находятся внутри обычных имен.
+    Словарь перечитывается без перезапуска: не чаще раза в
+    reload_interval секунд проверяется время изменения файла.
+    Пока словарь не загружен, текст проверяет fallback.
+
+    :param words_file:      Путь к файлу словаря.
+    :param reload_interval: Раз в сколько секунд проверять файл.
+    :param fallback:        Проверка на случай, если словаря нет.
+    """
+
+    words_file: str
+    reload_interval: float
+    fallback: IProfanityFilter | None = None
+    _automaton: Automaton | None = field(init=False, default=None)
+    _latin_words: frozenset[str] = field(init=False, default=frozenset())
+    _latin_prefixes: tuple[str, ...] = field(init=False, default=())
+    _mtime: float = field(init=False, default=0.0)
+    _checked_at: float = field(init=False, default=0.0)
+
+    @property
+    def loaded(self) -> bool:
+        return self._automaton is not None
+
+    async def is_profane(self, text: str) -> bool:
+        self._maybe_reload()
+        if self._automaton is None:
+            if self.fallback is None:
+                return False
+            return await self.fallback.is_profane(text)
+        if self._automaton.search(normalize(text)):
+            return True
+        return any(
+            word in self._latin_words or word.startswith(self._latin_prefixes)
+            for word in latin_words(text)
+        )
+
+    def reload(self) -> None:
+        """
+        Перечитать словарь из файла. Если файл не прочитался,
+        остается прежний словарь.
+
+        :return:    None.
+        """
+        try:
+            mtime = os.stat(self.words_file).st_mtime
+            with open(self.words_file, encoding="utf-8") as file:
+                words = [
+                    line.strip()
+                    for line in file
+                    if line.strip() and not line.startswith("#")
+                ]
+        except OSError:
+            logger.exception(
+                "Не удалось загрузить словарь: {}", self.words_file
+            )
+            return
+
+        latin_entries, prefixes = set(), []
+        for word in words:
+            if is_cyrillic(word):
+                continue
+            entry = "".join(latin_words(word.rstrip("*")))
+            if word.endswith("*"):
+                prefixes.append(entry)
+            else:
+                latin_entries.add(entry)
+
+        self._automaton = Automaton(
+            normalize(word) for word in words if is_cyrillic(word)
+        )
+        self._latin_words = frozenset(latin_entries)
+        self._latin_prefixes = tuple(prefixes)
+        self._mtime = mtime
+        logger.debug("Загружен словарь из {} слов", len(words))
+
+    def _maybe_reload(self) -> None:
+        now = time.monotonic()
+        if self._checked_at and now - self._checked_at < self.reload_interval:
+            return
+        self._checked_at = now
+
+        try:
+            mtime = os.stat(self.words_file).st_mtime
+        except OSError:
+            mtime = None
+        if mtime != self._mtime:
+            self.reload()
@@ -0,0 +1,124 @@
+from itertools import groupby
+
+
+# латинские буквы и цифры, похожие на кириллические буквы
+_HOMOGLYPHS = str.maketrans(
+    {
+        "a": "а",
+        "b": "в",
+        "c": "с",
+        "e": "е",
+        "h": "н",
+        "i": "и",
+        "k": "к",
+        "m": "м",
+        "n": "п",
+        "o": "о",
+        "p": "р",
+        "r": "г",
+        "t": "т",
+        "u": "и",
+        "x": "х",
+        "y": "у",
+        "0": "о",
+        "1": "и",
+        "3": "з",
+        "4": "ч",
+        "6": "б",
+        "8": "в",
+        "@": "а",
+        "$": "с",
+        "ё": "е",
+        "й": "и",
+    }
+)
+# кириллические буквы и цифры, похожие на латинские буквы
+_LATIN_HOMOGLYPHS = str.maketrans(
+    {
+        "а": "a",
+        "в": "b",
+        "е": "e",
+        "к": "k",
+        "м": "m",
+        "н": "h",
+        "о": "o",
+        "р": "p",
+        "с": "c",
+        "т": "t",
+        "у": "y",
+        "х": "x",
+        "0": "o",
+        "1": "i",
+        "3": "e",
+        "4": "a",
+        "5": "s",
+        "7": "t",
+        "@": "a",
+        "$": "s",
+        "!": "i",
+    }
+)
+
+
+def is_cyrillic(word: str) -> bool:
+    """
+    Есть ли в слове кириллические буквы.
+    """
+    return any("а" <= char <= "я" or char == "ё" for char in word.lower())
+
+
+def normalize(text: str) -> str:
+    """
+    Привести текст к виду, в котором ищутся кириллические слова
+    словаря: нижний регистр, латинские двойники и цифры заменены
+    кириллицей, разделители удалены, повторы букв схлопнуты.
+    Кириллические слова словаря приводятся к тому же виду.
+
+    :param text:    Исходный текст.
+    :return:        Нормализованный текст.
+    """
+    text = text.lower().translate(_HOMOGLYPHS)
+    return _collapse(char for char in text if char.isalpha())
+
+
+def latin_words(text: str) -> list[str]:
+    """
+    Разбить текст на слова, в которых ищутся латинские слова
+    словаря. Границы слов - разделители и переход от строчной
+    буквы к заглавной. Кириллические двойники и цифры заменены
+    латиницей, повторы букв схлопнуты. Идущие подряд отдельные
+    буквы, например "f.u.c.k", склеиваются в одно слово.
+
+    :param text:    Исходный текст.
+    :return:        Список слов.
+    """
+    words = []
+    word = []
+    previous = ""
+    for char in text:
+        if char.isupper() and previous.islower():
+            words.append(_collapse(word))
+            word = []
+        previous = char
+        char = char.lower().translate(_LATIN_HOMOGLYPHS)
+        if char.isalpha():
+            word.append(char)
+        elif word:
+            words.append(_collapse(word))
+            word = []
+    if word:
+        words.append(_collapse(word))
+
+    merged = []
+    for single, group in groupby(
+        (word for word in words if word), key=lambda w: len(w) == 1
+    ):
+        if single:
+            merged.append(_collapse("".join(group)))
+        else:
+            merged.extend(group)
+    return merged
+
+
+def _collapse(chars) -> str:
+    return "".join(char for char, _ in groupby(chars))
@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import ClassVar
 
 from loguru import logger
 from redis import asyncio as aioredis
@@ -8,17 +9,57 @@ from config import settings
 
 @dataclass
 class RedisPool:
+    """
+    Подключение к базе Redis. Все экземпляры с одним номером базы
+    используют общий пул соединений, пул создается при первом
+    обращении и закрывается при остановке приложения.
+
+    :param db_number:   Номер базы Redis.
+    """
+
     db_number: int
+    _pools: ClassVar[dict[int, aioredis.ConnectionPool]] = {}
 
-    async def connect(self):
-        conn = aioredis.Redis(
-            host=settings.redis_host,
-            username=settings.redis_user,
-            password=settings.redis_pass,
-            port=settings.redis_port,
-            db=self.db_number,
-        )
-        return conn
+    async def connect(self) -> aioredis.Redis:
+        return aioredis.Redis(connection_pool=self._get_pool())
+
+    def _get_pool(self) -> aioredis.ConnectionPool:
+        pool = self._pools.get(self.db_number)
+        if pool is None:
+            pool = aioredis.BlockingConnectionPool(
+                host=settings.redis_host,
+                username=settings.redis_user,
+                password=settings.redis_pass,
+                port=settings.redis_port,
+                db=self.db_number,
+                max_connections=settings.redis_max_connections,
+                timeout=settings.redis_pool_timeout,
+                health_check_interval=settings.redis_health_check_interval,
+            )
+            self._pools[self.db_number] = pool
+        return pool
+
+    @classmethod
+    async def close_all(cls) -> None:
+        """
+        Закрыть пулы соединений всех баз.
+
+        :return:    None.
+        """
+        pools = list(cls._pools.values())
+        cls._pools.clear()
+        for pool in pools:
+            await pool.disconnect()
+
+    @classmethod
+    def forget_all(cls) -> None:
+        """
+        Забыть пулы после fork, не закрывая их: соединения
+        принадлежат родительскому процессу.
+
+        :return:    None.
+        """
+        cls._pools.clear()
 
     async def set_exp_value(
         self,
@@ -72,3 +113,43 @@ class RedisPool:
             return value
 
         return value.decode()
+
+    async def mset(
+        self,
+        values: dict[str, str | int],
+        time_ex: int | None = None,
+    ) -> None:
+        """
+        Сохранить несколько ключей в кеш за один запрос к Redis.
+        Если срок хранения не указан, то ключи будут храниться сутки.
+
+        :param values:  Словарь ключ - значение.
+        :param time_ex: Сколько времени, в секундах, должны
+                        храниться ключи.
+        :return:        None.
+        """
+        if not values:
+            return
+
+        conn = await self.connect()
+        async with conn.pipeline(transaction=False) as pipe:
+            for key, value in values.items():
+                pipe.set(name=key, value=value, ex=time_ex or 86400)
+            await pipe.execute()
+
+    async def mget(self, keys: list[str]) -> list[str | None]:
+        """
+        Получить значения нескольких ключей из кеша за один запрос.
+
+        :param keys:    Ключи.
+        :return:        Значения ключей в порядке ключей, None для
+                        не найденных.
+        """
+        if not keys:
+            return []
+
+        conn = await self.connect()
+        values: list[bytes | None] = await conn.mget(keys)
+        return [
+            value.decode() if value is not None else None for value in values
+        ]
@@ -7,6 +7,8 @@ from celery import (
 from celery.schedules import crontab
 from celery.signals import after_task_publish
 
+from config import settings
+
 
 """------------------------------------------------------------------"""
 """-------------ПРОБЫ ПРОВЕРКИ ЦЕЛОСТНОСТИ CELERY WORKER-------------"""
@@ -90,6 +92,10 @@ app.conf.beat_schedule = {
         "task": "clear_month_statistic",
         "schedule": crontab(minute="56", hour="12", day_of_month="22"),
     },
+    "rebuild_ranks": {
+        "task": "rebuild_ranks",
+        "schedule": settings.rank_rebuild_interval,
+    },
     "update_firebase_config": {
         "task": "update_firebase_config",
         "schedule": crontab(minute="0", hour="0"),
@@ -0,0 +1,159 @@
+import asyncio
+import threading
+from functools import wraps
+from typing import (
+    Any,
+    Callable,
+    Coroutine,
+    TypeVar,
+)
+
+from celery.signals import (
+    worker_process_init,
+    worker_process_shutdown,
+    worker_shutdown,
+)
+from loguru import logger
+
+from config.containers import (
+    get_container,
+    request_scope,
+)
+from core.database.db import DatabaseConnection
+from services.firebase import CredentialsProvider
+from services.http_client import HttpClient
+from services.redis_pool import RedisPool
+
+
+T = TypeVar("T")
+
+
+class AsyncTaskRunner:
+    """
+    Выполнение корутин задач Celery в одном событийном цикле на
+    процесс воркера. Цикл, пулы соединений с БД и Redis и
+    HTTP-сессия создаются один раз при запуске процесса и живут
+    между задачами, а не открываются заново на каждую задачу.
+
+    Цикл работает в отдельном потоке, а задача передает в него
+    корутину и ждет результата. Поэтому одинаково работают пулы
+    prefork, solo и threads: в threads корутины задач из разных
+    потоков выполняются в одном цикле конкурентно. Отдельный цикл
+    на каждый поток не подходит - пулы соединений привязаны к циклу,
+    в котором открыты, и общие для процесса.
+
+    В prefork пуле цикл запускается по сигналу worker_process_init,
+    в solo и threads пулах - при первой задаче.
+    """
+
+    def __init__(self):
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Создать событийный цикл процесса и пулы соединений.
+        Пулы, унаследованные от родителя при fork, забываются
+        без закрытия, их соединения принадлежат родителю.
+
+        :return:    None.
+        """
+        with self._lock:
+            if self._loop is not None:
+                return
+            RedisPool.forget_all()
+            connection: DatabaseConnection = get_container().resolve(
+                DatabaseConnection
+            )
+            connection.forget_connections()
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(
+                target=self._run_loop, name="task-loop", daemon=True
+            )
+            self._thread.start()
+        logger.debug("Событийный цикл воркера запущен")
+
+    def run(self, coro: Coroutine[Any, Any, T]) -> T:
+        """
+        Выполнить корутину в цикле процесса и дождаться результата.
+        Зависимости со scope request общие для всей задачи.
+
+        :param coro:    Корутина задачи.
+        :return:        Результат корутины.
+        """
+        if self._loop is None:
+            self.start()
+        future = asyncio.run_coroutine_threadsafe(
+            self._in_request_scope(coro), self._loop
+        )
+        return future.result()
+
+    def stop(self) -> None:
+        """
+        Закрыть соединения процесса и событийный цикл.
+
+        :return:    None.
+        """
+        with self._lock:
+            if self._loop is None:
+                return
+            loop, thread = self._loop, self._thread
+            for coro in (self._close(), loop.shutdown_asyncgens()):
+                asyncio.run_coroutine_threadsafe(coro, loop).result()
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+            self._loop = self._thread = None
+        logger.debug("Событийный цикл воркера остановлен")
+
+    def _run_loop(self) -> None:
+        asyncio.set_event_loop(self._loop)
+        self._loop.run_forever()
+
+    @staticmethod
+    async def _in_request_scope(coro: Coroutine[Any, Any, T]) -> T:
+        # у каждой задачи цикла свой контекст, поэтому
+        # области запроса конкурентных задач не смешиваются
+        with request_scope():
+            return await coro
+
+    @staticmethod
+    async def _close() -> None:
+        container = get_container()
+        await container.resolve(HttpClient).close()
+        container.resolve(CredentialsProvider).close()
+        await container.resolve(DatabaseConnection).dispose()
+        await RedisPool.close_all()
+
+
+runner = AsyncTaskRunner()
+
+
+def async_task(
+    func: Callable[..., Coroutine[Any, Any, T]],
+) -> Callable[..., T]:
+    """
+    Превратить корутинную функцию в функцию задачи Celery,
+    выполняемую в цикле процесса воркера.
+
+    :param func:    Корутинная функция.
+    :return:        Синхронная функция.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs) -> T:
+        return runner.run(func(*args, **kwargs))
+
+    return wrapper
+
+
+@worker_process_init.connect
+def start_runner(**_) -> None:
+    runner.start()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_runner(**_) -> None:
+    runner.stop()
@@ -1,47 +1,61 @@
-import asyncio
-
 from celery import shared_task
 from loguru import logger
-from punq import Container
 
 from apps.users.actions import StatisticsActions
 from apps.users.models import (
     DayStatistic,
     MonthStatistic,
     PeriodStatistic,
+    Statistic,
+)
+from apps.users.services.ranking import RankRebuilder
+from config.containers import (
+    Container,
+    get_container,
+)
+from services.firebase import (
+    change_api_key,
+    RemoteConfigCache,
 )
-from config.containers import get_container
-from services.firebase.firebase import change_api_key
+from services.tasks.runner import async_task
 
 
 @shared_task(name="clear_day_statistic")
-def clear_day_statistic() -> None:
+@async_task
+async def clear_day_statistic() -> None:
     logger.debug("Очистка ежедневной статистики")
     container: Container = get_container()
     action: StatisticsActions = container.resolve(
         StatisticsActions[DayStatistic]
     )
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(
-        action.delete_statistic(period=PeriodStatistic.day)
-    )
+    await action.delete_statistic(period=PeriodStatistic.day)
 
 
 @shared_task(name="clear_month_statistic")
-def clear_month_statistic() -> None:
+@async_task
+async def clear_month_statistic() -> None:
     logger.debug("Очистка ежемесячной статистики")
     container: Container = get_container()
     action: StatisticsActions = container.resolve(
         StatisticsActions[MonthStatistic]
     )
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(
-        action.delete_statistic(period=PeriodStatistic.month)
-    )
+    await action.delete_statistic(period=PeriodStatistic.month)
+
+
+@shared_task(name="rebuild_ranks")
+@async_task
+async def rebuild_ranks() -> None:
+    logger.debug("Пересчет мест в ладдерах")
+    container: Container = get_container()
+    for model in (Statistic, MonthStatistic, DayStatistic):
+        rebuilder: RankRebuilder = container.resolve(RankRebuilder[model])
+        await rebuilder.rebuild()
 
 
 @shared_task(name="update_firebase_config")
-def update_firebase_config() -> None:
+@async_task
+async def update_firebase_config() -> None:
     logger.debug("Обновление Firebase конфига")
-    loop = asyncio.get_event_loop()
-    loop.run_until_complete(change_api_key())
+    container: Container = get_container()
+    remote_config: RemoteConfigCache = container.resolve(RemoteConfigCache)
+    await change_api_key(remote_config)
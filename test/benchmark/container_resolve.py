@@ -0,0 +1,118 @@
+"""
+Стоимость container.resolve до и после компиляции планов создания.
+
+Прежний resolve на каждый вызов разбирал сигнатуры фабрик всех
+транзитивных зависимостей, он воспроизведен в legacy_resolve.
+Запросы в БД и Redis не выполняются, создаются только объекты.
+Запуск из корня проекта:
+PYTHONPATH=src python -m test.benchmark.container_resolve
+"""
+import timeit
+from typing import Any
+
+from independency.container import (
+    ContainerError,
+    get_deps,
+    get_from_localns,
+)
+
+from apps.quiz.actions import QuestionsActions
+from apps.users.actions import (
+    AuthAction,
+    CompositeStatisticAction,
+    ProfileActions,
+)
+from apps.users.permissions.profile import ProfilePermissions
+from config.containers import (
+    Container,
+    request_scope,
+)
+from config.containers.containers import _get_main_container
+from config.containers.di import (
+    _resolve_constants,
+    Scope,
+)
+from core.database.db import Database
+
+
+NUMBER = 1000
+REPEAT = 5
+
+TYPES = (
+    ProfilePermissions,
+    ProfileActions,
+    AuthAction,
+    QuestionsActions,
+    CompositeStatisticAction,
+)
+# типичный обработчик: проверка прав и пара действий
+HANDLER = (ProfilePermissions, ProfileActions, QuestionsActions)
+
+
+def legacy_resolve(container: Container, cls: Any, cache: dict) -> Any:
+    """
+    Прежний Container.resolve_impl.
+    """
+    cls = get_from_localns(cls, container._localns)
+    if cls in container._resolved:
+        return container._resolved[cls]
+    if cls in cache:
+        return cache[cls]
+    try:
+        current = container._registry[cls]
+    except KeyError as e:
+        raise ContainerError(f"No dependency of type {cls}") from e
+
+    args = _resolve_constants(current.kwargs)
+    for key, d in get_deps(current, container._localns).items():
+        args[key] = legacy_resolve(container, d, cache)
+    result = current.factory(**args)
+    if current.scope is Scope.singleton:
+        container._resolved[current.cls] = result
+    if current.scope in (Scope.cached, Scope.request):
+        cache[cls] = result
+    return result  # noqa: R504
+
+
+def measure(func) -> float:
+    best = min(timeit.repeat(func, number=NUMBER, repeat=REPEAT))
+    return best / NUMBER * 1_000_000
+
+
+def main() -> None:
+    container = _get_main_container()
+    for cls in TYPES:
+        container.resolve(cls)
+
+    print(f"\n{'тип':<28} {'прежний':>10} {'план':>10}")
+    for cls in TYPES:
+        legacy = measure(lambda: legacy_resolve(container, cls, {}))
+        compiled = measure(lambda: container.resolve(cls))
+        print(
+            f"{cls.__name__:<28} {legacy:8.1f} us {compiled:8.1f} us "
+            f"{legacy / compiled:5.1f}x"
+        )
+
+    def legacy_handler():
+        for cls in HANDLER:
+            legacy_resolve(container, cls, {})
+
+    def compiled_handler():
+        with request_scope():
+            for cls in HANDLER:
+                container.resolve(cls)
+
+    legacy = measure(legacy_handler)
+    compiled = measure(compiled_handler)
+    print(
+        f"{'обработчик, ' + str(len(HANDLER)) + ' resolve':<28} "
+        f"{legacy:8.1f} us {compiled:8.1f} us {legacy / compiled:5.1f}x"
+    )
+
+    with request_scope():
+        shared = container.resolve(Database) is container.resolve(Database)
+    print(f"Database общая для resolve одного запроса: {shared}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Сравнение dataclass_to_schema с прежней реализацией, которая разбирала
+аннотации схемы на каждый объект, на ответе /get_questions/.
+
+Запуск из корня проекта:
+PYTHONPATH=src python -m test.benchmark.dataclass_to_schema
+"""
+import timeit
+from types import UnionType
+from typing import (
+    Any,
+    Sequence,
+    Union,
+)
+
+from api.mobile.quiz.schema import QuestionSchema
+
+from apps.quiz.models import (
+    AnswerEntity,
+    QuestionEntity,
+)
+from services.mapper import dataclass_to_schema
+
+
+QUESTIONS = 10_000
+REPEAT = 5
+
+
+def legacy_dataclass_to_schema(schema: Any, obj: Any) -> Any:
+    """
+    Прежняя реализация dataclass_to_schema.
+    """
+    attrs = {}
+    if isinstance(schema, Sequence):
+        for c in schema:
+            try:
+                return legacy_dataclass_to_schema(c, obj)
+            except AttributeError:
+                continue
+        raise
+    for field in schema.model_fields.keys():
+        value = getattr(obj, field)
+        sub_schema = schema.model_fields[field]
+        field_type = _extract_field_type_schema(sub_schema.annotation)
+        if (
+            isinstance(value, Sequence)
+            and len(value) > 0
+            and hasattr(value[0], "__dataclass_fields__")
+            and isinstance(field_type, Sequence)
+        ):
+            attrs[field] = []
+            for v in value:
+                for ft in field_type:
+                    try:
+                        item = legacy_dataclass_to_schema(ft, v)
+                        attrs[field].append(item)
+                        break
+                    except AttributeError:
+                        continue
+
+        elif hasattr(value, "__dataclass_fields__"):
+            attrs[field] = legacy_dataclass_to_schema(field_type, value)
+        else:
+            attrs[field] = value
+    return schema(**attrs)
+
+
+def _extract_field_type_schema(field_type: Any) -> Any:
+    if isinstance(field_type, UnionType):
+        return field_type.__args__
+    elif hasattr(field_type, "__origin__"):
+        if field_type.__origin__ is list:
+            field_type = field_type.__args__
+            if isinstance(field_type[0], UnionType):
+                field_type = field_type[0].__args__
+            return field_type
+        if field_type.__origin__ is Union:
+            field_type = field_type.__args__
+    return field_type
+
+
+def measure(title: str, func) -> float:
+    # лучший из запусков, чтобы не учитывать паузы сборщика мусора
+    elapsed = min(timeit.repeat(func, number=1, repeat=REPEAT)) * 1000
+    print(f"{title:<40} {elapsed:8.2f} ms")
+    return elapsed
+
+
+def main() -> None:
+    questions = [
+        QuestionEntity(
+            id=i,
+            text=f"Вопрос {i}",
+            published=True,
+            answers=[
+                AnswerEntity(id=i * 4 + j, text=f"Ответ {j}", right=j == 0)
+                for j in range(4)
+            ],
+        )
+        for i in range(QUESTIONS)
+    ]
+
+    expected = [
+        legacy_dataclass_to_schema(QuestionSchema, q) for q in questions
+    ]
+    for trusted in (False, True):
+        assert expected == [
+            dataclass_to_schema(QuestionSchema, q, trusted=trusted)
+            for q in questions
+        ]
+
+    print(f"\n--- {QUESTIONS} вопросов по 4 ответа")
+    legacy = measure(
+        "прежняя реализация",
+        lambda: [
+            legacy_dataclass_to_schema(QuestionSchema, q) for q in questions
+        ],
+    )
+    compiled = measure(
+        "dataclass_to_schema",
+        lambda: [dataclass_to_schema(QuestionSchema, q) for q in questions],
+    )
+    trusted = measure(
+        "dataclass_to_schema(trusted=True)",
+        lambda: [
+            dataclass_to_schema(QuestionSchema, q, trusted=True)
+            for q in questions
+        ],
+    )
+    print(
+        f"ускорение: {legacy / compiled:.1f}x, "
+        f"trusted: {legacy / trusted:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""
+Сравнение to_entity и EntityMapper на выборке ладдера из ROWS строк.
+
+Таблицы создаются в SQLite в памяти, Postgres не нужен.
+Замеряется отдельно преобразование уже полученных строк в Entity
+и полный путь: запрос, загрузка строк и преобразование.
+Запуск из корня проекта:
+PYTHONPATH=src python -m test.benchmark.entity_mapper
+"""
+import time
+from datetime import datetime
+
+from sqlalchemy import (
+    create_engine,
+    insert,
+    select,
+)
+from sqlalchemy.orm import (
+    joinedload,
+    Session,
+)
+
+import apps.quiz.models  # noqa: F401, связи Profile с жалобами
+from apps.users.models import (
+    BestPlayerTitle,
+    Profile,
+    Statistic,
+    User,
+)
+from apps.users.services.storage.sqla.statistics import statistic_mapper
+from core.database.db import Base
+
+
+ROWS = 10_000
+REPEAT = 10
+
+MAPPER = statistic_mapper(Statistic)
+
+
+def fill(session: Session) -> None:
+    now = datetime.now()
+    session.execute(
+        insert(Profile),
+        [
+            dict(id=i, name=f"Игрок-{i}", device_uuid=str(i), last_visit=now)
+            for i in range(1, ROWS + 1)
+        ],
+    )
+    session.execute(
+        insert(Statistic),
+        [
+            dict(
+                id=i,
+                profile_id=i,
+                games=i % 500,
+                score=i * 7 % 20000,
+                place=i,
+                rights=i % 500 * 5,
+                wrongs=i % 500 * 2,
+                trend=0,
+                perfect_rounds=0,
+            )
+            for i in range(1, ROWS + 1)
+        ],
+    )
+    # титул есть у каждого второго профиля
+    session.execute(
+        insert(BestPlayerTitle),
+        [
+            dict(profile_id=i, best_of_the_day=1, best_of_the_month=0)
+            for i in range(1, ROWS + 1, 2)
+        ],
+    )
+    session.commit()
+
+
+def orm_query():
+    return (
+        select(Statistic)
+        .order_by(Statistic.place)
+        .join(Statistic.profile)
+        .outerjoin(Profile.title)
+        .options(joinedload(Statistic.profile).joinedload(Profile.title))
+    )
+
+
+def mapper_query():
+    return (
+        MAPPER.select()
+        .select_from(Statistic)
+        .join(Statistic.profile)
+        .outerjoin(Profile.title)
+        .order_by(Statistic.place)
+    )
+
+
+def measure(title: str, func) -> float:
+    start = time.perf_counter()
+    for _ in range(REPEAT):
+        func()
+    elapsed = (time.perf_counter() - start) / REPEAT * 1000
+    print(f"{title:<40} {elapsed:8.2f} ms")
+    return elapsed
+
+
+def main() -> None:
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(
+        engine,
+        tables=[
+            User.__table__,
+            Profile.__table__,
+            Statistic.__table__,
+            BestPlayerTitle.__table__,
+        ],
+    )
+    with Session(engine) as session:
+        fill(session)
+
+        statistics = session.execute(orm_query()).scalars().all()
+        rows = session.execute(mapper_query()).all()
+        assert [s.to_entity() for s in statistics] == MAPPER.map_all(rows)
+
+        print(f"\n--- преобразование {ROWS} строк")
+        orm = measure("to_entity", lambda: [s.to_entity() for s in statistics])
+        mapper = measure("EntityMapper", lambda: MAPPER.map_all(rows))
+        print(f"ускорение: {orm / mapper:.1f}x")
+
+        def orm_full():
+            session.expunge_all()
+            result = session.execute(orm_query()).scalars().all()
+            return [s.to_entity() for s in result]
+
+        def mapper_full():
+            return MAPPER.map_all(session.execute(mapper_query()).all())
+
+        print(f"\n--- запрос и преобразование {ROWS} строк")
+        orm = measure("select(Statistic) + to_entity", orm_full)
+        mapper = measure("select(колонки) + EntityMapper", mapper_full)
+        print(f"ускорение: {orm / mapper:.1f}x")
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
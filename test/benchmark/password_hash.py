@@ -0,0 +1,83 @@
+"""
+Задержка событийного цикла при одновременных входах админов:
+проверка bcrypt прямо в цикле против PasswordHasher.
+
+Пока идут LOGINS проверок пароля, отдельная корутина каждые TICK
+секунд засыпает и замеряет, насколько позже она проснулась. Эта
+задержка - время, на которое встают все остальные запросы воркера.
+Запуск из корня проекта:
+PYTHONPATH=src python -m test.benchmark.password_hash
+"""
+import time
+import asyncio
+import statistics
+
+from apps.users.services.auth.pwd_hash import (
+    check_password,
+    hash_password,
+    PasswordHasher,
+)
+
+
+LOGINS = 8
+WORKERS = 2
+TICK = 0.005
+PASSWORD = "admin-password"
+
+
+async def sync_login(hashed: str) -> None:
+    # прежний AuthAction.login
+    check_password(PASSWORD, hashed)
+
+
+def pooled_login(hasher: PasswordHasher):
+    async def login(hashed: str) -> None:
+        await hasher.verify(PASSWORD, hashed)
+
+    return login
+
+
+async def measure(title: str, login, hashed: str) -> None:
+    lags = []
+    done = asyncio.Event()
+
+    async def ticker():
+        while not done.is_set():
+            start = time.monotonic()
+            await asyncio.sleep(TICK)
+            lags.append(time.monotonic() - start - TICK)
+
+    tick_task = asyncio.create_task(ticker())
+    await asyncio.sleep(TICK * 2)
+    lags.clear()
+
+    start = time.monotonic()
+    await asyncio.gather(*(login(hashed) for _ in range(LOGINS)))
+    elapsed = time.monotonic() - start
+    done.set()
+    await tick_task
+
+    lags.sort()
+    p99 = lags[min(len(lags) - 1, int(len(lags) * 0.99))]
+    print(
+        f"{title:<28} всего {elapsed * 1000:7.1f} ms, "
+        f"задержка цикла: медиана {statistics.median(lags) * 1000:6.1f} ms, "
+        f"p99 {p99 * 1000:6.1f} ms, max {lags[-1] * 1000:6.1f} ms"
+    )
+
+
+async def main() -> None:
+    hashed = hash_password(PASSWORD)
+    print(f"\n--- {LOGINS} одновременных входов")
+    await measure("bcrypt в событийном цикле", sync_login, hashed)
+
+    hasher = PasswordHasher(workers=WORKERS, queue_size=LOGINS)
+    await measure(
+        f"PasswordHasher({WORKERS} потока)", pooled_login(hasher), hashed
+    )
+    hasher.close()
+    print(f"метрики пула: {hasher.metrics}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,134 @@
+"""
+Сравнение планов и времени запросов ладдера без индексов и с индексами.
+
+Таблица статистики копируется во временную таблицу без индексов
+и заполняется ROWS случайными строками, реальные данные не меняются.
+Запуск из корня проекта:
+PYTHONPATH=src python -m test.benchmark.statistic_indexes
+"""
+import time
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import (
+    AsyncConnection,
+    create_async_engine,
+)
+
+from config import settings
+
+
+ROWS = 1_000_000
+REPEAT = 20
+TABLE = "bench_statistics"
+
+QUERIES = {
+    "get_top_gamers": f"SELECT * FROM {TABLE} ORDER BY place LIMIT 60",
+    "get_user_rank": f"""
+        SELECT rank FROM (
+            SELECT profile_id, row_number() OVER (
+                ORDER BY score DESC, games DESC, profile_id
+            ) AS rank
+            FROM {TABLE}
+        ) AS ranked
+        WHERE profile_id = {ROWS // 2}
+    """,
+    "get_count_positive_score": (
+        f"SELECT count(*) FROM {TABLE} WHERE score >= 0"
+    ),
+    "replace_profiles": (
+        f"SELECT id FROM {TABLE} WHERE place > 1000 AND place <= 1100"
+    ),
+    "ladder_page": f"""
+        SELECT * FROM {TABLE}
+        ORDER BY score DESC, games DESC, profile_id
+        LIMIT 60
+    """,
+    # страница по курсору из середины ладдера, как в _ladder_seek
+    "ladder_seek": f"""
+        SELECT * FROM {TABLE}
+        WHERE score <= 9000 AND (
+            score < 9000
+            OR (score = 9000 AND games < 250)
+            OR (score = 9000 AND games = 250 AND profile_id > {ROWS // 2})
+        )
+        ORDER BY score DESC, games DESC, profile_id
+        LIMIT 60
+    """,
+}
+
+INDEXES = (
+    f"CREATE INDEX ON {TABLE} (place)",
+    f"CREATE INDEX ON {TABLE} (score DESC, games DESC, profile_id)",
+)
+
+
+async def fill(conn: AsyncConnection) -> None:
+    await conn.execute(
+        text(
+            f"CREATE TEMP TABLE {TABLE} "
+            "(LIKE statistics INCLUDING DEFAULTS)"
+        )
+    )
+    await conn.execute(
+        text(
+            f"""
+            INSERT INTO {TABLE}
+                (id, profile_id, games, score, rights, wrongs,
+                 trend, perfect_rounds, place)
+            SELECT i, i, g, s, g * 5, g * 2, 0, 0, 0
+            FROM (
+                SELECT i,
+                       (random() * 500)::int AS g,
+                       (random() * 20000 - 1000)::int AS s
+                FROM generate_series(1, {ROWS}) AS i
+            ) AS data
+            """
+        )
+    )
+    await conn.execute(
+        text(
+            f"""
+            UPDATE {TABLE} SET place = ranked.rank
+            FROM (
+                SELECT id, row_number() OVER (
+                    ORDER BY score DESC, games DESC, profile_id
+                ) AS rank
+                FROM {TABLE}
+            ) AS ranked
+            WHERE {TABLE}.id = ranked.id
+            """
+        )
+    )
+    await conn.execute(text(f"ANALYZE {TABLE}"))
+
+
+async def measure(conn: AsyncConnection, title: str) -> None:
+    print(f"\n{'=' * 30} {title} {'=' * 30}")
+    for name, query in QUERIES.items():
+        result = await conn.execute(text(f"EXPLAIN ANALYZE {query}"))
+        plan = "\n".join(row[0] for row in result)
+
+        start = time.perf_counter()
+        for _ in range(REPEAT):
+            await conn.execute(text(query))
+        elapsed = (time.perf_counter() - start) / REPEAT * 1000
+
+        print(f"\n--- {name}: {elapsed:.2f} ms\n{plan}")
+
+
+async def main() -> None:
+    engine = create_async_engine(settings.database_url)
+    async with engine.connect() as conn:
+        await fill(conn)
+        await measure(conn, "без индексов")
+        for index in INDEXES:
+            await conn.execute(text(index))
+        await conn.execute(text(f"ANALYZE {TABLE}"))
+        await measure(conn, "с индексами")
+        await conn.rollback()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -8,3 +8,6 @@ docker exec -i $DB bash -c "pg_restore -c -Fc -U postgres -d quiz < /tmp/$DUMPFI
 
 echo "Дамп успешно восстановлен в базу данных PostgreSQL."
 
+# ладдеры в Redis строятся по данным БД, сбрасываем их после восстановления
+REDIS=$(docker ps --filter name=redis -q)
+docker exec -i $REDIS redis-cli FLUSHALL;
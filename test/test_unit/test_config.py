@@ -0,0 +1,45 @@
+from pydantic_settings import BaseSettings
+
+from config.base_settings.statistic import RankingMode
+from config.config_builder import ConfigBuilder
+
+
+class Conf(BaseSettings):
+    required_value: int
+    optional_value: int = 1
+    optional_url: str | None = None
+    ranking_mode: RankingMode = RankingMode.ladder
+
+
+def test_defaults(monkeypatch):
+    monkeypatch.setenv("REQUIRED_VALUE", "5")
+    monkeypatch.delenv("OPTIONAL_VALUE", raising=False)
+    monkeypatch.delenv("OPTIONAL_URL", raising=False)
+    monkeypatch.delenv("RANKING_MODE", raising=False)
+    conf = ConfigBuilder.build_from_env(Conf)
+    assert 5 == conf.required_value
+    assert 1 == conf.optional_value
+    assert conf.optional_url is None
+    assert RankingMode.ladder is conf.ranking_mode
+
+
+def test_env_overrides_defaults(monkeypatch):
+    monkeypatch.setenv("REQUIRED_VALUE", "5")
+    monkeypatch.setenv("OPTIONAL_VALUE", "7")
+    monkeypatch.setenv("OPTIONAL_URL", "postgresql://replica/db")
+    monkeypatch.setenv("RANKING_MODE", "shift")
+    conf = ConfigBuilder.build_from_env(Conf)
+    assert 7 == conf.optional_value
+    assert "postgresql://replica/db" == conf.optional_url
+    assert RankingMode.shift is conf.ranking_mode
+
+
+def test_empty_env_is_unset(monkeypatch):
+    monkeypatch.setenv("REQUIRED_VALUE", "5")
+    monkeypatch.setenv("OPTIONAL_VALUE", "")
+    monkeypatch.setenv("OPTIONAL_URL", "")
+    monkeypatch.setenv("RANKING_MODE", "")
+    conf = ConfigBuilder.build_from_env(Conf)
+    assert 1 == conf.optional_value
+    assert conf.optional_url is None
+    assert RankingMode.ladder is conf.ranking_mode
@@ -0,0 +1,90 @@
+import copy
+import types
+from contextlib import asynccontextmanager
+
+import pytest
+
+from config import settings
+from config.base_settings.common import EnvironVariables
+from services.firebase import (
+    change_api_key,
+    check_firebase_apikey,
+)
+from services.firebase.exceptions import (
+    FirebaseInvalidApiKey,
+    FirebaseSetConfigError,
+)
+
+
+CONFIG = {"parameters": {"api_key": {"defaultValue": {"value": "old"}}}}
+
+
+class FakeResponse:
+    def __init__(self, status: int, body: dict | None = None):
+        self.status = status
+        self.body = body
+        self.headers = {"Etag": "etag"}
+
+    async def json(self):
+        return self.body
+
+    async def text(self):
+        return ""
+
+
+class FakeSession:
+    def __init__(self, put_status: int):
+        self.put_status = put_status
+
+    @asynccontextmanager
+    async def get(self, *args, **kwargs):
+        yield FakeResponse(200, copy.deepcopy(CONFIG))
+
+    @asynccontextmanager
+    async def put(self, *args, **kwargs):
+        yield FakeResponse(self.put_status)
+
+
+class FakeRemoteConfig:
+    def __init__(self, put_status: int = 200):
+        self.client = types.SimpleNamespace(session=FakeSession(put_status))
+        self.api_key = "old"
+
+    async def credentials(self):
+        return types.SimpleNamespace(token="token")
+
+    async def check(self, api_key):
+        return api_key == self.api_key
+
+    def update(self, api_key):
+        self.api_key = api_key
+
+
+@pytest.mark.asyncio
+async def test_api_key_checked_in_prod(monkeypatch):
+    monkeypatch.setattr(settings, "environ", EnvironVariables.prod)
+    remote_config = FakeRemoteConfig()
+    await check_firebase_apikey("old", remote_config)
+    with pytest.raises(FirebaseInvalidApiKey):
+        await check_firebase_apikey("wrong", remote_config)
+
+
+@pytest.mark.asyncio
+async def test_api_key_not_checked_outside_prod(monkeypatch):
+    monkeypatch.setattr(settings, "environ", EnvironVariables.test)
+    await check_firebase_apikey("wrong", FakeRemoteConfig())
+
+
+@pytest.mark.asyncio
+async def test_change_api_key():
+    remote_config = FakeRemoteConfig()
+    await change_api_key(remote_config)
+    assert "old" != remote_config.api_key
+
+
+@pytest.mark.asyncio
+async def test_failed_change_keeps_api_key():
+    remote_config = FakeRemoteConfig(put_status=412)
+    with pytest.raises(FirebaseSetConfigError):
+        await change_api_key(remote_config)
+    assert "old" == remote_config.api_key
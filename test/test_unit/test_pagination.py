@@ -0,0 +1,235 @@
+import math
+import types
+import random
+from dataclasses import asdict
+
+import pytest
+from api.mobile.utils import (
+    ladder_cursor_key,
+    ladder_position,
+)
+from api.pagination import (
+    CursorPaginator,
+    decode_cursor,
+    encode_cursor,
+)
+from api.schema import PaginationIn
+
+from sqlalchemy import (
+    create_engine,
+    insert,
+    select,
+)
+from sqlalchemy.orm import Session
+
+import apps.quiz.models  # noqa: F401
+from apps.users.actions import StatisticsActions
+from apps.users.models import (
+    LadderKey,
+    Statistic,
+    StatisticEntity,
+)
+from apps.users.services.storage.sqla.statistics import ORMStatisticService
+from core.constructor.exceptions import InvalidPaginationCursor
+from core.database.db import Base
+
+
+def make_ladder(size: int) -> list[StatisticEntity]:
+    rnd = random.Random(size)
+    statistics = [
+        StatisticEntity(
+            id=pk,
+            games=rnd.randint(0, 3),
+            score=rnd.randint(-2, 3),
+            place=0,
+            rights=0,
+            wrongs=0,
+            trend=0,
+            perfect_rounds=0,
+            profile=types.SimpleNamespace(id=pk),
+        )
+        for pk in range(1, size + 1)
+    ]
+    statistics.sort(key=sort_key)
+    for place, statistic in enumerate(statistics, start=1):
+        statistic.place = place
+    return statistics
+
+
+def sort_key(statistic: StatisticEntity) -> tuple[int, int, int]:
+    return -statistic.score, -statistic.games, statistic.profile.id
+
+
+class MemoryRanking:
+    def __init__(self, ladder: list[StatisticEntity]):
+        self.ladder = ladder
+
+    async def get_top(self, offset, limit):
+        return self.ladder[offset : offset + limit]
+
+    async def get_page(self, key, limit, backward=False, inclusive=False):
+        if key is None:
+            return [] if backward else self.ladder[:limit]
+        position = sum(
+            sort_key(s) < (-key.score, -key.games, key.profile_id)
+            for s in self.ladder
+        )
+        if backward:
+            position += int(inclusive)
+            return self.ladder[max(position - limit, 0) : position]
+        position += int(not inclusive)
+        return self.ladder[position : position + limit]
+
+    async def get_count(self):
+        return len(self.ladder)
+
+
+class MemoryStatistics:
+    def __init__(self, ladder: list[StatisticEntity]):
+        self.statistics = {s.profile.id: s for s in ladder}
+
+    async def get_one(self, profile_id):
+        return self.statistics.get(profile_id)
+
+
+def make_action(ladder: list[StatisticEntity]) -> StatisticsActions:
+    return StatisticsActions(
+        None,
+        MemoryStatistics(ladder),
+        None,
+        MemoryRanking(ladder),
+        None,
+        None,
+    )
+
+
+def test_cursor_round_trip():
+    key = LadderKey(score=10, games=3, profile_id=7)
+    for backward in (False, True):
+        cursor = encode_cursor(asdict(key), backward)
+        assert (key, backward) == decode_cursor(cursor, LadderKey)
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "",
+        "not a cursor",
+        encode_cursor({"score": 1}),
+        encode_cursor({"score": 1, "games": 1, "pk": 1}),
+        encode_cursor({"score": "1", "games": 1, "profile_id": 1}),
+        encode_cursor({"score": 1.5, "games": 1, "profile_id": 1}),
+        encode_cursor({"score": True, "games": 1, "profile_id": 1}),
+        encode_cursor({"score": 2**63, "games": 1, "profile_id": 1}),
+        encode_cursor({"score": None, "games": 1, "profile_id": 1}),
+        encode_cursor([1, 2, 3]),
+        encode_cursor({"score": 1, "games": 1, "profile_id": 1}, "yes"),
+    ],
+)
+def test_invalid_cursor(cursor):
+    with pytest.raises(InvalidPaginationCursor):
+        decode_cursor(cursor, LadderKey)
+
+
+@pytest.mark.asyncio
+async def test_cursor_pages_cover_ladder():
+    ladder = make_ladder(23)
+    action = make_action(ladder)
+    paginator = CursorPaginator(
+        pagination=PaginationIn(limit=5),
+        action=action,
+        cursor_key=ladder_cursor_key,
+        position=ladder_position,
+    )
+    first_page = paginator.paginate(action.get_top_ladder)
+    next_page = paginator.paginate(action.get_ladder_page)
+
+    result = await first_page(offset=0, limit=5)
+    assert result.paginator.previous is None
+    pages = [result]
+    while result.paginator.next is not None:
+        key, backward = decode_cursor(result.paginator.next, LadderKey)
+        assert not backward
+        result = await next_page(key, 5, backward)
+        pages.append(result)
+
+    seen = [s for page in pages for s in page.items]
+    assert ladder == seen
+    assert [0, 5, 10, 15, 20] == [page.paginator.offset for page in pages]
+    assert all(page.paginator.total == len(ladder) for page in pages)
+
+    # назад от последней страницы возвращаются те же страницы
+    for page in reversed(pages[1:]):
+        key, backward = decode_cursor(page.paginator.previous, LadderKey)
+        assert backward
+        previous = await next_page(key, 5, backward)
+        assert pages[pages.index(page) - 1].items == previous.items
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [1, 2, 5, 6, 60])
+async def test_ladder_around_split(limit):
+    ladder = make_ladder(40)
+    action = make_action(ladder)
+    for statistic in ladder:
+        page = await action.get_ladder_around(statistic.profile.id, limit)
+        # прежний расчет offset, при котором игрок в середине страницы
+        rank = statistic.place
+        half = math.ceil(limit / 2)
+        offset = 0 if half > rank else rank - half
+        assert ladder[offset : offset + limit] == page
+
+
+@pytest.mark.asyncio
+async def test_ladder_around_without_statistic():
+    ladder = make_ladder(10)
+    action = make_action(ladder)
+    assert ladder[:4] == await action.get_ladder_around(100, 4)
+
+
+def test_ladder_seek():
+    ladder = make_ladder(60)
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine, tables=[Statistic.__table__])
+    repository = ORMStatisticService(None, Statistic)
+    with Session(engine) as session:
+        session.execute(
+            insert(Statistic),
+            [
+                dict(
+                    id=s.id,
+                    profile_id=s.profile.id,
+                    games=s.games,
+                    score=s.score,
+                    place=s.place,
+                    rights=0,
+                    wrongs=0,
+                    trend=0,
+                    perfect_rounds=0,
+                )
+                for s in ladder
+            ],
+        )
+        ordered = [s.profile.id for s in ladder]
+        for statistic in ladder:
+            key = LadderKey(
+                statistic.score, statistic.games, statistic.profile.id
+            )
+            index = ordered.index(statistic.profile.id)
+            expected = {
+                (False, False): ordered[index + 1 :],
+                (False, True): ordered[index:],
+                (True, False): ordered[:index],
+                (True, True): ordered[: index + 1],
+            }
+            for (backward, inclusive), ids in expected.items():
+                query = (
+                    select(Statistic.profile_id)
+                    .where(repository._ladder_seek(key, backward, inclusive))
+                    .order_by(
+                        Statistic.score.desc(),
+                        Statistic.games.desc(),
+                        Statistic.profile_id,
+                    )
+                )
+                assert ids == list(session.scalars(query))
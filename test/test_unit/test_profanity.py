@@ -0,0 +1,126 @@
+from pathlib import Path
+
+import pytest
+
+import services.profanity
+from services.profanity import LocalProfanityFilter
+from services.profanity.normalize import (
+    latin_words,
+    normalize,
+)
+
+
+WORDS_FILE = str(Path(services.profanity.__file__).parent / "words.txt")
+
+NAMES = [
+    "Иван",
+    "Никита",
+    "Даниил",
+    "Антонина",
+    "Анна",
+    "Алла",
+    "Михаил",
+    "Сергей",
+    "Евгений",
+    "Евлампий",
+    "Глеб",
+    "Себастьян",
+    "Ибрагим",
+    "Хасан",
+    "Шерхан",
+    "Ерлан",
+    "Игрок-17",
+    "Bashir",
+    "Hitchcock",
+    "Nicholas",
+    "Nikita",
+    "Dmitriy",
+    "Huy",
+    "Hui",
+    "Huynh",
+    "Asuka",
+    "Sukanya",
+    "Yoshito",
+    "Matsushita",
+    "Shital",
+    "Dickens",
+    "Hancock",
+    "Nigel",
+    "Sebastian",
+    "Cassandra",
+    "Scunthorpe",
+    "Xavier",
+    "Hermes",
+    "Kherson",
+    "Max_2007",
+    "SuperNick",
+]
+
+PROFANE = [
+    "хуй",
+    "Х у й",
+    "xyй",
+    "XУЙ",
+    "пиздец",
+    "п1зд@",
+    "заебал",
+    "Сука",
+    "cyka",
+    "fuck",
+    "F.U.C.K",
+    "fuuuck",
+    "Fucking",
+    "SuperFuck",
+    "fuсk",
+    "shit",
+    "bitches",
+    "pizdec",
+    "blya",
+]
+
+
+@pytest.fixture
+def profanity() -> LocalProfanityFilter:
+    return LocalProfanityFilter(words_file=WORDS_FILE, reload_interval=60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", NAMES)
+async def test_name_is_not_profane(profanity, name):
+    assert not await profanity.is_profane(name)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("name", PROFANE)
+async def test_name_is_profane(profanity, name):
+    assert await profanity.is_profane(name)
+
+
+def test_normalize():
+    assert "хуи" == normalize("X.y.Й")
+    assert "ана" == normalize("Анна")
+
+
+def test_latin_words():
+    assert ["super", "fuck"] == latin_words("SuperFuck")
+    assert ["fuck", "you"] == latin_words("f u c k  you")
+    assert ["shit"] == latin_words("5h1t")
+
+
+@pytest.mark.asyncio
+async def test_reload_and_fallback(tmp_path):
+    class Fallback:
+        async def is_profane(self, text):
+            return True
+
+    words_file = tmp_path / "words.txt"
+    profanity = LocalProfanityFilter(
+        words_file=str(words_file), reload_interval=0, fallback=Fallback()
+    )
+    assert await profanity.is_profane("Иван")
+    assert not profanity.loaded
+
+    words_file.write_text("# словарь\nиван\n", encoding="utf-8")
+    assert await profanity.is_profane("Иван")
+    assert profanity.loaded
+    assert not await profanity.is_profane("Никита")
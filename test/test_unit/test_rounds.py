@@ -0,0 +1,85 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from apps.users.actions import CompositeStatisticAction
+from apps.users.exceptions.profile import DoesNotExistsProfile
+from apps.users.exceptions.statistics import StatisticIntegrityError
+from apps.users.services.rounds.memory import MemoryRoundQueue
+
+
+class FakeTransaction:
+    @asynccontextmanager
+    async def begin(self):
+        yield
+
+
+class FakeProfiles:
+    def __init__(self, *profile_ids: int):
+        self.profile_ids = set(profile_ids)
+
+    async def exists(self, id):
+        return id in self.profile_ids
+
+
+class FakeStatistics:
+    """Записывает раунды, профиль deleted нарушает внешний ключ."""
+
+    def __init__(self, deleted: int | None = None, error: bool = False):
+        self.deleted = deleted
+        self.error = error
+        self.saved = {}
+
+    async def apply_rounds(self, rounds):
+        if self.error:
+            raise ConnectionError
+        if self.deleted in rounds:
+            raise StatisticIntegrityError()
+        for profile_id, r in rounds.items():
+            self.saved[profile_id] = self.saved.get(profile_id, 0) + r.games
+
+
+def make_action(statistics: FakeStatistics, *profile_ids: int):
+    return CompositeStatisticAction(
+        actions=[statistics],
+        transaction=FakeTransaction(),
+        queue=MemoryRoundQueue(),
+        profile_repository=FakeProfiles(*profile_ids),
+        write_behind=True,
+    )
+
+
+@pytest.mark.asyncio
+async def test_record_checks_profile():
+    action = make_action(FakeStatistics(), 1)
+    await action.record(1, 10, 5, 0, True)
+    with pytest.raises(DoesNotExistsProfile):
+        await action.record(2, 10, 5, 0, True)
+    assert await action.queue.get(2) is None
+
+
+@pytest.mark.asyncio
+async def test_failing_profile_does_not_block_flush():
+    statistics = FakeStatistics(deleted=2)
+    action = make_action(statistics, 1, 2, 3)
+    for profile_id in (1, 2, 3):
+        await action.record(profile_id, 10, 5, 0, True)
+
+    assert 3 == await action.flush(10)
+    assert {1: 1, 3: 1} == statistics.saved
+    # раунды удаленного профиля отброшены, очередь пуста
+    assert 0 == await action.flush(10)
+
+
+@pytest.mark.asyncio
+async def test_unavailable_database_requeues_batch():
+    statistics = FakeStatistics(error=True)
+    action = make_action(statistics, 1, 2)
+    for profile_id in (1, 2):
+        await action.record(profile_id, 10, 5, 0, True)
+
+    with pytest.raises(ConnectionError):
+        await action.flush(10)
+    statistics.error = False
+    assert 2 == await action.flush(10)
+    assert {1: 1, 2: 1} == statistics.saved
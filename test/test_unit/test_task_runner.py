@@ -0,0 +1,44 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from config.containers import get_container
+from core.database.db import Database
+from services.tasks.runner import AsyncTaskRunner
+
+
+@pytest.fixture
+def runner(monkeypatch):
+    async def close():
+        pass
+
+    monkeypatch.setattr(AsyncTaskRunner, "_close", staticmethod(close))
+    runner = AsyncTaskRunner()
+    yield runner
+    runner.stop()
+
+
+async def task(number: int) -> tuple[int, asyncio.AbstractEventLoop, Database]:
+    database = get_container().resolve(Database)
+    await asyncio.sleep(0.01)
+    # внутри одной задачи зависимости со scope request общие
+    assert database is get_container().resolve(Database)
+    return number, asyncio.get_running_loop(), database
+
+
+def test_tasks_from_threads_share_loop(runner):
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        results = list(pool.map(lambda n: runner.run(task(n)), range(8)))
+
+    assert list(range(8)) == [number for number, _, _ in results]
+    assert 1 == len({loop for _, loop, _ in results})
+    assert 8 == len({id(database) for _, _, database in results})
+
+
+def test_stop_and_restart(runner):
+    _, first_loop, _ = runner.run(task(1))
+    runner.stop()
+    assert first_loop.is_closed()
+    _, second_loop, _ = runner.run(task(2))
+    assert first_loop is not second_loop
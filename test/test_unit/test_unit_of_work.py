@@ -0,0 +1,123 @@
+from contextlib import asynccontextmanager
+
+import pytest
+
+from core.database.db import (
+    Database,
+    DatabaseMetrics,
+    measure_database,
+    Transaction,
+    unit_of_work,
+)
+
+
+class FakeSession:
+    """Сессия, которая сообщает метрикам о тех же событиях, что движок."""
+
+    def __init__(self, metrics: DatabaseMetrics):
+        self.metrics = metrics
+        self.metrics._on_checkout()
+        self.flushes = 0
+
+    async def flush(self):
+        self.flushes += 1
+
+    async def commit(self):
+        self.metrics._on_commit()
+
+    async def rollback(self):
+        self.metrics._on_rollback()
+
+    async def close(self):
+        pass
+
+    @asynccontextmanager
+    async def begin_nested(self):
+        yield
+
+
+class FakeConnection:
+    def __init__(self):
+        self.metrics = DatabaseMetrics()
+
+    def get_session(self):
+        return lambda: FakeSession(self.metrics)
+
+    def get_ro_session(self):
+        return lambda: FakeSession(self.metrics)
+
+    async def open_ro_session(self):
+        session = FakeSession(self.metrics)
+        session.replica = True
+        return session
+
+
+async def handle_request(database: Database, events: list[str]) -> None:
+    transaction = Transaction(database)
+    async with database.get_session():
+        events.append("write")
+    async with database.get_ro_session():
+        events.append("read")
+    async with transaction.begin():
+        async with database.get_session():
+            events.append("savepoint write")
+
+        async def after_commit():
+            events.append("after commit")
+
+        await transaction.on_commit(after_commit)
+    async with database.get_session():
+        events.append("write")
+
+
+@pytest.mark.asyncio
+async def test_one_checkout_and_commit_per_request():
+    connection = FakeConnection()
+    events = []
+    with measure_database() as metrics:
+        async with unit_of_work(connection):
+            await handle_request(Database(connection), events)
+            assert "after commit" not in events
+            assert 0 == metrics.commits
+    assert 1 == metrics.checkouts
+    assert 1 == metrics.commits
+    assert 0 == metrics.rollbacks
+    assert "after commit" == events[-1]
+    assert metrics == connection.metrics
+
+
+@pytest.mark.asyncio
+async def test_rollback_drops_after_commit():
+    connection = FakeConnection()
+    events = []
+    with measure_database() as metrics:
+        with pytest.raises(RuntimeError):
+            async with unit_of_work(connection):
+                await handle_request(Database(connection), events)
+                raise RuntimeError
+    assert 1 == metrics.checkouts
+    assert 0 == metrics.commits
+    assert 1 == metrics.rollbacks
+    assert "after commit" not in events
+
+
+@pytest.mark.asyncio
+async def test_metrics_are_scoped():
+    connection = FakeConnection()
+    for _ in range(2):
+        with measure_database() as metrics:
+            async with unit_of_work(connection):
+                await handle_request(Database(connection), [])
+        assert 1 == metrics.commits
+    assert 2 == connection.metrics.commits
+
+
+@pytest.mark.asyncio
+async def test_read_after_write_uses_primary():
+    database = Database(FakeConnection())
+    async with database.get_ro_session() as session:
+        assert getattr(session, "replica", False)
+    async with database.get_session():
+        pass
+    async with database.get_ro_session() as session:
+        assert not getattr(session, "replica", False)